@@ -1,9 +1,4 @@
-from adventofcode2023.days import Day9
-
-def main() -> None:
-
-    day = Day9()
-    print(day.solve_part_one())
+from adventofcode2023.main import main
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,176 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Self
+
+from adventofcode2023.day import DEFAULT_ENGINE
+from adventofcode2023.days import get_day
+
+DEFAULT_BASELINE = Path(__file__).parent.joinpath('tests', 'static', 'bench_baseline.json')
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """A part of a day solved on either the real puzzle input, or on a
+    generated input of the given scale and variant, with one of the engines
+    of the part."""
+    day: int
+    part: int
+    scale: Optional[float] = None
+    variant: Optional[str] = None
+    engine: str = DEFAULT_ENGINE
+
+    @property
+    def name(self) -> str:
+        input_name = 'real' if self.scale is None else f"x{self.scale:g}"
+        if self.variant is not None:
+            input_name += f"-{self.variant}"
+        if self.engine != DEFAULT_ENGINE:
+            input_name += f"-{self.engine}"
+        return f"day{self.day}-part{self.part}-{input_name}"
+
+    def puzzle_input(self) -> Optional[str]:
+        if self.scale is None:
+            return None
+
+        from adventofcode2023.generators import generate
+
+        return generate(self.day, self.scale, variant=self.variant)
+
+
+# Parts fast enough to time a couple of times on every change. Parts that take
+# seconds, are unimplemented or do not finish on their real input are left out.
+DEFAULT_CASES: tuple[BenchCase, ...] = (
+    *(BenchCase(day, part) for day in (1, 2, 5, 7, 9, 11) for part in (1, 2)),
+    *(BenchCase(day, 1) for day in (3, 8, 10, 13, 15, 19)),
+    *(BenchCase(day, part, scale=2) for day in (1, 5, 7, 9) for part in (1, 2)),
+    BenchCase(19, 1, scale=2),
+    # the reverse search against propagating the seed ranges forward, on
+    # almanacs that fragment the ranges at every layer
+    *(
+        BenchCase(5, 2, scale=1, variant='adversarial', engine=engine)
+        for engine in (DEFAULT_ENGINE, 'reverse', 'layered')
+    ),
+)
+
+
+@dataclass
+class Baseline:
+    """Median wall times of bench cases. A case regresses when its median
+    exceeds both `tolerance` times its baseline and its baseline plus
+    `min_slack` seconds. The slack keeps the fastest cases, whose timings are
+    dominated by noise, from failing on a scheduler hiccup."""
+    medians: dict[BenchCase, float] = field(default_factory=dict)
+    tolerance: float = 1.5
+    min_slack: float = 0.002
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_BASELINE) -> Self:
+        data = json.loads(path.read_text())
+        return cls(
+            medians={
+                BenchCase(
+                    c['day'], c['part'], c['scale'], c.get('variant'), c.get('engine', DEFAULT_ENGINE)
+                ): c['median']
+                for c in data['cases']
+            },
+            tolerance=data['tolerance'],
+            min_slack=data['min_slack'],
+        )
+
+    def save(self, path: Path = DEFAULT_BASELINE) -> None:
+        path.write_text(json.dumps({
+            'tolerance': self.tolerance,
+            'min_slack': self.min_slack,
+            'cases': [
+                {
+                    'day': c.day, 'part': c.part, 'scale': c.scale, 'variant': c.variant, 'engine': c.engine,
+                    'median': median
+                }
+                for c, median in self.medians.items()
+            ],
+        }, indent=2) + '\n')
+
+    def limit(self, case: BenchCase) -> float:
+        median = self.medians[case]
+        return max(median * self.tolerance, median + self.min_slack)
+
+
+def measure(case: BenchCase, repeat: int = 5, warmup: int = 1) -> float:
+    """Median wall time of loading, parsing and solving a bench case. The
+    generated input is built once, outside of the timed runs.
+
+    Args:
+        case (BenchCase): part and input to time
+        repeat (int): amount of timed runs
+        warmup (int): amount of untimed runs before the timed runs
+
+    Returns:
+        float: median wall time in seconds
+    """
+    from statistics import median
+
+    from adventofcode2023.runner import run_part
+
+    day_cls = get_day(case.day)
+    puzzle_input = case.puzzle_input()
+    totals: list[float] = []
+    for i in range(warmup + repeat):
+        _, run = run_part(day_cls, case.part, puzzle_input, engine=case.engine)
+        if i >= warmup:
+            totals.append(run.total)
+
+    return median(totals)
+
+
+def record(
+    cases: Iterable[BenchCase] = DEFAULT_CASES,
+    repeat: int = 5,
+    warmup: int = 1,
+    tolerance: float = 1.5,
+    min_slack: float = 0.002,
+    rounds: int = 1
+) -> Baseline:
+    """Measure the baseline of bench cases, see `measure`. Every round times
+    every case once, and a case's baseline is its median over the rounds,
+    so a machine that is faster or slower for a while does not skew the
+    baseline of the cases timed meanwhile.
+
+    Args:
+        cases (Iterable[BenchCase]): cases to measure
+        repeat (int): amount of timed runs per case per round
+        warmup (int): amount of untimed runs per case per round
+        tolerance (float): see `Baseline`
+        min_slack (float): see `Baseline`
+        rounds (int): amount of times every case is measured
+
+    Returns:
+        Baseline: median wall time of every case
+    """
+    from statistics import median
+
+    cases = list(cases)
+    medians: dict[BenchCase, list[float]] = { case: [] for case in cases }
+    for _ in range(rounds):
+        for case in cases:
+            medians[case].append(measure(case, repeat, warmup))
+
+    return Baseline(
+        { case: median(times) for case, times in medians.items() },
+        tolerance,
+        min_slack
+    )
+
+
+def settings_from_env() -> tuple[int, int, Optional[float]]:
+    """Repeats, warmup runs and tolerance of the bench suite, which can be
+    overridden through `AOC_BENCH_REPEAT`, `AOC_BENCH_WARMUP` and
+    `AOC_BENCH_TOLERANCE`. A tolerance of None means the one stored in the
+    baseline is used."""
+    tolerance = os.environ.get('AOC_BENCH_TOLERANCE')
+    return (
+        int(os.environ.get('AOC_BENCH_REPEAT', 5)),
+        int(os.environ.get('AOC_BENCH_WARMUP', 1)),
+        float(tolerance) if tolerance is not None else None,
+    )
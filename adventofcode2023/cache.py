@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+from numbers import Integral
+from pathlib import Path
+from typing import Iterable, Optional
+
+from adventofcode2023.day import Day, Result
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home().joinpath('.cache')
+    return Path(base).joinpath('adventofcode2023')
+
+
+PACKAGE = 'adventofcode2023'
+
+
+def _read_source(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def dependencies(module: str) -> dict[str, Path]:
+    """The source files of a module of the package and of every module of the
+    package it imports, directly or through other modules. Imports inside of
+    functions count as well, as solvers import modules where they use them.
+
+    Args:
+        module (str): name of the module, such as adventofcode2023.days.day5
+
+    Returns:
+        dict[str, Path]: source file by module name
+    """
+    import ast
+    from importlib.util import find_spec
+
+    found: dict[str, Path] = {}
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        try:
+            spec = find_spec(name)
+        except ModuleNotFoundError:
+            # a name imported from a module rather than a module
+            continue
+        if spec is None or spec.origin is None or not spec.origin.endswith('.py'):
+            continue
+        found[name] = path = Path(spec.origin)
+
+        for node in ast.walk(ast.parse(_read_source(path))):
+            if isinstance(node, ast.Import):
+                imported = [ alias.name for alias in node.names ]
+            elif isinstance(node, ast.ImportFrom) and node.module is not None and node.level == 0:
+                # `from package import module` imports a module, not a name
+                imported = [node.module, *( f"{node.module}.{alias.name}" for alias in node.names )]
+            else:
+                continue
+            pending.extend( i for i in imported if i == PACKAGE or i.startswith(f"{PACKAGE}.") )
+
+    return found
+
+
+class ResultCache:
+    """On-disk cache of solutions. An entry is addressed by the day, the part,
+    the SHA-256 of the puzzle input and the SHA-256 of the source of the module
+    implementing the day and of every module of the package it imports, see
+    `dependencies`, so changing either the input or the solver, including
+    shared modules such as `intervals`, results in a miss. Every entry is a
+    small JSON file; when the total size of the cache exceeds `max_bytes` the
+    least recently used entries are removed. Reading an entry updates its
+    modification time, which is used as the time of last use.
+    """
+
+    _code_versions: dict[type[Day], str] = {}
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 16 * 2**20) -> None:
+        self._directory = directory if directory is not None else default_cache_dir()
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @classmethod
+    def code_version(cls, day_cls: type[Day]) -> str:
+        if day_cls not in cls._code_versions:
+            sha = hashlib.sha256()
+            for name, path in sorted(dependencies(day_cls.__module__).items()):
+                sha.update(name.encode())
+                sha.update(_read_source(path))
+            cls._code_versions[day_cls] = sha.hexdigest()
+
+        return cls._code_versions[day_cls]
+
+    def key(self, day: Day, part: int) -> str:
+        input_hash = hashlib.sha256(day._input.view()).hexdigest()
+        code_version = self.code_version(type(day))
+        return hashlib.sha256(f"{day.day}:{part}:{input_hash}:{code_version}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory.joinpath(f"{key}.json")
+
+    def _entries(self) -> list[Path]:
+        if not self._directory.is_dir():
+            return []
+        return list(self._directory.glob('*.json'))
+
+    def get(self, day: Day, part: int) -> Optional[Result]:
+        """Look up the solution of a part.
+
+        Args:
+            day (Day): day holding the puzzle input
+            part (int): part of the day
+
+        Returns:
+            Optional[Result]: the cached solution or None on a miss
+        """
+        path = self._path(self.key(day, part))
+        try:
+            entry = json.loads(path.read_text())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return entry['result']
+
+    def put(self, day: Day, part: int, result: Result) -> None:
+        """Store the solution of a part. Unimplemented parts that return None
+        are not stored.
+
+        Args:
+            day (Day): day holding the puzzle input
+            part (int): part of the day
+            result (Result): solution of the part
+        """
+        if result is None:
+            return
+
+        # numpy scalars are not JSON serializable
+        if isinstance(result, Integral):
+            result = int(result)
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(self.key(day, part))
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({ 'day': day.day, 'part': part, 'result': result }))
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        stats = []
+        for path in self._entries():
+            try:
+                stats.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+
+        total = sum(stat.st_size for _, stat in stats)
+        for path, stat in sorted(stats, key=lambda x: x[1].st_mtime):
+            if total <= self._max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self, days: Optional[Iterable[int]] = None) -> int:
+        """Remove the entries of the given days, or all entries.
+
+        Args:
+            days (Optional[Iterable[int]]): days to invalidate, defaults to all days
+
+        Returns:
+            int: amount of entries removed
+        """
+        days = set(days) if days else None
+        removed = 0
+        for path in self._entries():
+            if days is not None:
+                try:
+                    if json.loads(path.read_text())['day'] not in days:
+                        continue
+                except (OSError, ValueError):
+                    pass
+
+            path.unlink(missing_ok=True)
+            removed += 1
+
+        return removed
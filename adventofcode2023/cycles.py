@@ -0,0 +1,208 @@
+from typing import Callable, Hashable, NamedTuple, Optional, Sequence, TypeVar
+
+# Deterministic simulations that run for a huge amount of steps end up
+# repeating a state, after which every later state is known. A simulation is
+# given as an initial state and a step function computing the next state.
+# States are compared through a key, which should be a cheap and compact
+# snapshot of a state, such as a tuple of ints or the bytes of a grid. Without
+# a key the states themselves have to be hashable.
+#
+# Only the keys are remembered, never the states, so a step function may also
+# update a state in place and return it, as long as its key is a snapshot.
+
+S = TypeVar('S')
+
+Key = Callable[[S], Hashable]
+
+
+class Cycle(NamedTuple):
+    """The state after `start` steps repeats every `length` steps."""
+    start: int
+    length: int
+
+    def reduce(self, n: int) -> int:
+        """The first step with the same state as step n."""
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+    def total(self, values: Sequence[int], n: int) -> int:
+        """Sum of a value over the first n steps, given the value of every
+        step up to and including the first time round the cycle.
+
+        Args:
+            values (Sequence[int]): value of at least the first `start + length` steps
+            n (int): amount of steps
+
+        Returns:
+            int: sum of the values of steps 0 to n - 1
+        """
+        if n <= self.start + self.length:
+            return sum(values[:n])
+
+        cycles, remaining = divmod(n - self.start, self.length)
+        return (
+            sum(values[:self.start]) +
+            cycles * sum(values[self.start:self.start + self.length]) +
+            sum(values[self.start:self.start + remaining])
+        )
+
+
+def _identity(state: S) -> Hashable:
+    return state
+
+
+def _walk(
+    initial: S,
+    step: Callable[[S], S],
+    key: Optional[Key[S]],
+    max_steps: Optional[int]
+) -> tuple[Optional[Cycle], S, int]:
+    key = key or _identity
+    state = initial
+    seen = { key(state): 0 }
+    steps = 0
+    while max_steps is None or steps < max_steps:
+        state = step(state)
+        steps += 1
+
+        k = key(state)
+        if (start := seen.get(k)) is not None:
+            return Cycle(start, steps - start), state, steps
+        seen[k] = steps
+
+    return None, state, steps
+
+
+def detect_cycle(
+    initial: S,
+    step: Callable[[S], S],
+    key: Optional[Key[S]] = None,
+    max_steps: Optional[int] = None
+) -> Optional[Cycle]:
+    """Find the first repeated state by remembering the key of every state.
+
+    Args:
+        initial (S): state at step 0
+        step (Callable[[S], S]): computes the next state
+        key (Optional[Key[S]]): snapshot of a state to compare states on
+        max_steps (Optional[int]): amount of steps to give up after
+
+    Returns:
+        Optional[Cycle]: the cycle, None if no state repeated within `max_steps`
+    """
+    cycle, _, _ = _walk(initial, step, key, max_steps)
+    return cycle
+
+
+def brent(
+    initial: S,
+    step: Callable[[S], S],
+    key: Optional[Key[S]] = None,
+    max_steps: Optional[int] = None
+) -> Optional[Cycle]:
+    """Find the cycle with Brent's algorithm, which only keeps two states in
+    memory at the cost of stepping about three times as often as
+    `detect_cycle`. The simulation is started over from the initial state, so
+    the step function must not change states in place.
+
+    Args:
+        initial (S): state at step 0
+        step (Callable[[S], S]): computes the next state
+        key (Optional[Key[S]]): snapshot of a state to compare states on
+        max_steps (Optional[int]): amount of steps to give up after
+
+    Returns:
+        Optional[Cycle]: the cycle, None if no state repeated within `max_steps`
+    """
+    key = key or _identity
+
+    # find the length by moving the tortoise to the hare at every power of two
+    power = length = 1
+    tortoise, hare = key(initial), step(initial)
+    steps = 1
+    while tortoise != key(hare):
+        if max_steps is not None and steps >= max_steps:
+            return None
+        if power == length:
+            tortoise = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        steps += 1
+
+    # with the hare `length` steps ahead, both meet at the start of the cycle
+    tortoise, hare = initial, initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    return Cycle(start, length)
+
+
+def state_after(
+    initial: S,
+    step: Callable[[S], S],
+    n: int,
+    key: Optional[Key[S]] = None
+) -> S:
+    """The state after n steps, skipping every full time round a cycle.
+
+    Args:
+        initial (S): state at step 0
+        step (Callable[[S], S]): computes the next state
+        n (int): amount of steps
+        key (Optional[Key[S]]): snapshot of a state to compare states on
+
+    Returns:
+        S: state at step n
+    """
+    cycle, state, steps = _walk(initial, step, key, n)
+    if cycle is not None:
+        for _ in range((n - steps) % cycle.length):
+            state = step(state)
+    return state
+
+
+def first_step(
+    initial: S,
+    step: Callable[[S], S],
+    predicate: Callable[[S], bool],
+    key: Optional[Key[S]] = None,
+    max_steps: Optional[int] = None
+) -> Optional[int]:
+    """The first step at which the predicate holds. Once a state repeats
+    every reachable state has been seen, so a predicate that held for none of
+    them never holds.
+
+    Args:
+        initial (S): state at step 0
+        step (Callable[[S], S]): computes the next state
+        predicate (Callable[[S], bool]): whether a state is the one looked for
+        key (Optional[Key[S]]): snapshot of a state to compare states on
+        max_steps (Optional[int]): amount of steps to give up after
+
+    Returns:
+        Optional[int]: the step, None if the predicate never holds
+    """
+    key = key or _identity
+    state = initial
+    seen = set()
+    steps = 0
+    while max_steps is None or steps <= max_steps:
+        if predicate(state):
+            return steps
+
+        k = key(state)
+        if k in seen:
+            return None
+        seen.add(k)
+
+        state = step(state)
+        steps += 1
+
+    return None
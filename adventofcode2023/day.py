@@ -1,24 +1,319 @@
 from abc import ABC, abstractmethod
-from importlib import resources
+from itertools import batched
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, ClassVar, Iterable, Iterator, Optional
+
+from adventofcode2023.instrumentation import NULL_INSTRUMENTATION, AnyInstrumentation
+from adventofcode2023.puzzle_input import PuzzleInput
+from adventofcode2023.streams import DEFAULT_CHUNK_SIZE, records
+
+if TYPE_CHECKING:
+    from adventofcode2023.incremental import IncrementalSolver
 
 type Result = int | str
 
+# the solver a day uses unless another engine is asked for
+DEFAULT_ENGINE = 'default'
+# the engine every other engine of a part is checked against, see `differential`
+REFERENCE_ENGINE = 'reference'
+
+_NOT_PARSED = object()
+
+
+def engine[F: Callable[..., Result]](part: int, name: str, max_scale: Optional[float] = None) -> Callable[[F], F]:
+    """Register a method of a day as an alternative solver of a part, which
+    `Day.solve` runs when asked for it by name.
+
+    Args:
+        part (int): part the method solves
+        name (str): name of the engine
+        max_scale (Optional[float]): largest generated input the engine is
+            fast enough for, relative to a real puzzle input, such as for a
+            brute force reference. None if it solves inputs of any size.
+
+    Returns:
+        Callable[[F], F]: decorator registering the method
+    """
+    def register(method: F) -> F:
+        method._engine = (part, name, max_scale)  # type: ignore[attr-defined]
+        return method
+
+    return register
+
 
 class Day(ABC):
-    def __init__(self, puzzle_input: Optional[str] = None) -> None:
+    _instrumentation: AnyInstrumentation = NULL_INSTRUMENTATION
+    # parts that `_solve_many` solves for many inputs at once, see `solve_batch`
+    _vectorized_parts: ClassVar[tuple[int, ...]] = ()
+    # solvers registered with `engine`, by part and name
+    _engines: ClassVar[dict[int, dict[str, Callable[['Day'], Result]]]] = {}
+    # largest scale of the engines registered with a `max_scale`, by part and name
+    _engine_max_scales: ClassVar[dict[int, dict[str, float]]] = {}
+    # bytes separating the records of the input when solving from a stream
+    _record_separator: ClassVar[bytes] = b'\n'
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        engines = { part: dict(named) for part, named in cls._engines.items() }
+        max_scales = { part: dict(named) for part, named in cls._engine_max_scales.items() }
+        for attr in vars(cls).values():
+            if (registered := getattr(attr, '_engine', None)) is not None:
+                part, name, max_scale = registered
+                engines.setdefault(part, {})[name] = attr
+                if max_scale is not None:
+                    max_scales.setdefault(part, {})[name] = max_scale
+                else:
+                    max_scales.get(part, {}).pop(name, None)
+        cls._engines = engines
+        cls._engine_max_scales = max_scales
+
+    def __init__(self, puzzle_input: Optional[str | PuzzleInput] = None) -> None:
         super().__init__()
         if puzzle_input is None:
             puzzle_input = self._get_puzzle_input(self.day)
+        elif isinstance(puzzle_input, str):
+            puzzle_input = PuzzleInput.from_string(puzzle_input)
+
+        self._input = puzzle_input
+        self._parsed: Any = _NOT_PARSED
 
-        self._puzzle_input = puzzle_input
+    @property
+    def _puzzle_input(self) -> str:
+        """The puzzle input as a string, decoded on first use. Days that only
+        need to walk over the lines should use `self._input.lines()` instead,
+        which does not hold a copy of the whole input."""
+        return self._input.text()
 
     @property
     @abstractmethod
     def day(self) -> int:
         pass
 
+    def parse(self) -> Any:
+        """Parse the puzzle input into the model used by both parts. The model
+        is built by `_parse` on the first call and shared by every later call,
+        so solving both parts of a day parses its input only once. Parts must
+        not mutate the model.
+
+        Returns:
+            Any: the parsed puzzle input
+        """
+        if self._parsed is _NOT_PARSED:
+            with self._instrumentation.phase(self.day, 'parse'):
+                self._parsed = self._parse()
+        return self._parsed
+
+    def _parse(self) -> Any:
+        """Method to be overridden by day classes that share a parsed model
+        between both parts. Defaults to the puzzle input as a string.
+
+        Returns:
+            Any: the parsed puzzle input
+        """
+        return self._puzzle_input
+
+    def instrument(self, instrumentation: AnyInstrumentation) -> None:
+        """Time the phases of this day and collect the counters bumped by its
+        solvers with `self._instrumentation.count`.
+
+        Args:
+            instrumentation (AnyInstrumentation): instrumentation to report to
+        """
+        self._instrumentation = instrumentation
+
+    @classmethod
+    def engines(cls, part: int, scale: Optional[float] = None) -> list[str]:
+        """Names of the engines that solve a part, starting with the default.
+        Given the scale of a generated input, engines that are too slow for
+        it are left out, see `engine`."""
+        max_scales = cls._engine_max_scales.get(part, {})
+        return [DEFAULT_ENGINE, *(
+            name for name in cls._engines.get(part, {})
+            if scale is None or scale <= max_scales.get(name, scale)
+        )]
+
+    def solve(self, part: int, engine: str = DEFAULT_ENGINE) -> Result:
+        """Solve part one or two of the day.
+
+        Args:
+            part (int): part to solve
+            engine (str): name of the engine to solve the part with, see `engines`
+
+        Raises:
+            ValueError: if the part is not 1 or 2, or the day has no such engine
+
+        Returns:
+            Result: result object containing the puzzle solution
+        """
+        if part not in (1, 2):
+            raise ValueError(f"Invalid part {part}, expected 1 or 2.")
+
+        solver = None
+        if engine != DEFAULT_ENGINE:
+            solver = self._engines.get(part, {}).get(engine)
+            if solver is None:
+                raise ValueError(f"Unknown engine {engine} for part {part}, expected one of {self.engines(part)}.")
+
+        with self._instrumentation.phase(self.day, f'part{part}'):
+            if solver is not None:
+                return solver(self)
+            return self.solve_part_one() if part == 1 else self.solve_part_two()
+
+    @classmethod
+    def solve_batch(
+        cls,
+        inputs: Iterable[str | PuzzleInput],
+        part: int,
+        workers: Optional[int] = None,
+        chunk_size: int = 64
+    ) -> Iterator[Result]:
+        """Solve a part for many puzzle inputs, yielding the results in the order
+        of the inputs as they become available. Inputs are consumed in chunks, so
+        the inputs can be a stream that does not fit in memory.
+
+        Parts listed in `_vectorized_parts` are solved a chunk at a time in this
+        process by `_solve_many`. Every other part is solved on a pool of worker
+        processes, each solving whole chunks so the cost of sending an input to
+        a worker is spread over the chunk.
+
+        Args:
+            inputs (Iterable[str | PuzzleInput]): puzzle inputs to solve
+            part (int): part to solve
+            workers (Optional[int]): amount of worker processes, defaults to one
+                per CPU, 1 solves every input in this process
+            chunk_size (int): amount of inputs solved at once
+
+        Raises:
+            ValueError: if the part is not 1 or 2
+
+        Yields:
+            Iterator[Result]: solution of every input
+        """
+        if part not in (1, 2):
+            raise ValueError(f"Invalid part {part}, expected 1 or 2.")
+
+        if part in cls._vectorized_parts or workers == 1:
+            for chunk in batched(inputs, chunk_size):
+                yield from cls._solve_many(chunk, part)
+            return
+
+        import os
+        from collections import deque
+        from concurrent.futures import Future, ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as executor:
+            # a couple of chunks per worker in flight keeps the workers busy
+            # without reading the whole stream of inputs ahead of the results
+            pending: deque[Future[list[Result]]] = deque()
+            try:
+                for chunk in batched(inputs, chunk_size):
+                    # memory-mapped inputs can not be sent to another process
+                    texts = tuple( p.text() if isinstance(p, PuzzleInput) else p for p in chunk )
+                    pending.append(executor.submit(cls._solve_many, texts, part))
+                    if len(pending) >= 2 * workers:
+                        yield from pending.popleft().result()
+
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @classmethod
+    def _solve_many(cls, inputs: tuple[str | PuzzleInput, ...], part: int) -> list[Result]:
+        """Solve a part for a chunk of puzzle inputs. Days that can solve a part
+        for many inputs at once override this method and list the part in
+        `_vectorized_parts`. Defaults to solving the inputs one by one.
+
+        Args:
+            inputs (tuple[str | PuzzleInput, ...]): puzzle inputs to solve
+            part (int): part to solve
+
+        Returns:
+            list[Result]: solution of every input
+        """
+        return [ cls(puzzle_input).solve(part) for puzzle_input in inputs ]
+
+    def incremental(self, part: int) -> 'IncrementalSolver':
+        """A solver of a part that starts from the lines of this puzzle input
+        and updates its answer as more lines are fed to it, see
+        `IncrementalSolver.feed`.
+
+        Args:
+            part (int): part to solve
+
+        Raises:
+            ValueError: if the part can not be solved line by line
+
+        Returns:
+            IncrementalSolver: solver holding the answer for this input
+        """
+        solver = self._incremental(part)
+        if solver is None:
+            raise ValueError(f"Part {part} of day {self.day} can not be solved incrementally.")
+
+        solver.feed(self._input.lines())
+        return solver
+
+    def _incremental(self, part: int) -> Optional['IncrementalSolver']:
+        """Method to be overridden by days whose answer can be updated one
+        appended line at a time. Returns an empty solver for the part, or None
+        if the part needs the whole input."""
+        return None
+
+    @classmethod
+    def solve_stream(
+        cls,
+        source: BinaryIO | Iterable[str],
+        parts: Iterable[int] = (1, 2),
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> list[Result]:
+        """Solve parts reading the puzzle input from a stream, such as
+        `sys.stdin.buffer`, in a single pass. The input is split into records,
+        lines unless the day sets `_record_separator`, which are fed to the
+        solver of every part as they are read, so the input is never held in
+        memory as a whole.
+
+        Args:
+            source (BinaryIO | Iterable[str]): binary file object or lines of the input
+            parts (Iterable[int]): parts to solve
+            chunk_size (int): amount of bytes read from a file object at a time
+
+        Raises:
+            ValueError: if a part is not 1 or 2, or can not be solved from a stream
+
+        Returns:
+            list[Result]: solution of every part
+        """
+        day = cls('')
+        solvers: list['IncrementalSolver'] = []
+        for part in parts:
+            if part not in (1, 2):
+                raise ValueError(f"Invalid part {part}, expected 1 or 2.")
+            if (solver := day._stream_solver(part)) is None:
+                raise ValueError(f"Part {part} of day {day.day} can not be solved from a stream.")
+            solvers.append(solver)
+
+        for record in records(source, cls._record_separator, chunk_size):
+            if record:
+                for solver in solvers:
+                    solver.add_line(record)
+
+        return [ solver.result for solver in solvers ]
+
+    @classmethod
+    def stream_parts(cls) -> list[int]:
+        """Parts that `solve_stream` can solve."""
+        day = cls('')
+        return [ part for part in (1, 2) if day._stream_solver(part) is not None ]
+
+    def _stream_solver(self, part: int) -> Optional['IncrementalSolver']:
+        """Method to be overridden by days that can solve a part from a stream
+        of records but not incrementally. Defaults to the incremental solver
+        of the part, see `_incremental`."""
+        return self._incremental(part)
+
     @abstractmethod
     def solve_part_one(self) -> Result:
         """Method to be implemented by day class that solves part one of a day.
@@ -44,6 +339,8 @@ class Day(ABC):
         ...
 
     @staticmethod
-    def _get_puzzle_input(day: int) -> str:
-        puzzle_input_file = resources.files(__package__).joinpath('static', 'inputs', f'aoc{day}.txt')
-        return puzzle_input_file.read_text()
+    def _get_puzzle_input(day: int) -> PuzzleInput:
+        # resolved relative to this file rather than through importlib.resources,
+        # which alone takes longer to import than solving most days
+        puzzle_input_file = Path(__file__).parent.joinpath('static', 'inputs', f'aoc{day}.txt')
+        return PuzzleInput.from_file(puzzle_input_file)
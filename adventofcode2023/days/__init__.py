@@ -1,11 +1,41 @@
-from adventofcode2023.days.day1 import Day1
-from adventofcode2023.days.day3 import Day3
-from adventofcode2023.days.day4 import Day4
-from adventofcode2023.days.day8 import Day8
-from adventofcode2023.days.day9 import Day9
-from adventofcode2023.days.day10 import Day10
-from adventofcode2023.days.day11 import Day11
-from adventofcode2023.days.day12 import Day12
-from adventofcode2023.days.day13 import Day13
-from adventofcode2023.days.day15 import Day15
-from adventofcode2023.days.day18 import Day18
+"""Day classes are resolved lazily so that solving one day does not import
+the modules of all other days, nor the third party libraries they depend on.
+`from adventofcode2023.days import Day1` imports `adventofcode2023.days.day1`
+on first access only.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from adventofcode2023.day import Day
+
+# every implemented day, the class `Day{n}` lives in the module `day{n}`
+DAYS: tuple[int, ...] = tuple(range(1, 21))
+
+__all__ = [ f'Day{day}' for day in DAYS ] + ['DAYS', 'get_day']
+
+
+def get_day(day: int) -> type['Day']:
+    """Look up the class implementing a day, importing its module if needed.
+
+    Args:
+        day (int): day number
+
+    Raises:
+        ValueError: if the day is not implemented
+
+    Returns:
+        type[Day]: class implementing the day
+    """
+    if day not in DAYS:
+        raise ValueError(f"Day {day} is not implemented.")
+
+    module = import_module(f'{__name__}.day{day}')
+    return getattr(module, f'Day{day}')
+
+
+def __getattr__(name: str) -> type['Day']:
+    if name.startswith('Day') and name[3:].isdigit() and int(name[3:]) in DAYS:
+        return get_day(int(name[3:]))
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
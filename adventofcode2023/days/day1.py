@@ -1,4 +1,5 @@
 from adventofcode2023.day import Day, Result
+from adventofcode2023.incremental import IncrementalSolver, LineSum
 from typing import Optional
 
 
@@ -12,34 +13,38 @@ class Day1(Day):
     def day(self) -> int:
         return 1
 
+    def _parse(self) -> list[str]:
+        return list(self._input.lines())
+
     def solve_part_one(self) -> Result:
         """Find the numbers in the strings
 
         Returns:
             Result: _description_
         """
-        numbers: list[int] = []
-        for line in self._puzzle_input.split("\n"):
-            idx1 = None
-            for idx, c in enumerate(line):
-                if c.isdigit():
-                    idx1 = idx
-                    break
+        return sum( self.calibration_value(line) for line in self.parse() )
 
-            assert idx1 is not None, f"No digit found in line `{line}`."
+    @staticmethod
+    def calibration_value(line: str) -> int:
+        """The first and the last digit of a line, as a two digit number."""
+        idx1 = None
+        for idx, c in enumerate(line):
+            if c.isdigit():
+                idx1 = idx
+                break
 
-            idx2 = None
-            for idx, c in enumerate(line[idx + 1 :]):
-                if c.isdigit():
-                    idx2 = idx + idx1 + 1
+        assert idx1 is not None, f"No digit found in line `{line}`."
 
-            if idx2 is None:
-                idx2 = idx1
+        idx2 = None
+        for idx, c in enumerate(line[idx + 1 :]):
+            if c.isdigit():
+                idx2 = idx + idx1 + 1
 
-            num = line[idx1] + line[idx2]
-            numbers.append(int(num))
+        if idx2 is None:
+            idx2 = idx1
 
-        return sum(numbers)
+        num = line[idx1] + line[idx2]
+        return int(num)
 
     def _find_first_digit(self, line: str) -> tuple[Optional[str], Optional[int]]:
         """Example input 'zoneight234'
@@ -83,18 +88,22 @@ class Day1(Day):
 
         return d1
 
-    def solve_part_two(self) -> Result:
-        numbers: list[int] = []
-        for line in self._puzzle_input.split("\n"):
-            # look at characters in line
-            d1, start_idx = self._find_first_digit(line)
+    def bonus_calibration_value(self, line: str) -> int:
+        """The first and the last digit of a line, either of which may be
+        spelled out, as a two digit number."""
+        # look at characters in line
+        d1, start_idx = self._find_first_digit(line)
+
+        line_incr = line[start_idx + 1 :]
+        d2 = self._find_second_digit(line_incr)
 
-            line_incr = line[start_idx + 1 :]
-            d2 = self._find_second_digit(line_incr)
+        if d2 is None:
+            d2 = d1
 
-            if d2 is None:
-                d2 = d1
+        return int(d1 + d2)
 
-            numbers.append(int(d1 + d2))
+    def solve_part_two(self) -> Result:
+        return sum( self.bonus_calibration_value(line) for line in self.parse() )
 
-        return sum(numbers)
+    def _incremental(self, part: int) -> Optional[IncrementalSolver]:
+        return LineSum(self.calibration_value if part == 1 else self.bonus_calibration_value)
@@ -1,4 +1,7 @@
 from typing import NamedTuple, Optional
+
+import numpy as np
+from adventofcode2023 import grids, search
 from adventofcode2023.day import Day, Result
     
 
@@ -11,15 +14,17 @@ class Day10(Day):
     def day(self) -> int:
         return 10
 
+    def _parse(self) -> np.ndarray:
+        return grids.parse(self._input)
     
     @staticmethod
-    def find_start_coordinates(rows: str) -> tuple[int, int]:
-        for y, row in enumerate(rows.split('\n')):
-            x = row.find('S')
-            if x > 0:
-                return x, y
-        
-        raise ValueError(f'Starting possition not found.')
+    def find_start_coordinates(grid: np.ndarray) -> tuple[int, int]:
+        start = grids.find(grid, 'S')
+        if start is None:
+            raise ValueError(f'Starting possition not found.')
+
+        y, x = start
+        return x, y
         
     
     def solve_part_one(self) -> Result:
@@ -29,27 +34,35 @@ class Day10(Day):
             Result: Futhest number of tiles from the starting tile
         """
 
-        x, y = self.find_start_coordinates(self._puzzle_input)
-        pipe_grid = [ s.strip() for s in self._puzzle_input.split('\n') ]
+        pipe_grid = self.parse()
+        height, width = pipe_grid.shape
+        x, y = self.find_start_coordinates(pipe_grid)
         
-        # Each pipe connects to two ends
+        # Each pipe connects to two ends, keyed on the byte of the pipe
         pipe_ends = {
-            "|": [ ( 0,-1), ( 0, 1) ],
-            "-": [ (-1, 0), ( 1, 0) ],
-            "L": [ ( 0,-1), ( 1, 0) ],
-            "J": [ ( 0,-1), (-1, 0) ],
-            "7": [ (-1, 0), ( 0, 1) ],
-            "F": [ ( 1, 0), ( 0, 1) ],
+            ord("|"): [ ( 0,-1), ( 0, 1) ],
+            ord("-"): [ (-1, 0), ( 1, 0) ],
+            ord("L"): [ ( 0,-1), ( 1, 0) ],
+            ord("J"): [ ( 0,-1), (-1, 0) ],
+            ord("7"): [ (-1, 0), ( 0, 1) ],
+            ord("F"): [ ( 1, 0), ( 0, 1) ],
         }
+        # the ends as offsets of a tile packed as y * width + x
+        end_offsets = {
+            char: [ dy * width + dx for dx, dy in ends ]
+            for char, ends in pipe_ends.items()
+        }
+        tiles: bytes = pipe_grid.tobytes()
+        start = y * width + x
 
-        from queue import Queue
-
-        q = Queue()
-
-        # load the initial queue with the two starting points
+        # the starting point connects to the pipes that have an end on it
+        start_neighbours = []
         directions = [(-1, 0), (1, 0), (0, 1), (0, -1)]
         for dx, dy in directions:
-            char = pipe_grid[y + dy][x + dx]
+            if not (0 <= x + dx < width and 0 <= y + dy < height):
+                continue
+
+            char = int(pipe_grid[y + dy, x + dx])
             if char in pipe_ends:
                 for dx2, dy2 in pipe_ends[char]:
                     
@@ -57,35 +70,20 @@ class Day10(Day):
                     # taking into account original location (x, y) + the direction
                     # (dx, dy) and the end of the pipe (dx2, dy2)
                     if x == (x + dx + dx2) and y == (y + dy + dy2):
-
-                        # add the position of that pipe
-                        q.put((1, (x + dx, y + dy)))
+                        start_neighbours.append((y + dy) * width + x + dx)
 
         # The starting point must have only 2 entrances:
         # one ingoing and one outgoing.
-        assert q.qsize() == 2
+        assert len(start_neighbours) == 2
 
-        # Do bookkeeping on where you've already been.
-        # for each coordinate track the amount of times you've
-        # been there. Start with the start position (x, y) 'S'
-        dist = {(x, y): 0}
-        while not q.empty():
-            # get new coordinate to check
-            d, (x, y) = q.get()
+        # pipes in the loop only ever lead to other pipes in the loop
+        def neighbours(tile: int) -> list[int]:
+            if tile == start:
+                return start_neighbours
+            return [ tile + offset for offset in end_offsets[tiles[tile]] ]
 
-            # If we've already passed this coordinate then
-            # ignore it and move to the next item in the queue
-            if (x, y) in dist:
-                continue
-
-            # add the new coordinate
-            dist[(x, y)] = d
-            
-            # Add new coordinates to check to the queue
-            for dx, dy in pipe_ends[pipe_grid[y][x]]:
-                q.put((d + 1, (x + dx, y + dy)))
-    
-        return max(dist.values())
+        dist = search.bfs([start], height * width, neighbours, self._instrumentation)
+        return int(dist.max())
     
     def solve_part_two(self) -> Result:
         return 1
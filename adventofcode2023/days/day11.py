@@ -2,8 +2,12 @@ from pprint import pprint
 import numpy as np
 from typing import NamedTuple, Optional
 from itertools import combinations
+from adventofcode2023 import grids
 from adventofcode2023.day import Day, Result
 
+EMPTY = ord('.')
+GALAXY = ord('#')
+
 class Point(NamedTuple):
     x: int
     y: int
@@ -31,16 +35,17 @@ class Day11(Day):
     @property
     def day(self) -> int:
         return 11
+
+    def _parse(self) -> np.ndarray:
+        return grids.parse(self._input)
     
     @staticmethod
     def expand_column(universe: np.ndarray, idx: int) -> np.ndarray:
-        column = np.array(('.', ) * universe.shape[0], dtype=np.dtype('U1'))
-        return np.insert(universe, idx, column, axis=1)
+        return np.insert(universe, idx, EMPTY, axis=1)
     
     @staticmethod
     def expand_row(universe: np.ndarray, idx: int) -> np.ndarray:
-        row = np.array(('.', ) * universe.shape[1], dtype=np.dtype('U1'))
-        return np.insert(universe, idx, row, axis=0)
+        return np.insert(universe, idx, EMPTY, axis=0)
     
     def get_expanded_universe(self, universe: np.ndarray, idx: int, row_or_column: int) -> np.ndarray:
         if row_or_column == 1 and idx == universe.shape[1]:
@@ -50,13 +55,13 @@ class Day11(Day):
             return self.get_expanded_universe(universe, 0, 1)
 
         if row_or_column == 0:
-            if all(c == '.' for c in universe[idx]):
+            if not (universe[idx] != EMPTY).any():
                 new_universe = self.expand_row(universe, idx + 1)
                 return self.get_expanded_universe(new_universe, idx + 2, 0)
             else:
                 return self.get_expanded_universe(universe, idx + 1, 0)
         else:
-            if all(c == '.' for c in universe.T[idx]):
+            if not (universe.T[idx] != EMPTY).any():
                 new_universe = self.expand_column(universe, idx + 1)
                 return self.get_expanded_universe(new_universe, idx + 2, 1)
             else:
@@ -68,7 +73,7 @@ class Day11(Day):
         points: list[Point] = []
         iterator = np.nditer(universe, flags=['multi_index'])
         for c in iterator:
-            if c == '#':
+            if c == GALAXY:
                 x, y = iterator.multi_index
                 points.append(Point(x, y))
         
@@ -80,8 +85,7 @@ class Day11(Day):
         # 1. expand the universe
         # 2. generate pairs
         # 3. sum up the lengths of distances between all pairs
-        base = np.array([ list(s) for s in self._puzzle_input.split('\n') ], dtype=np.dtype('U1'))
-        universe = self.get_expanded_universe(base, 0, 0)
+        universe = self.get_expanded_universe(self.parse(), 0, 0)
         combinations = self.get_point_combinations(universe)
 
         return sum( manhattan(*pair) for pair in combinations )
@@ -91,7 +95,7 @@ class Day11(Day):
         galaxies: list[Point] = []
         iter = np.nditer(universe, flags=['multi_index'])
         for c in iter:
-            if c == '#':
+            if c == GALAXY:
                 y, x = iter.multi_index
                 galaxies.append(Point(x, y))
         
@@ -129,11 +133,11 @@ class Day11(Day):
         # 3.1 Check if the galaxy is right of the expansion. This means the galaxy is moved
         #     This means that if a column is expanded. The galaxy is moved 1e6 to the right
         #     This means that if a row is expanded. The galaxy is moved 1e6 down
-        universe = np.array([ list(s) for s in self._puzzle_input.split('\n') ], dtype=np.dtype('U1'))
+        universe = self.parse()
 
         points = self.get_galaxy_locations(universe)
-        row_indexes = [ idx for idx, row in enumerate(universe) if all( c == '.' for c in row ) ]
-        column_indexes = [idx for idx, column in enumerate(universe.T) if all( c == '.' for c in column ) ]
+        row_indexes = np.flatnonzero((universe == EMPTY).all(axis=1)).tolist()
+        column_indexes = np.flatnonzero((universe == EMPTY).all(axis=0)).tolist()
         points = self.get_expanded_points(points, int(1e6) - 1, 0, row_indexes, column_indexes, 0)
 
         return sum( manhattan(*pair) for pair in combinations(points, 2) )
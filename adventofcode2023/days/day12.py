@@ -13,8 +13,7 @@ class Day12(Day):
     def day(self) -> int:
         return 12
     
-    @staticmethod
-    def _get_possible_rows(row_of_springs: str) -> list[str]:
+    def _get_possible_rows(self, row_of_springs: str) -> list[str]:
         """Produce all possible combinations of groups for a row. Resolve the ? to a # or .
 
         Example:
@@ -50,6 +49,9 @@ class Day12(Day):
                     unknown_idx += 1
 
             possible_rows.append(row)
+            # the amount of combinations doubles with every unknown, so count
+            # every one of them to be able to cancel a row that never ends
+            self._instrumentation.count('candidate_rows')
         
         return possible_rows
     
@@ -73,7 +75,7 @@ class Day12(Day):
     
     def solve_part_one(self) -> Result:
         arrangements: list[int] = []
-        for line in self._puzzle_input.split('\n'):
+        for line in self._input.lines():
             row_of_strings, group_size_string = line.split(' ')
             group_sizes = [ int(n) for n in group_size_string.split(',') ]
 
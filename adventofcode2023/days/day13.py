@@ -2,6 +2,7 @@ from typing import Optional
 from adventofcode2023.day import Day, Result
 from textwrap import dedent
 import numpy as np
+from adventofcode2023 import grids
 
 class Day13(Day):
 
@@ -11,6 +12,9 @@ class Day13(Day):
     @property
     def day(self) -> int:
         return 13
+
+    def _parse(self) -> list[np.ndarray]:
+        return grids.parse_many(self._input)
     
     def get_reflection_point_vert(self, p: np.ndarray) -> int | None:
 
@@ -58,12 +62,7 @@ class Day13(Day):
 
     def solve_part_one(self) -> Result:
         notes_summary = 0
-        for pattern in self._puzzle_input.split('\n\n'):
-            p = np.array(
-                object=[ list(s) for s in pattern.split('\n') ],
-                dtype=np.dtype('U1')
-            )
-
+        for p in self.parse():
             a = self.get_reflection_point_vert(p)
             b = self.get_reflection_point_hori(p)
             assert not all( x == None for x in [a, b])
@@ -4,6 +4,7 @@ from typing import NamedTuple, Optional
 from adventofcode2023.day import Day, Result
 from enum import Enum, auto
 import numpy as np
+from adventofcode2023 import cycles, grids
 
 class Direction(Enum):
     UP = auto()
@@ -26,6 +27,13 @@ class Point(NamedTuple):
     y: int
 
 
+# rows of the platform, compact and hashable as a state of the spin cycles
+Platform = tuple[str, ...]
+
+CUBED_ROCK = ord('#')
+ROUNDED_ROCK = ord('O')
+
+
 @dataclass
 class RockGroup:
     # A cubed shaped rock has a fixed location
@@ -89,15 +97,15 @@ class Day14(Day):
         rockgroups: list[RockGroup] = []
         iter = np.nditer(platform, flags=['multi_index'])
         for c in iter:
-            if c == '#':
+            if c == CUBED_ROCK:
                 y, x = iter.multi_index
                 column = platform.T[x]
                 stone_group = column[y + 1:]
-                next_cubed_stone = np.where(stone_group == '#')[0]
+                next_cubed_stone = np.where(stone_group == CUBED_ROCK)[0]
                 if next_cubed_stone.size == 0:
-                    rolling_stones = np.count_nonzero(stone_group == 'O')
+                    rolling_stones = np.count_nonzero(stone_group == ROUNDED_ROCK)
                 else:
-                    rolling_stones = np.count_nonzero(stone_group[:next_cubed_stone[0]] == 'O')
+                    rolling_stones = np.count_nonzero(stone_group[:next_cubed_stone[0]] == ROUNDED_ROCK)
 
                 rockgroups.append(RockGroup(Point(x, y), rolling_stones))
 
@@ -108,17 +116,62 @@ class Day14(Day):
         # 2. calculate new location of rounded rocks if platform is tilted north
         # 2.1. Create groups of cube-shaped rocks and the stones below them (since stones roll north)
         # 3. calculate the load of the stones
-        platform = np.array([ list(s) for s in self._puzzle_input.split('\n') ], dtype=np.dtype('U1'))
+        platform = grids.parse(self._input)
 
         # add a layer of cubed shaped stones at the top so they always stop somewhere
-        platform = np.insert(platform, 0, np.array(('#',) * platform.shape[1]), axis=0)
+        platform = np.insert(platform, 0, CUBED_ROCK, axis=0)
         rockgroups = self.get_rock_groups(platform)
         pprint(rockgroups)
         print(sum( group.score(platform.shape[1]) for group in rockgroups ))
         return super().solve_part_one()
     
+    @staticmethod
+    def _roll(line: str) -> str:
+        """Roll the rounded rocks of a line to its start, stopping at cubed rocks."""
+        return '#'.join(
+            'O' * (rocks := part.count('O')) + '.' * (len(part) - rocks)
+            for part in line.split('#')
+        )
+
+    def tilt(self, platform: Platform, direction: Direction) -> Platform:
+        """Tilt the platform, rolling every rounded rock as far as it goes.
+
+        Args:
+            platform (Platform): rows of the platform
+            direction (Direction): direction the rocks roll in, UP being north
+
+        Returns:
+            Platform: rows of the tilted platform
+        """
+        vertical = direction in (Direction.UP, Direction.DOWN)
+        towards_end = direction in (Direction.DOWN, Direction.RIGHT)
+
+        lines = [ ''.join(column) for column in zip(*platform) ] if vertical else platform
+        if towards_end:
+            lines = [ self._roll(line[::-1])[::-1] for line in lines ]
+        else:
+            lines = [ self._roll(line) for line in lines ]
+
+        return tuple( ''.join(row) for row in zip(*lines) ) if vertical else tuple(lines)
+
+    def spin_cycle(self, platform: Platform) -> Platform:
+        for direction in (Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT):
+            platform = self.tilt(platform, direction)
+        return platform
+
+    @staticmethod
+    def north_load(platform: Platform) -> int:
+        return sum(
+            row.count('O') * (len(platform) - y)
+            for y, row in enumerate(platform)
+        )
+
     def solve_part_two(self) -> Result:
-        return super().solve_part_two()
+        # the rocks settle into a loop after a few hundred spin cycles at most,
+        # so the platform after a billion cycles is found by skipping the loops
+        platform: Platform = tuple( line for line in self._input.lines() if line )
+        platform = cycles.state_after(platform, self.spin_cycle, 1_000_000_000)
+        return self.north_load(platform)
 
 
 if __name__ == '__main__':
@@ -134,3 +187,4 @@ O.#..O.#.#
 #OO..#...."""
     day = Day14()
     print(day.solve_part_one())
+    print(day.solve_part_two())
@@ -1,5 +1,9 @@
 from typing import Optional
-from adventofcode2023.day import Day, Result
+
+import numpy as np
+from adventofcode2023.day import Day, Result, engine
+from adventofcode2023.incremental import IncrementalSolver, LineSum
+from adventofcode2023.puzzle_input import PuzzleInput
 
 def hash_(s: str) -> int:
     v = 0
@@ -9,7 +13,34 @@ def hash_(s: str) -> int:
         v %= 256
     return v
 
+
+def hash_many(steps: list[str]) -> np.ndarray:
+    """`hash_` of many steps at once. The steps are laid out as the rows of
+    a zero padded matrix, which is hashed a column at a time.
+
+    Args:
+        steps (list[str]): steps to hash, made up of ASCII characters
+
+    Returns:
+        np.ndarray: hash of every step
+    """
+    lengths = np.array([ len(step) for step in steps ], dtype=np.int64)
+    data = np.frombuffer(''.join(steps).encode('ascii'), dtype=np.uint8)
+
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    matrix = np.zeros((len(steps), lengths.max(initial=0)), dtype=np.int64)
+    matrix[np.repeat(np.arange(len(steps)), lengths), np.arange(len(data)) - starts] = data
+
+    v = np.zeros(len(steps), dtype=np.int64)
+    for col in range(matrix.shape[1]):
+        v = np.where(lengths > col, (v + matrix[:, col]) * 17 % 256, v)
+
+    return v
+
+
 class Day15(Day):
+    _vectorized_parts = (1,)
+    _record_separator = b','
 
     def __init__(self, puzzle_input: str | None = None) -> None:
         super().__init__(puzzle_input)
@@ -24,6 +55,31 @@ class Day15(Day):
     def solve_part_two(self) -> Result:
         return super().solve_part_two()
 
+    def _stream_solver(self, part: int) -> Optional[IncrementalSolver]:
+        # every step is hashed on its own
+        return LineSum(hash_) if part == 1 else None
+
+    @engine(1, 'vectorized')
+    def _solve_part_one_vectorized(self) -> Result:
+        return self._solve_many((self._input,), 1)[0]
+
+    @classmethod
+    def _solve_many(cls, inputs: tuple[str | PuzzleInput, ...], part: int) -> list[Result]:
+        if part != 1:
+            return super()._solve_many(inputs, part)
+
+        steps: list[str] = []
+        offsets: list[int] = []
+        for puzzle_input in inputs:
+            offsets.append(len(steps))
+            steps.extend(cls(puzzle_input)._puzzle_input.split(','))
+
+        if not steps:
+            return []
+
+        # every input has at least one step, so no segment is empty
+        return np.add.reduceat(hash_many(steps), offsets).tolist()
+
 
 if __name__ == '__main__':
     example_input = "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"
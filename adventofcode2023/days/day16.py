@@ -1,11 +1,8 @@
-import os
-from queue import Queue
-import sys
 from textwrap import dedent
-from time import sleep
 from typing import NamedTuple, Optional, Self
 
 import numpy as np
+from adventofcode2023 import grids, search
 from adventofcode2023.day import Day, Result
 
 class Point(NamedTuple):
@@ -24,6 +21,7 @@ UP = Point(0, -1)
 DOWN = Point(0, 1)
 LEFT = Point(-1, 0)
 RIGHT = Point(1, 0)
+DIRECTIONS = [ UP, RIGHT, DOWN, LEFT ]
 
 
 class Day16(Day):
@@ -34,6 +32,9 @@ class Day16(Day):
     @property
     def day(self) -> int:
         return 16
+
+    def _parse(self) -> np.ndarray:
+        return grids.parse(self._input)
     
     @staticmethod
     def _outside_of_grid(grid: np.ndarray, p: Point) -> bool:
@@ -41,88 +42,69 @@ class Day16(Day):
         rows, cols = grid.shape
 
         return x < 0 or y < 0 or y >= rows or x >= cols
-    
-    def get_energized_tiles(self, grid: np.ndarray, starting_beam: Beam) -> int:
-        directions = {
-            '\\': {
-                RIGHT: DOWN,
-                LEFT: UP,
-                DOWN: RIGHT,
-                UP: LEFT
-            },
-            '/': {
-                RIGHT: UP,
-                LEFT: DOWN,
-                DOWN: LEFT,
-                UP: RIGHT
-            }
+
+    @staticmethod
+    def beam_transitions(grid: np.ndarray) -> list[list[int]]:
+        """The beams a beam turns into on its next step. A beam is packed
+        into an int as (y * width + x) * 4 + d, with d its index in
+        `DIRECTIONS`; beams leaving the grid are left out.
+
+        Args:
+            grid (np.ndarray): 2D array of the contraption
+
+        Returns:
+            list[list[int]]: next beams of every beam
+        """
+        rows, cols = grid.shape
+        turns = {
+            '.': { d: [d] for d in DIRECTIONS },
+            '|': { RIGHT: [UP, DOWN], LEFT: [UP, DOWN], UP: [UP], DOWN: [DOWN] },
+            '-': { UP: [LEFT, RIGHT], DOWN: [LEFT, RIGHT], LEFT: [LEFT], RIGHT: [RIGHT] },
+            '\\': { RIGHT: [DOWN], LEFT: [UP], DOWN: [RIGHT], UP: [LEFT] },
+            '/': { RIGHT: [UP], LEFT: [DOWN], DOWN: [LEFT], UP: [RIGHT] },
         }
+
+        transitions: list[list[int]] = []
+        for y, row in enumerate(grid.tolist()):
+            for x, char in enumerate(row):
+                for d in DIRECTIONS:
+                    next_beams = []
+                    for next_d in turns[chr(char)][d]:
+                        p = Point(x + next_d.x, y + next_d.y)
+                        if 0 <= p.x < cols and 0 <= p.y < rows:
+                            next_beams.append((p.y * cols + p.x) * 4 + DIRECTIONS.index(next_d))
+                    transitions.append(next_beams)
+        return transitions
+    
+    def get_energized_tiles(
+        self,
+        grid: np.ndarray,
+        starting_beam: Beam,
+        transitions: Optional[list[list[int]]] = None
+    ) -> int:
         # a beam encodes a location and a direction. A beam may
         # not visit the same location with the same direction.
-        beams_visited: set[Beam] = set()
-
-        # keep track of the tiles that one or more beams have
-        # traveled over.
-        tiles_energized: set[Point] = set()
-
-        queue: Queue[Beam] = Queue()
-        queue.put(starting_beam)
-        while not queue.empty():
-
-            beam = queue.get()
-
-
-            # check if beam has moved out of bounds
-            if self._outside_of_grid(grid, beam.p):
-                continue
-
-            # check if beam is in already visited place
-            if beam in beams_visited:
-                continue
-
-            c = grid[beam.p.y][beam.p.x]
-            match c:
-
-                case '.':
-                    queue.put(Beam(beam.p + beam.d, beam.d))
-                
-                case '|':
-                    if beam.d in [UP, DOWN]:
-                        queue.put(Beam(beam.p + beam.d, beam.d))
-                    else:
-                        queue.put(Beam(beam.p + UP, UP))
-                        queue.put(Beam(beam.p + DOWN, DOWN))
-
-                case '-':
-                    if beam.d in [LEFT, RIGHT]:
-                        queue.put(Beam(beam.p + beam.d, beam.d))
-                    else:
-                        queue.put(Beam(beam.p + LEFT, LEFT))
-                        queue.put(Beam(beam.p + RIGHT, RIGHT))
-
-                case '\\' | '/':
-                    direction = directions[c][beam.d]
-                    queue.put(Beam(beam.p + direction, direction))
-            
-            tiles_energized.add(beam.p)
-            beams_visited.add(beam)
-
-        return len(tiles_energized)
+        if self._outside_of_grid(grid, starting_beam.p):
+            return 0
+        if transitions is None:
+            transitions = self.beam_transitions(grid)
+
+        rows, cols = grid.shape
+        start = (starting_beam.p.y * cols + starting_beam.p.x) * 4 + DIRECTIONS.index(starting_beam.d)
+        beams_visited = search.bfs([start], rows * cols * 4, transitions.__getitem__, self._instrumentation)
+
+        # a tile is energized when a beam in any direction has traveled over it
+        return int(np.count_nonzero((beams_visited.reshape(-1, 4) != search.UNREACHED).any(axis=1)))
     
     def solve_part_one(self) -> Result:
-        grid = np.array(
-            object=[ list(x) for x in self._puzzle_input.split('\n') ],
-            dtype=np.dtype("U1")
-        )
+        grid = self.parse()
         # starting beam starts at location (0, 0) and moves to the right
         starting_beam = Beam(Point(0, 0), Point(1, 0))
         return self.get_energized_tiles(grid, starting_beam)
     
     def solve_part_two(self) -> Result:
-        grid = np.array(
-            object=[ list(x) for x in self._puzzle_input.split('\n') ],
-            dtype=np.dtype("U1")
-        )
+        grid = self.parse()
+        transitions = self.beam_transitions(grid)
         rows, columns = grid.shape
         beams_to_test = (
             # left side -> (0, y) ...
@@ -134,7 +116,7 @@ class Day16(Day):
             # bottom side -> (`rows`, x)
             [Beam(Point(rows, x), UP) for x in range(rows)]
         )
-        return max( self.get_energized_tiles(grid, beam) for beam in beams_to_test )
+        return max( self.get_energized_tiles(grid, beam, transitions) for beam in beams_to_test )
 
 
 if __name__ == "__main__":
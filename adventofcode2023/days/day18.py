@@ -1,8 +1,8 @@
 from itertools import product
-from queue import Queue
 from textwrap import dedent
 
 import numpy as np
+from adventofcode2023 import search
 from adventofcode2023.day import Day, Result
 
 from typing import NamedTuple
@@ -23,6 +23,10 @@ class Point(NamedTuple):
     x: int
     y: int
 
+
+TRENCH = ord('#')
+GROUND = ord('.')
+
 class Day18(Day):
 
     def __init__(self, puzzle_input: str | None = None) -> None:
@@ -59,23 +63,23 @@ class Day18(Day):
     
     @staticmethod
     def get_grid(grid_shape: tuple[int, int], points: list[Point], operations: list[DigOperation]) -> np.ndarray:
-        grid = np.full(shape=grid_shape, fill_value='.', dtype=np.dtype('U1'))
+        grid = np.full(shape=grid_shape, fill_value=GROUND, dtype=np.uint8)
 
         for op, p in zip(operations, points[:-1]):
             x, y = p
             match op.dir:
 
                 case Direction.LEFT:
-                    grid[y, x - op.meters: x + 1] = '#'
+                    grid[y, x - op.meters: x + 1] = TRENCH
 
                 case Direction.RIGHT:
-                    grid[y, x: x + op.meters] = '#'
+                    grid[y, x: x + op.meters] = TRENCH
 
                 case Direction.UP:
-                    grid[y - op.meters: y + 1, x] = '#'
+                    grid[y - op.meters: y + 1, x] = TRENCH
 
                 case Direction.DOWN:
-                    grid[y: y + op.meters, x] = '#'
+                    grid[y: y + op.meters, x] = TRENCH
         
         return grid
 
@@ -103,10 +107,10 @@ class Day18(Day):
             bool: true if inside, false if not
         """
         return (
-            np.count_nonzero(grid[:p.y + 1, p.x] == '#') % 2 == 1 and   # top
-            np.count_nonzero(grid[p.y:, p.x] == '#') % 2 == 1 and       # bottom
-            np.count_nonzero(grid[p.y, :p.x + 1] == '#') % 2 == 1 and   # left
-            np.count_nonzero(grid[p.y, p.x:] == '#') % 2 == 1
+            np.count_nonzero(grid[:p.y + 1, p.x] == TRENCH) % 2 == 1 and   # top
+            np.count_nonzero(grid[p.y:, p.x] == TRENCH) % 2 == 1 and       # bottom
+            np.count_nonzero(grid[p.y, :p.x + 1] == TRENCH) % 2 == 1 and   # left
+            np.count_nonzero(grid[p.y, p.x:] == TRENCH) % 2 == 1
         )
     
     def get_point_inside(self, grid: np.ndarray, p: Point) -> Point:
@@ -121,31 +125,26 @@ class Day18(Day):
 
 
     def fill_grid(self, grid: np.ndarray, starting_point: Point) -> np.ndarray:
-        q: Queue[Point] = Queue()
         height, width = grid.shape
-
-        visited = set()
-        q.put(starting_point)
-        while not q.empty():
-
-            p = q.get()
-            if p in visited:
-                continue
-
-            if p.x > 0 and grid[p.y, p.x - 1] == '.':
-                q.put(Point(p.x - 1, p.y))
-            
-            if p.x < (width - 1) and grid[p.y, p.x + 1] == '.':
-                q.put(Point(p.x + 1, p.y))
-
-            if p.y > 0 and grid[p.y - 1, p.x] == '.':
-                q.put(Point(p.x, p.y - 1))
-
-            if p.y < (height - 1) and grid[p.y + 1, p.x] == '.':
-                q.put(Point(p.x, p.y + 1))
-            
-            grid[p.y, p.x] = '#'
-            visited.add(p)
+        ground: bytes = (grid == GROUND).tobytes()
+
+        # cells are packed as y * width + x
+        def neighbours(cell: int) -> list[int]:
+            y, x = divmod(cell, width)
+            cells = []
+            if x > 0 and ground[cell - 1]:
+                cells.append(cell - 1)
+            if x < (width - 1) and ground[cell + 1]:
+                cells.append(cell + 1)
+            if y > 0 and ground[cell - width]:
+                cells.append(cell - width)
+            if y < (height - 1) and ground[cell + width]:
+                cells.append(cell + width)
+            return cells
+
+        start = starting_point.y * width + starting_point.x
+        dist = search.bfs([start], height * width, neighbours, self._instrumentation)
+        grid[(dist != search.UNREACHED).reshape(grid.shape)] = TRENCH
         
         return grid
 
@@ -162,7 +161,7 @@ class Day18(Day):
             DigOperation(Direction(dir_), int(meters), color[1:-1])
             for dir_, meters, color in [ 
                 operation.split(' ')
-                for operation in self._puzzle_input.split('\n')
+                for operation in self._input.lines()
             ]
         ]
         points = self.get_grid_points(operations)
@@ -184,7 +183,7 @@ class Day18(Day):
         
         # fill with floodfill
         grid = self.fill_grid(grid, starting_point)
-        return np.count_nonzero(grid == '#')
+        return np.count_nonzero(grid == TRENCH)
     
     def solve_part_two(self) -> Result:
         return super().solve_part_two()
@@ -4,6 +4,7 @@ import re
 from textwrap import dedent
 from typing import NamedTuple, Optional, Protocol
 from adventofcode2023.day import Day, Result
+from adventofcode2023.intervals import Box, Interval
 
 class Rating(NamedTuple):
     x: int
@@ -123,21 +124,68 @@ class Day19(Day):
             ratings.append(rating)
         
         return ratings
+
+    def _parse(self) -> tuple[WorkflowMap, list[Rating]]:
+        workflows, ratings = self._puzzle_input.split('\n\n')
+        return self.parse_workflows(workflows.strip()), self.parse_ratings(ratings.strip())
     
     def solve_part_one(self) -> Result:
-        workflows, ratings = self._puzzle_input.split('\n\n')
-        workflows = workflows.strip()
-        workflows = self.parse_workflows(workflows)
-
-        ratings = ratings.strip()
-        ratings = self.parse_ratings(ratings)
-
+        workflows, ratings = self.parse()
         handler = WorkflowHandler(workflows)
 
         return sum( sum(rating) for rating in ratings if handler.process(rating) == True )
     
+    @staticmethod
+    def count_accepted(workflows: WorkflowMap, box: Box) -> int:
+        """Count the ratings in a box that are accepted, by splitting the box
+        on the condition of every instruction it passes. Every rating in a
+        part of the box follows the same path through the workflows.
+
+        Args:
+            workflows (WorkflowMap): workflows by their key
+            box (Box): interval of every category of a rating, in the order of `Rating`
+
+        Returns:
+            int: amount of accepted ratings
+        """
+        accepted = 0
+        stack: list[tuple[str, Box]] = [('in', box)]
+        while stack:
+            key, box = stack.pop()
+            if key == 'R':
+                continue
+            if key == 'A':
+                accepted += box.size
+                continue
+
+            remaining: Optional[Box] = box
+            for instruction in workflows[key].ops:
+                assert remaining is not None
+
+                if ':' not in instruction:
+                    stack.append((instruction, remaining))
+                    break
+
+                condition, goto = instruction.split(':')
+                dim = Rating._fields.index(condition[0])
+                value = int(condition[2:])
+                if condition[1] == '<':
+                    passed, remaining = remaining.split(dim, value)
+                else:
+                    remaining, passed = remaining.split(dim, value + 1)
+
+                if passed is not None:
+                    stack.append((goto, passed))
+                if remaining is None:
+                    break
+
+        return accepted
+
     def solve_part_two(self) -> Result:
-        return super().solve_part_two()
+        workflows, _ = self.parse()
+
+        # every category of a rating is between 1 and 4000
+        return self.count_accepted(workflows, Box((Interval(1, 4001),) * len(Rating._fields)))
 
 
 if __name__ == '__main__':
@@ -161,3 +209,4 @@ if __name__ == '__main__':
     {x=2127,m=1623,a=2188,s=1013}""").strip()
     day = Day19()
     print(day.solve_part_one())
+    print(day.solve_part_two())
@@ -1,7 +1,15 @@
-from typing import Optional
+from typing import NamedTuple, Optional
 from adventofcode2023.day import Day, Result
+from adventofcode2023.incremental import IncrementalSolver, LineSum
 from math import prod
 
+
+class Game(NamedTuple):
+    id: int
+    # amount of cubes per color for every grab out of the bag
+    grabs: list[dict[str, int]]
+
+
 class Day2(Day):
 
     def __init__(self, puzzle_input: Optional[str] = None) -> None:
@@ -10,57 +18,59 @@ class Day2(Day):
     @property
     def day(self) -> int:
         return 2
-    
-    def solve_part_one(self) -> Result:
-        max_colors = {'red': 12, 'green': 13, 'blue': 14}
 
-        lines = self._puzzle_input.split("\n")
-        ids: list[int] = []
-        for line in lines:
+    @staticmethod
+    def parse_game(line: str) -> Game:
+        game_conf, cubes = line.split(':')
 
-            game_conf, cubes = line.split(':')
+        *_, game_id = game_conf.split(' ')
+        grabs: list[dict[str, int]] = []
 
-            *_, game_id = game_conf.split(' ')
-            game_id = int(game_id)
-            game_is_possible = True
+        for cube in cubes.split(';'):
 
-            for cube in cubes.split(';'):
-                
-                start_colors = { 'red': 0, 'green': 0, 'blue': 0 }
-                for roll in cube.split(','):
+            colors = { 'red': 0, 'green': 0, 'blue': 0 }
+            for roll in cube.split(','):
 
-                    num, color = roll.strip().split(' ')
-                    num = int(num)
+                num, color = roll.strip().split(' ')
+                colors[color] += int(num)
 
-                    start_colors[color] += num
-                
-                if any( start_colors[k] > max_colors[k] for k in max_colors ):
-                    game_is_possible = False
-                    break
-            
-            if game_is_possible:
-                ids.append(game_id)
+            grabs.append(colors)
 
-        return sum(ids)
+        return Game(int(game_id), grabs)
 
-    
-    def solve_part_two(self) -> Result:
-        powers: list[int] = []
-        for line in self._puzzle_input.split('\n'):
+    def _parse(self) -> list[Game]:
+        return [ self.parse_game(line) for line in self._input.lines() ]
 
-            _, grabs = line.split(':')
+    @staticmethod
+    def possible_id(game: Game) -> int:
+        """The id of a game that is possible with the cubes in the bag, 0 otherwise."""
+        max_colors = {'red': 12, 'green': 13, 'blue': 14}
 
-            fewest_colors = { 'red': 0, 'green': 0, 'blue': 0 }
-            for grab in grabs.split(';'):
+        game_is_possible = all(
+            all( grab[k] <= max_colors[k] for k in max_colors )
+            for grab in game.grabs
+        )
+        return game.id if game_is_possible else 0
+    
+    def solve_part_one(self) -> Result:
+        return sum( self.possible_id(game) for game in self.parse() )
 
-                for cube in grab.split(','):
+    @staticmethod
+    def power(game: Game) -> int:
+        """The product of the fewest cubes of every color the game needs."""
+        fewest_colors = { 'red': 0, 'green': 0, 'blue': 0 }
+        for grab in game.grabs:
 
-                    num, color = cube.strip().split(' ')
-                    num = int(num)
+            for color, num in grab.items():
 
-                    if num > fewest_colors[color]:
-                        fewest_colors[color] = num
+                if num > fewest_colors[color]:
+                    fewest_colors[color] = num
 
-            powers.append(prod(fewest_colors.values()))
+        return prod(fewest_colors.values())
+    
+    def solve_part_two(self) -> Result:
+        return sum( self.power(game) for game in self.parse() )
 
-        return sum(powers)
\ No newline at end of file
+    def _incremental(self, part: int) -> Optional[IncrementalSolver]:
+        value = self.possible_id if part == 1 else self.power
+        return LineSum(lambda line: value(self.parse_game(line)))
@@ -5,8 +5,9 @@ from enum import Enum, auto
 from pprint import pprint
 from queue import Queue
 from textwrap import dedent
-from typing import Optional, Self, Type, cast
-from adventofcode2023.day import Day, Result
+from typing import Hashable, Optional, Self, Type, cast
+from adventofcode2023 import cycles
+from adventofcode2023.day import REFERENCE_ENGINE, Day, Result, engine
 
 # important notes
 # - Pulses are always processed in the order they are sent.
@@ -81,6 +82,10 @@ class Module(ABC):
             if self.key() in m.destmodules():
                 self._inputmodules.append(m.key())
     
+    def state(self) -> Hashable:
+        """Snapshot of the memory of the module, which is empty by default."""
+        return ()
+
     @abstractmethod
     def pulse(self, recvpuls: Pulse) -> list[Pulse]:
         """Generate new pulses based on incoming pulse
@@ -95,6 +100,10 @@ class Module(ABC):
 
 
 
+# class, key and destination modules of a module
+ModuleSpec = tuple[Type[Module], str, list[str]]
+
+
 class ModuleManager:
     """ The ModuleManager manages one button, one broadcaster,
     n amount of FlipFlops and n amount of Conjuction modules.
@@ -120,8 +129,8 @@ class ModuleManager:
         return cls
 
     @classmethod
-    def from_module_configuration(cls, module_config: str) -> Self:
-        modules: dict[str, Module] = {}
+    def parse_module_configuration(cls, module_config: str) -> list[ModuleSpec]:
+        specs: list[ModuleSpec] = []
         for module_string in module_config.split('\n'):
 
             for prefix, module in cls._registered_module_cls.items():
@@ -134,8 +143,22 @@ class ModuleManager:
                         key = key[1:]
                     
                     destmodules = [ key.strip() for key in destmodules.split(',') ]
-                    modules[key] = module(key, [], destmodules)
-        
+                    specs.append((module, key, destmodules))
+
+        return specs
+
+    @classmethod
+    def from_module_configuration(cls, module_config: str) -> Self:
+        return cls.from_module_specs(cls.parse_module_configuration(module_config))
+
+    @classmethod
+    def from_module_specs(cls, specs: list[ModuleSpec]) -> Self:
+        """Manager of new modules in their initial state, so managers built
+        from the same specs do not share any state."""
+        modules: dict[str, Module] = {
+            key: module(key, [], list(destmodules))
+            for module, key, destmodules in specs
+        }
         for module in modules.values():
             module.register_inputmodules([
                 m for (k, m) in modules.items() if k != module.key()
@@ -143,6 +166,14 @@ class ModuleManager:
 
         return cls(modules)
 
+    def state(self) -> tuple[Hashable, ...]:
+        """Snapshot of the memory of every module. Pressing the button in
+        equal states sends equal pulses."""
+        return tuple( module.state() for module in self._modules.values() )
+
+    def pulse_counts(self) -> tuple[int, int]:
+        return self._low_pulses_send, self._high_pulses_send
+
     def found_pulse(self) -> bool:
         return self._found_pulse
     
@@ -152,6 +183,9 @@ class ModuleManager:
     def pulse_product(self) -> int:
         return self._low_pulses_send * self._high_pulses_send
 
+    def pulses_send(self) -> int:
+        return self._low_pulses_send + self._high_pulses_send
+
     def press_button(self, look_for_pulse: Optional[Pulse] = None) -> None:
         """Pressing the button module sends a LOW pulse to the broadcaster, who forwards the
         signal to all its destination modules, who process the pulse and send more pulses. This
@@ -206,6 +240,9 @@ class FlipFlop(Module):
         super().__init__(key, inputmodules, destmodules)
         self._state = FlipFlopState.OFF
 
+    def state(self) -> Hashable:
+        return self._state
+
     def pulse(self, recvpuls: Pulse) -> list[Pulse]:
         if recvpuls.type == PulseType.HIGH:
             return []
@@ -245,6 +282,9 @@ class Conjunction(Module):
             if self.key() in m.destmodules():
                 self._inputmodules.append(m.key())
                 self._pulse_memory[m.key()] = PulseType.LOW
+
+    def state(self) -> Hashable:
+        return tuple(self._pulse_memory.values())
     
     def pulse(self, recvpuls: Pulse) -> list[Pulse]:
         self._pulse_memory[recvpuls.sender] = recvpuls.type
@@ -284,18 +324,51 @@ class Day20(Day):
     @property
     def day(self) -> int:
         return 20
+
+    def _parse(self) -> list[ModuleSpec]:
+        return ModuleManager.parse_module_configuration(self._puzzle_input)
     
     def solve_part_one(self) -> Result:
-        manager = ModuleManager.from_module_configuration(self._puzzle_input)
+        manager = ModuleManager.from_module_specs(self.parse())
+        presses = 1000
+
+        # pulses send by every press, until the modules are back in a state
+        # they were in before and every later press repeats an earlier one
+        low_pulses: list[int] = []
+        high_pulses: list[int] = []
+        def press(manager: ModuleManager) -> ModuleManager:
+            low, high = manager.pulse_counts()
+            manager.press_button()
+            low_pulses.append(manager.pulse_counts()[0] - low)
+            high_pulses.append(manager.pulse_counts()[1] - high)
+            return manager
+
+        cycle = cycles.detect_cycle(manager, press, ModuleManager.state, max_steps=presses)
+
+        self._instrumentation.count('button_presses', manager.button_presses())
+        self._instrumentation.count('queue_pushes', manager.pulses_send())
+        if cycle is None:
+            return manager.pulse_product()
+        return cycle.total(low_pulses, presses) * cycle.total(high_pulses, presses)
+    
+    @engine(1, REFERENCE_ENGINE)
+    def _solve_part_one_reference(self) -> Result:
+        # every press simulated, without looking for repeating states
+        manager = ModuleManager.from_module_specs(self.parse())
         for _ in range(1000):
             manager.press_button()
 
         return manager.pulse_product()
-    
+
     def solve_part_two(self) -> Result:
-        manager = ModuleManager.from_module_configuration(self._puzzle_input)
+        manager = ModuleManager.from_module_specs(self.parse())
         while not manager.found_pulse():
+            pulses_send = manager.pulses_send()
             manager.press_button(Pulse(PulseType.LOW, '', 'rx'))
+
+            # counted per press since this loop may never end
+            self._instrumentation.count('button_presses')
+            self._instrumentation.count('queue_pushes', manager.pulses_send() - pulses_send)
             if manager.button_presses() % 5000 == 0:
                 print(manager.button_presses())
         
@@ -1,6 +1,11 @@
 from typing import Optional
+
+import numpy as np
+from adventofcode2023 import grids
 from adventofcode2023.day import Day, Result
-from itertools import product
+
+IS_DIGIT = grids.char_class(grids.DIGITS)
+DOT = ord('.')
 
 class Day3(Day):
 
@@ -11,85 +16,65 @@ class Day3(Day):
     def day(self) -> int:
         return 3
     
-    def _puzzle_input_to_grid(self) -> list[list[str]]:
-        return [
-            [ c for c in line ]
-            for line in self._puzzle_input.split('\n')
-        ]
+    def _puzzle_input_to_grid(self) -> np.ndarray:
+        # a copy, since numbers are blanked out once they are counted
+        return grids.parse(self._input).copy()
     
     @staticmethod
-    def _parse_number_from_grid(chars: list[str], x: int) -> int:
-        """Find the number in the list of chars. Set all digits to '.' so they're
+    def _parse_number_from_grid(chars: np.ndarray, x: int) -> int:
+        """Find the number in the row of chars. Set all digits to '.' so they're
         ignored the next time.
 
         Args:
-            chars (list[str]): Row passed from the grid
+            chars (np.ndarray): Row passed from the grid
             x (int): x on the 1D line
 
         Returns:
             int: number
         """
-        def update_list_inplace(start_idx: int, end_idx: int):
-            range_ = range(start_idx, end_idx)
-            for idx in range_:
-                chars[idx] = '.'
-
         start_idx = x
-        while start_idx >= 0 and chars[start_idx].isdigit():
+        while start_idx >= 0 and IS_DIGIT[chars[start_idx]]:
             start_idx -= 1
         
         end_idx = x
         width = len(chars)
-        while end_idx < width and chars[end_idx].isdigit():
+        while end_idx < width and IS_DIGIT[chars[end_idx]]:
             end_idx += 1
 
-        num = int(''.join(chars[start_idx + 1: end_idx]))
-        update_list_inplace(start_idx, end_idx)
+        num = int(chars[start_idx + 1: end_idx].tobytes())
+        chars[start_idx + 1: end_idx] = DOT
         return num
 
 
-    def _has_number_adjacent(self, grid: list[list[str]], x: int, y: int) -> list[int]:
+    def _has_number_adjacent(self, grid: np.ndarray, x: int, y: int) -> list[int]:
         """If the grid has digits adjacent horizontally, vertically or diagonally, return
-        a list of all numbers found. If nothing found return None.
+        a list of all numbers found.
 
         Args:
-            grid (list[list[str]]): grid
+            grid (np.ndarray): grid
             x (int): current x location
             y (int): current y location
 
         Returns:
-            list[int] | None: None if no digits found, else list of whole numbers found
+            list[int]: whole numbers found, empty if no digits found
         """
-        if len(grid) == 0 or len(grid[0]) == 0:
+        if grid.size == 0:
             raise ValueError(f"Invalid grid.")
 
-        width = len(grid[0])
-        height = len(grid)
         numbers: list[int] = []
-
-        for pos in product([-1, 0, 1], repeat=2):
-            x_incr, y_inr = pos
-            x_check, y_check = (x + x_incr, y + y_inr)
-            if (
-                x_check >= 0 and x_check < width and
-                y_check >= 0 and y_check < height
-            ):
-                if grid[y_check][x_check].isdigit():
-                    num = self._parse_number_from_grid(grid[y_check], x_check)
-                    numbers.append(num)
+        for y_check, x_check in grids.neighbours(grid, y, x, diagonal=True):
+            if IS_DIGIT[grid[y_check, x_check]]:
+                num = self._parse_number_from_grid(grid[y_check], x_check)
+                numbers.append(num)
         
         return numbers
     
     def solve_part_one(self) -> Result:
         numbers: list[int] = []
         grid = self._puzzle_input_to_grid()
-        for y, row in enumerate(grid):
-
-            for x, c in enumerate(row):
-
-                if not c.isdigit() and c != '.':
-                    if nums := self._has_number_adjacent(grid, x, y):
-                        numbers.extend(nums)
+        symbols = ~grids.mask(grid, grids.DIGITS + '.')
+        for y, x in np.argwhere(symbols).tolist():
+            numbers.extend(self._has_number_adjacent(grid, x, y))
         
         return sum(numbers)
     
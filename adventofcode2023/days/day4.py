@@ -1,8 +1,9 @@
 from textwrap import dedent
 from adventofcode2023.day import Day, Result
+from adventofcode2023.incremental import IncrementalSolver, LineSum
 
 import re
-from typing import Self
+from typing import Optional, Self
 from dataclasses import dataclass
 
 @dataclass
@@ -35,30 +36,28 @@ class Day4(Day):
     def day(self) -> int:
         return 4
 
-    def solve_part_one(self) -> Result:
-        lines = self._puzzle_input.split('\n')
-        sum_winning_numbers: list[int] = []
-        for line in lines:
-
-            import re
+    def _parse(self) -> list[Card]:
+        return [ Card.from_line(line) for line in self._input.lines() ]
 
-            line = re.sub(r' +', ' ', line)
-            _, cards = line.split(':')
+    @staticmethod
+    def points(card: Card) -> int:
+        your_winning_numbers = card.get_matching_numbers()
+        if your_winning_numbers:
+            return 1 * (2 ** (len(your_winning_numbers) - 1))
+        return 0
 
-            winning_number_line, your_number_line = cards.split('|')
-            
-            winning_numbers = [ int(n) for n in winning_number_line.strip().split(' ') ]
-            your_numbers = [ int(n) for n in your_number_line.strip().split(' ') ]
-
-            your_winning_numbers = [ n for n in your_numbers if n in winning_numbers ]
-            if your_winning_numbers:
-                sum_winning_numbers.append( 1 * (2 ** (len(your_winning_numbers) - 1)) )
+    def solve_part_one(self) -> Result:
+        return sum( self.points(card) for card in self.parse() )
 
-        return sum(sum_winning_numbers)
+    def _incremental(self, part: int) -> Optional[IncrementalSolver]:
+        # the copies won in part two depend on the cards that follow
+        if part != 1:
+            return None
+        return LineSum(lambda line: self.points(Card.from_line(line)))
     
 
     def solve_part_two(self) -> Result:
-        cards = [ Card.from_line(line) for line in self._puzzle_input.split('\n') ]
+        cards = self.parse()
         instances = { c.number: 0 for c in cards }
 
         from collections import deque
@@ -1,10 +1,14 @@
-from itertools import chain
-from adventofcode2023.day import Day, Result
+from itertools import batched, chain
+from adventofcode2023.day import REFERENCE_ENGINE, Day, Result, engine
+from adventofcode2023.intervals import Interval, IntervalSet, Piece, PiecewiseShift
 
-from typing import Self, Generator
-from dataclasses import dataclass
+from typing import Iterable, Iterator, Self, Generator
+from dataclasses import dataclass, field
 
-@dataclass
+# what the numbers of every layer stand for, in order
+LAYERS = ('soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location')
+
+@dataclass(slots=True)
 class Range:
     min: int
     max: int
@@ -13,7 +17,7 @@ class Range:
         return self.min <= v <= self.max
 
 
-@dataclass
+@dataclass(slots=True)
 class Mapping:
     dst_range: Range
     src_range: Range
@@ -29,13 +33,25 @@ class Mapping:
         seed_range = Range(src_range_start, src_range_start + range_length)
         return cls(type_range, seed_range)
 
-assert Mapping.from_line("50 98 2") == Mapping(Range(50, 51), Range(98, 99))
+    @property
+    def source(self) -> Interval:
+        return Interval(self.src_range.min, self.src_range.max + 1)
+
+    @property
+    def offset(self) -> int:
+        return self.dst_range.min - self.src_range.min
 
+    @property
+    def piece(self) -> Piece:
+        return Piece(self.src_range.min, self.src_range.max + 1, self.offset)
 
-@dataclass
+
+@dataclass(slots=True)
 class SeedResult:
+    """A seed and its location, the only number of a seed part one needs.
+    See `SeedMapper.map_seed` for the numbers of the layers in between."""
     number: int
-    result: dict[str, int]
+    location: int
 
 
 @dataclass
@@ -51,6 +67,30 @@ class SeedMapper:
 
     seeds: list[int]
     mappings: list[list[Mapping]]
+    # the mappings of every layer as a sorted table, and every layer composed
+    # into a single function from seed to location
+    layers: list[PiecewiseShift] = field(init=False, repr=False, compare=False)
+    location_map: PiecewiseShift = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.layers = [ PiecewiseShift( m.piece for m in mappings ) for mappings in self.mappings ]
+        self.location_map = self.compose(self.layers)
+
+    @staticmethod
+    def compose(layers: Iterable[PiecewiseShift]) -> PiecewiseShift:
+        """Compose layers into one function, which maps a number through
+        every layer with a single binary search.
+
+        Args:
+            layers (Iterable[PiecewiseShift]): every layer, in order
+
+        Returns:
+            PiecewiseShift: function applying every layer in turn
+        """
+        composed = PiecewiseShift()
+        for layer in layers:
+            composed = composed.then(layer)
+        return composed
 
     @staticmethod
     def _parse_seeds(seed_line: str) -> list[int]:
@@ -87,45 +127,131 @@ class SeedMapper:
         mapping_formatted = pformat(self.mappings, width=60)
         return f"{self.seeds}\n{mapping_formatted}"
     
-    def get_seed_mappings(self) -> list[SeedResult]:
+    def map_seed(self, seed: int) -> Iterator[tuple[str, int]]:
+        """Map a seed through one layer at a time, lazily.
 
-        # for each seed, go through all the mappings
-        # to end up at the configuration for each seed
+        Args:
+            seed (int): seed to map
+
+        Yields:
+            Iterator[tuple[str, int]]: name of every layer, see LAYERS, and
+                the number the seed maps to in it, ending with its location
+        """
+        v = seed
+        for name, layer in zip(LAYERS, self.layers):
+            v = layer.lookup(v)
+            yield name, v
+
+    def get_seed_mappings(self) -> list[SeedResult]:
+        """Location of every seed, found by scanning the mappings of every
+        layer in turn, without any of the tables built from them."""
         seed_results: list[SeedResult] = []
         for seed in self.seeds:
-
-            mapping_types = [
-                'soil',
-                'fertitilizer',
-                'water',
-                'light',
-                'temperature',
-                'humidity',
-                'location'
-            ]
-            seed_mapping = { k: 0 for k in mapping_types }
             v = seed
-            for type_with_list in zip(mapping_types, self.mappings):
+            for mapping_list in self.mappings:
 
                 # for each Mapping, check if `v` is in the range
-                found_in_range = False
-                type_, mapping_list = type_with_list
                 for mapping in mapping_list:
-
                     if mapping.src_range.contains(v):
-                        diff = v - mapping.src_range.min
-                        v = mapping.dst_range.min + diff
-                        seed_mapping[type_] = v
-                        found_in_range = True
+                        v += mapping.offset
                         break
 
-                if not found_in_range:
-                    seed_mapping[type_] = v
+            seed_results.append(SeedResult(seed, v))
 
-            seed_results.append(SeedResult(seed, seed_mapping))
-    
         return seed_results
-    
+
+    def seed_ranges(self) -> IntervalSet:
+        """The seeds read as pairs of a start and a length, as in part two."""
+        assert len(self.seeds) % 2 == 0
+        return IntervalSet(
+            Interval.from_length(start, length) for start, length in batched(self.seeds, 2)
+        )
+
+    @staticmethod
+    def map_ranges(ranges: IntervalSet, mappings: list[Mapping]) -> IntervalSet:
+        """Map whole ranges of numbers through one layer of mappings, splitting
+        them at the boundaries of the mappings. Numbers outside of every
+        mapping map to themselves.
+
+        Args:
+            ranges (IntervalSet): numbers to map
+            mappings (list[Mapping]): mappings of the layer
+
+        Returns:
+            IntervalSet: the numbers mapped to
+        """
+        mapped: list[Interval] = []
+        unmapped = ranges
+        for mapping in mappings:
+            source = IntervalSet([mapping.source])
+            mapped.extend( i.shift(mapping.offset) for i in unmapped & source )
+            unmapped = unmapped - source
+        return unmapped | mapped
+
+    def lowest_location(self, seed_ranges: IntervalSet) -> int:
+        """Lowest location of any seed in the ranges, found by pushing the
+        ranges through every layer. The cost depends on the amount of ranges
+        and mappings, never on the amount of seeds.
+
+        Args:
+            seed_ranges (IntervalSet): seeds to map
+
+        Returns:
+            int: lowest location of the seeds
+        """
+        ranges = seed_ranges
+        for mappings in self.mappings:
+            ranges = self.map_ranges(ranges, mappings)
+        return ranges.min()
+
+    def lowest_location_reverse(self, seed_ranges: IntervalSet) -> int:
+        """Lowest location of any seed in the ranges, found by walking up the
+        locations in chunks that double in size, and mapping every chunk back
+        to the seeds that end up in it. The first chunk that any seed maps
+        into holds the lowest location, so a low lowest location is found
+        after a few chunks.
+
+        Args:
+            seed_ranges (IntervalSet): seeds to map
+
+        Raises:
+            ValueError: if there are no seeds
+
+        Returns:
+            int: lowest location of the seeds
+        """
+        # the pieces of the composed map in the order of the locations they map to
+        pieces = sorted(self.location_map, key=lambda p: p.start + p.offset)
+        low = min([ p.start + p.offset for p in pieces ] + [seed_ranges.min()])
+        high = max([ p.end + p.offset for p in pieces ] + [seed_ranges.max() + 1])
+        # seeds outside of every piece keep their number as location
+        unshifted = seed_ranges - IntervalSet( (p.start, p.end) for p in pieces )
+
+        active: list[Piece] = []
+        added = 0
+        start, size = min(low, 0), 1
+        while start < high:
+            end = start + size
+            while added < len(pieces) and pieces[added].start + pieces[added].offset < end:
+                active.append(pieces[added])
+                added += 1
+            active = [ p for p in active if p.end + p.offset > start ]
+
+            candidates: list[int] = []
+            if (seed := unshifted.next(start)) is not None and seed < end:
+                candidates.append(seed)
+            for piece in active:
+                # the numbers of the piece that map into the chunk
+                lo, hi = max(piece.start, start - piece.offset), min(piece.end, end - piece.offset)
+                if (seed := seed_ranges.next(lo)) is not None and seed < hi:
+                    candidates.append(seed + piece.offset)
+
+            if candidates:
+                return min(candidates)
+            start, size = end, size * 2
+
+        raise ValueError('No seeds map to a location.')
+
 
 @dataclass
 class BonusSeedMapper:
@@ -150,6 +276,11 @@ class BonusSeedMapper:
         seed_numbers_line = seed_numbers_line.strip()
 
         seed_ranges = [ int(n) for n in seed_numbers_line.split(' ') ]
+        return BonusSeedMapper._expand_seed_ranges(seed_ranges)
+
+    @staticmethod
+    def _expand_seed_ranges(seed_ranges: list[int]) -> chain[int]:
+        # 79 14 55 13 -> 79, 80, ..., 92, 55, 56, ..., 67
         assert len(seed_ranges) % 2 == 0
 
         from itertools import batched, chain
@@ -180,6 +311,11 @@ class BonusSeedMapper:
             for part_string in parts[1:]
         ]  
         return cls(seeds, mappings)
+
+    @classmethod
+    def from_seed_mapper(cls, seed_mapper: SeedMapper) -> Self:
+        """Reinterpret the seeds of an already parsed almanac as ranges."""
+        return cls(cls._expand_seed_ranges(seed_mapper.seeds), seed_mapper.mappings)
     
     def __repr__(self) -> str:
         from pprint import pformat
@@ -190,40 +326,21 @@ class BonusSeedMapper:
     def get_lowest_location(self) -> int:
 
         # for each seed, go through all the mappings
-        # to end up at the configuration for each seed
+        # to end up at the location of each seed
         lowest_location = None
         for seed in self.seeds:
 
-            mapping_types = [
-                'soil',
-                'fertitilizer',
-                'water',
-                'light',
-                'temperature',
-                'humidity',
-                'location'
-            ]
-            seed_mapping = { k: 0 for k in mapping_types }
             v = seed
-            for type_with_list in zip(mapping_types, self.mappings):
+            for mapping_list in self.mappings:
 
                 # for each Mapping, check if `v` is in the range
-                found_in_range = False
-                type_, mapping_list = type_with_list
                 for mapping in mapping_list:
-
                     if mapping.src_range.contains(v):
-                        diff = v - mapping.src_range.min
-                        v = mapping.dst_range.min + diff
-                        seed_mapping[type_] = v
-                        found_in_range = True
+                        v += mapping.offset
                         break
 
-                if not found_in_range:
-                    seed_mapping[type_] = v
-
-            if lowest_location is None or seed_mapping['location'] < lowest_location:
-                lowest_location = seed_mapping['location']
+            if lowest_location is None or v < lowest_location:
+                lowest_location = v
     
         return lowest_location
 
@@ -237,11 +354,57 @@ class Day5(Day):
     def day(self) -> int:
         return 5
 
+    def _parse(self) -> SeedMapper:
+        return SeedMapper.from_string(self._puzzle_input)
+
     def solve_part_one(self) -> Result:
-        seed_mapper = SeedMapper.from_string(self._puzzle_input)
-        results = seed_mapper.get_seed_mappings()
-        return min(results, key=lambda x: x.result['location']).number
-    
+        seed_mapper = self.parse()
+        return min(seed_mapper.seeds, key=seed_mapper.location_map.lookup)
+
     def solve_part_two(self) -> Result:
-        seed_mapper = BonusSeedMapper.from_string(self._puzzle_input)
-        return seed_mapper.get_lowest_location()
+        seed_mapper = self.parse()
+        return min(
+            seed_mapper.location_map.lookup_range(start, end).min()
+            for start, end in seed_mapper.seed_ranges()
+        )
+
+    @engine(1, 'vectorized')
+    def _solve_part_one_vectorized(self) -> Result:
+        import numpy as np
+
+        seed_mapper = self.parse()
+        seeds = np.array(seed_mapper.seeds, dtype=np.int64)
+        locations = seed_mapper.location_map.lookup_many(seeds)
+        return int(seeds[np.argmin(locations)])
+
+    @engine(1, 'layered')
+    def _solve_part_one_layered(self) -> Result:
+        # every seed looked up in the table of every layer on its own
+        seed_mapper = self.parse()
+
+        def location(seed: int) -> int:
+            for layer in seed_mapper.layers:
+                seed = layer.lookup(seed)
+            return seed
+
+        return min(seed_mapper.seeds, key=location)
+
+    @engine(1, REFERENCE_ENGINE)
+    def _solve_part_one_reference(self) -> Result:
+        results = self.parse().get_seed_mappings()
+        return min(results, key=lambda x: x.location).number
+
+    @engine(2, 'reverse')
+    def _solve_part_two_reverse(self) -> Result:
+        seed_mapper = self.parse()
+        return seed_mapper.lowest_location_reverse(seed_mapper.seed_ranges())
+
+    @engine(2, 'layered')
+    def _solve_part_two_layered(self) -> Result:
+        seed_mapper = self.parse()
+        return seed_mapper.lowest_location(seed_mapper.seed_ranges())
+
+    # maps every seed on its own, so only small inputs have few enough seeds
+    @engine(2, REFERENCE_ENGINE, max_scale=0.05)
+    def _solve_part_two_reference(self) -> Result:
+        return BonusSeedMapper.from_seed_mapper(self.parse()).get_lowest_location()
@@ -1,8 +1,11 @@
 import re
+from typing import Optional
 
 import numpy as np
-from math import prod
-from adventofcode2023.day import Day, Result
+from math import isqrt, prod
+from adventofcode2023.day import Day, Result, engine
+from adventofcode2023.incremental import IncrementalSolver
+from adventofcode2023.puzzle_input import PuzzleInput
 
 
 # There are three variables in this day
@@ -25,9 +28,80 @@ from adventofcode2023.day import Day, Result
 # have 5 ms left. You will go 2 mm/ms for 7 - 2 = 5 ms
 # which means you'll travel a total of 10 mm
 #
+# Holding the button for h ms beats the record d of a race lasting t ms when
+# h * (t - h) > d, so the ways to win are the whole numbers strictly between
+# the roots of h^2 - t*h + d, which is what `count_ways` uses to count them
+# for many races at once.
+
+
+def count_ways(times: list[int], distances: list[int]) -> list[int]:
+    """Count the ways to beat the record of every race.
+
+    Args:
+        times (list[int]): duration of every race
+        distances (list[int]): record distance of every race, not negative
+
+    Returns:
+        list[int]: amount of button hold times beating the record per race
+    """
+    if not times:
+        return []
+
+    # h * (t - h) must fit in an int64, larger races use exact integer math
+    if max(times) >= 2**31:
+        return [ _count_ways_exact(t, d) for t, d in zip(times, distances) ]
+
+    t = np.array(times, dtype=np.int64)
+    d = np.array(distances, dtype=np.int64)
+    disc = np.maximum(t * t - 4 * d, 0)
+
+    # floor of the square root, corrected for the rounding of the float root
+    r = np.floor(np.sqrt(disc.astype(np.float64))).astype(np.int64)
+    r += (r + 1) * (r + 1) <= disc
+    r -= r * r > disc
+
+    # lowest hold time that beats the record, at most a couple of steps
+    # away from the lower root
+    lo = (t - r) // 2
+    while (advance := (lo <= t - lo) & (lo * (t - lo) <= d)).any():
+        lo += advance
+
+    return np.maximum(t - 2 * lo + 1, 0).tolist()
+
+
+def _count_ways_exact(t: int, d: int) -> int:
+    lo = (t - isqrt(max(t * t - 4 * d, 0))) // 2
+    while lo <= t - lo and lo * (t - lo) <= d:
+        lo += 1
+
+    return max(t - 2 * lo + 1, 0)
+
+
+class _RaceSolver(IncrementalSolver):
+    """Counts the ways to win from a line of times followed by a line of
+    distances, the only lines of the input. Part two reads the numbers of
+    both lines as a single race."""
+
+    def __init__(self, part: int) -> None:
+        self._part = part
+        self._rows: list[list[str]] = []
+
+    def add_line(self, line: str) -> None:
+        if len(self._rows) == 2:
+            raise ValueError('Expected a line of times and a line of distances only.')
+        numbers = line.split(':')[1].split()
+        self._rows.append(numbers if self._part == 1 else [''.join(numbers)])
+
+    @property
+    def result(self) -> int:
+        if len(self._rows) < 2:
+            return 0
+        times, distances = self._rows
+        return prod(count_ways([ int(t) for t in times ], [ int(d) for d in distances ]))
 
 
 class Day6(Day):
+    _vectorized_parts = (1, 2)
 
     def __init__(self, puzzle_input: str | None = None) -> None:
         super().__init__(puzzle_input)
@@ -35,15 +109,20 @@ class Day6(Day):
     @property
     def day(self) -> int:
         return 6
+
+    def _parse(self) -> list[list[str]]:
+        # Time:      7  15   30      -> [['7', '15', '30'],
+        # Distance:  9  40  200          ['9', '40', '200']]
+        input_stripped = re.sub(r' +', ' ', self._puzzle_input)
+        return [
+            row.split(':')[1].split()
+            for row in input_stripped.split('\n')
+        ]
     
     def solve_part_one(self) -> Result:
-        input_stripped = re.sub(r' +', ' ', self._puzzle_input)
         matrix = [
-            [
-                int(n)
-                for n in row.split(':')[1].split()
-            ]
-            for row in input_stripped.split('\n')
+            [ int(n) for n in row ]
+            for row in self.parse()
         ]
         T = np.transpose(matrix)
 
@@ -63,11 +142,46 @@ class Day6(Day):
         return prod(num_ways_to_beat_record)
     
 
+    def _stream_solver(self, part: int) -> Optional[IncrementalSolver]:
+        return _RaceSolver(part)
+
+    @engine(1, 'closed-form')
+    def _solve_part_one_closed_form(self) -> Result:
+        return self._solve_many((self._input,), 1)[0]
+
+    @engine(2, 'closed-form')
+    def _solve_part_two_closed_form(self) -> Result:
+        return self._solve_many((self._input,), 2)[0]
+
+    @classmethod
+    def _solve_many(cls, inputs: tuple[str | PuzzleInput, ...], part: int) -> list[Result]:
+        # the races of every input are counted at once, the products are
+        # taken per input afterwards
+        times: list[int] = []
+        distances: list[int] = []
+        race_counts: list[int] = []
+        for puzzle_input in inputs:
+            time_row, distance_row = cls(puzzle_input).parse()
+            if part == 2:
+                time_row, distance_row = [''.join(time_row)], [''.join(distance_row)]
+
+            times.extend(int(n) for n in time_row)
+            distances.extend(int(n) for n in distance_row)
+            race_counts.append(len(time_row))
+
+        ways = count_ways(times, distances)
+        results: list[Result] = []
+        start = 0
+        for race_count in race_counts:
+            results.append(prod(ways[start:start + race_count]))
+            start += race_count
+
+        return results
+
     def solve_part_two(self) -> Result:
-        input_stripped = re.sub(r' +', ' ', self._puzzle_input)
         matrix = [
-            [int(''.join(row.split(':')[1].split()))]
-            for row in input_stripped.split('\n')
+            [int(''.join(row))]
+            for row in self.parse()
         ]
         T = np.transpose(matrix)
 
@@ -1,10 +1,11 @@
 from textwrap import dedent
 from adventofcode2023.day import Day, Result
+from adventofcode2023.incremental import IncrementalSolver, RankedSum
 
 from functools import cmp_to_key
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Type, Union
+from typing import Optional, Type, Union
 
 class HandType(Enum):
     FIVE_OF_A_KIND = auto()
@@ -17,10 +18,6 @@ class HandType(Enum):
 
     def strength(self) -> int:
         return len(HandType) - self.value + 1
-    
-
-assert HandType.FIVE_OF_A_KIND.strength() == 7
-assert HandType.HIGH_CARD.strength() == 1
 
 
 @dataclass
@@ -107,15 +104,6 @@ class BonusHandOfCards:
         else:
             self.type_ = HandType.HIGH_CARD
 
-
-assert HandOfCards('AAAAA').type_ == HandType.FIVE_OF_A_KIND
-assert HandOfCards('AA8AA').type_ == HandType.FOUR_OF_A_KIND
-assert HandOfCards('23332').type_ == HandType.FULL_HOUSE
-assert HandOfCards('TTT98').type_ == HandType.THREE_OF_A_KIND
-assert HandOfCards('23432').type_ == HandType.TWO_PAIR
-assert HandOfCards('A23A4').type_ == HandType.ONE_PAIR
-assert HandOfCards('23456').type_ == HandType.HIGH_CARD
-
 HOC = Union[HandOfCards, BonusHandOfCards]
 
 class Day7(Day):
@@ -129,6 +117,14 @@ class Day7(Day):
     def day(self) -> int:
         return 7
 
+    def _parse(self) -> list[tuple[str, int]]:
+        hands: list[tuple[str, int]] = []
+        for line in self._input.lines():
+            cards, bid = line.split()
+            hands.append((cards, int(bid)))
+
+        return hands
+
     def sort_hands_on_strength(self, a: tuple[HOC, int], b: tuple[HOC, int]) -> int:
         left, _  = a
         right, _ = b
@@ -148,15 +144,13 @@ class Day7(Day):
                 else:
                     return -1
 
+            return 0
+
     
     def solve_part_one(self) -> Result:
-        hands: list[tuple[HandOfCards, int]] = []
-        lines = self._puzzle_input.split('\n')
-        for line in lines:
-            cards, bid = line.split()
-            bid = int(bid)
-
-            hands.append((HandOfCards(cards), bid))
+        hands: list[tuple[HandOfCards, int]] = [
+            (HandOfCards(cards), bid) for cards, bid in self.parse()
+        ]
         
         total_winnings = 0
         for idx, hand_with_bid in enumerate(sorted(hands, key=cmp_to_key(self.sort_hands_on_strength))):
@@ -168,14 +162,30 @@ class Day7(Day):
         return total_winnings
 
 
-    def solve_part_two(self) -> Result:
-        hands: list[tuple[BonusHandOfCards, int]] = []
-        lines = self._puzzle_input.split('\n')
-        for line in lines:
+    def hand_key(self, hand: HOC) -> int:
+        """A key ordering hands the same as `sort_hands_on_strength`: the
+        strength of the type followed by the strength of every card, as the
+        digits of a number in base 13."""
+        key = hand.type_.strength()
+        for card in hand.cards:
+            key = key * len(self._cards) + self._strengths[card]
+        return key
+
+    def _incremental(self, part: int) -> Optional[IncrementalSolver]:
+        hand_cls = HandOfCards if part == 1 else BonusHandOfCards
+
+        def hand_with_bid(line: str) -> tuple[int, int]:
             cards, bid = line.split()
-            bid = int(bid)
+            return self.hand_key(hand_cls(cards)), int(bid)
+
+        # new hands are ranked among the hands so far, which moves every
+        # stronger hand one rank up
+        return RankedSum(hand_with_bid, (len(HandType) + 1) * len(self._cards) ** 5)
 
-            hands.append((BonusHandOfCards(cards), bid))
+    def solve_part_two(self) -> Result:
+        hands: list[tuple[BonusHandOfCards, int]] = [
+            (BonusHandOfCards(cards), bid) for cards, bid in self.parse()
+        ]
 
         total_winnings = 0
         for idx, hand_with_bid in enumerate(sorted(hands, key=cmp_to_key(self.sort_hands_on_strength))):
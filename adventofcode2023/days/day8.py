@@ -28,30 +28,29 @@ class Day8(Day):
 
         return instructions, network
 
+    def _parse(self) -> tuple[str, Network]:
+        return self.parse_input()
+
     def get_steps_to_end(self, instructions: str, network: Network) -> int:
-        steps = 1
+        steps = 0
         node = 'AAA'
-        while True:
-            
-            end_found = False
+        # the node at the start of every pass over the instructions, once one
+        # repeats the walk loops without ever reaching the end
+        seen: set[str] = set()
+        while node not in seen:
+            seen.add(node)
             for ins in instructions:
-
                 left_node, right_node = network[node]
                 node = right_node if ins == 'R' else left_node
+                steps += 1
 
                 if node == 'ZZZ':
-                    end_found = True
-                    break
-
-                steps += 1
-            
-            if end_found is True:
-                break
+                    return steps
 
-        return steps
+        raise ValueError('ZZZ can not be reached from AAA.')
     
     def solve_part_one(self) -> Result:
-        return self.get_steps_to_end(*self.parse_input())
+        return self.get_steps_to_end(*self.parse())
     
     def solve_part_two(self) -> Result:
         return 1
@@ -1,8 +1,13 @@
+from collections import defaultdict
 from copy import deepcopy
 from typing import Optional
-from adventofcode2023.day import Day, Result
 
-from math import dist
+import numpy as np
+from adventofcode2023.day import Day, Result, engine
+from adventofcode2023.incremental import IncrementalSolver, LineSum
+from adventofcode2023.puzzle_input import PuzzleInput
+
+from math import comb, dist
 
 def gcd(a: int, b: int) -> int:
     """The greatest common divisor, or gcd, of integers a and b, at least one which is nonzero, is the greatest positive integer d that is a divisor of both a and b. 
@@ -20,7 +25,22 @@ def gcd(a: int, b: int) -> int:
     return a
 
 
+def extrapolation_coefficients(n: int) -> list[int]:
+    """The next value of a sequence of length n, extrapolated by taking
+    differences until they are all zero, is the linear combination
+    sum((-1)^(n-1-i) * C(n, i) * seq[i]) of the sequence.
+
+    Args:
+        n (int): length of the sequence
+
+    Returns:
+        list[int]: coefficient of every value of the sequence
+    """
+    return [ (-1) ** (n - 1 - i) * comb(n, i) for i in range(n) ]
+
+
 class Day9(Day):
+    _vectorized_parts = (1, 2)
 
     def __init__(self, puzzle_input: str | None = None) -> None:
         super().__init__(puzzle_input)
@@ -36,22 +56,56 @@ class Day9(Day):
         
         return seq[-1] + Day9.get_last_value([ seq[i + 1] - seq[i] for i in range(len(seq) - 1) ])
     
-    def solve_part_one(self) -> Result:
-        sequences = [
+    def _parse(self) -> list[list[int]]:
+        return [
             [ int(n) for n in line.split() ] for line
-            in self._puzzle_input.split("\n") if line
+            in self._input.lines() if line
         ]
 
-        return sum(self.get_last_value(i) for i in sequences)
+    def solve_part_one(self) -> Result:
+        return sum(self.get_last_value(i) for i in self.parse())
 
     
     def solve_part_two(self) -> Result:
-        sequences = [
-            [ int(n) for n in line.split() ] for line
-            in self._puzzle_input.split("\n") if line
-        ]
-        
-        return sum(self.get_last_value(i[::-1]) for i in sequences)
+        return sum(self.get_last_value(i[::-1]) for i in self.parse())
+
+    def _incremental(self, part: int) -> Optional[IncrementalSolver]:
+        def value(line: str) -> int:
+            seq = [ int(n) for n in line.split() ]
+            return self.get_last_value(seq if part == 1 else seq[::-1])
+
+        return LineSum(value)
+
+    @engine(1, 'matrix')
+    def _solve_part_one_matrix(self) -> Result:
+        return self._solve_many((self._input,), 1)[0]
+
+    @engine(2, 'matrix')
+    def _solve_part_two_matrix(self) -> Result:
+        return self._solve_many((self._input,), 2)[0]
+
+    @classmethod
+    def _solve_many(cls, inputs: tuple[str | PuzzleInput, ...], part: int) -> list[Result]:
+        # sequences of every input are grouped by length, so every group is
+        # extrapolated with a single matrix product
+        by_length: defaultdict[int, list[list[int]]] = defaultdict(list)
+        owners: defaultdict[int, list[int]] = defaultdict(list)
+        for idx, puzzle_input in enumerate(inputs):
+            for seq in cls(puzzle_input).parse():
+                by_length[len(seq)].append(seq if part == 1 else seq[::-1])
+                owners[len(seq)].append(idx)
+
+        totals = [0] * len(inputs)
+        for n, sequences in by_length.items():
+            # the coefficients add up to 2^n in absolute value, fall back to
+            # python integers when the products could overflow an int64
+            largest = max(abs(v) for seq in sequences for v in seq)
+            dtype = np.int64 if largest < 2 ** (62 - n) else object
+            values = np.array(sequences, dtype=dtype) @ np.array(extrapolation_coefficients(n), dtype=dtype)
+            for idx, value in zip(owners[n], values.tolist()):
+                totals[idx] += value
+
+        return list(totals)
 
 
 if __name__ == '__main__':
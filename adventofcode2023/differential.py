@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterable, Optional
+
+from adventofcode2023.day import DEFAULT_ENGINE, REFERENCE_ENGINE, Day, Result
+from adventofcode2023.days import get_day
+
+# Differential testing of the engines of a part, see `adventofcode2023.day.engine`.
+# Every engine solves the same generated inputs as the reference engine of the
+# part, which is the engine named REFERENCE_ENGINE if the day registers one and
+# the default engine otherwise. Any difference in results is a mismatch.
+# Engines registered with a `max_scale` are left out of larger inputs, in which
+# case the default engine is the reference of a part whose reference is too slow.
+
+
+class EngineMismatch(Exception):
+
+    def __init__(self, comparisons: list['Comparison']) -> None:
+        lines = [
+            f"day {c.day} part {c.part} scale {c.scale:g} seed {c.seed}"
+            f"{f' variant {c.variant}' if c.variant is not None else ''}: "
+            f"{c.reference}={c.results[c.reference]!r} but " +
+            ', '.join( f"{name}={result!r}" for name, result in c.mismatches().items() )
+            for c in comparisons
+        ]
+        super().__init__('\n'.join(lines))
+        self.comparisons = comparisons
+
+
+def reference_engine(day_cls: type[Day], part: int, scale: Optional[float] = None) -> str:
+    engines = day_cls.engines(part, scale)
+    return REFERENCE_ENGINE if REFERENCE_ENGINE in engines else DEFAULT_ENGINE
+
+
+@dataclass
+class Comparison:
+    """Results and wall times of every engine of a part on one generated input."""
+    day: int
+    part: int
+    scale: float
+    seed: int
+    input_bytes: int
+    reference: str
+    results: dict[str, Result] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    variant: Optional[str] = None
+
+    def mismatches(self) -> dict[str, Result]:
+        expected = self.results[self.reference]
+        return { name: result for name, result in self.results.items() if result != expected }
+
+    def speedups(self) -> dict[str, float]:
+        """Wall time of the reference engine relative to every other engine."""
+        reference_time = self.timings[self.reference]
+        return {
+            name: reference_time / time if time > 0 else float('inf')
+            for name, time in self.timings.items() if name != self.reference
+        }
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'day': self.day,
+            'part': self.part,
+            'scale': self.scale,
+            'seed': self.seed,
+            'variant': self.variant,
+            'input_bytes': self.input_bytes,
+            'reference': self.reference,
+            'results': self.results,
+            'timings': self.timings,
+            'speedups': self.speedups(),
+            'mismatches': self.mismatches(),
+        }
+
+
+def compare(day: int, part: int, scale: float = 1, seed: int = 0, variant: Optional[str] = None) -> Comparison:
+    """Solve a generated input with every engine of a part. Every engine
+    parses the input on its own, so timings include parsing.
+
+    Args:
+        day (int): day to compare the engines of
+        part (int): part to compare the engines of
+        scale (float): size of the input relative to a real puzzle input
+        seed (int): seed of the generated input
+        variant (Optional[str]): variant of the generated input, see `generators.VARIANTS`
+
+    Returns:
+        Comparison: results and timings of every engine fast enough for the scale
+    """
+    from adventofcode2023.generators import generate
+
+    day_cls = get_day(day)
+    puzzle_input = generate(day, scale, seed, variant)
+    comparison = Comparison(
+        day, part, scale, seed, len(puzzle_input.encode()), reference_engine(day_cls, part, scale), variant=variant
+    )
+    for name in day_cls.engines(part, scale):
+        start = perf_counter()
+        comparison.results[name] = day_cls(puzzle_input).solve(part, name)
+        comparison.timings[name] = perf_counter() - start
+
+    return comparison
+
+
+def differential(
+    day: int,
+    part: int,
+    scales: Iterable[float] = (0.1, 0.5, 1),
+    seeds: Iterable[int] = range(3),
+    variant: Optional[str] = None
+) -> list[Comparison]:
+    """Compare the engines of a part on generated inputs of every scale and seed.
+
+    Args:
+        day (int): day to compare the engines of
+        part (int): part to compare the engines of
+        scales (Iterable[float]): sizes of the inputs relative to a real puzzle input
+        seeds (Iterable[int]): seeds of the inputs of every size
+        variant (Optional[str]): variant of the generated inputs, see `generators.VARIANTS`
+
+    Raises:
+        EngineMismatch: if an engine disagrees with the reference engine on any input
+
+    Returns:
+        list[Comparison]: results and timings of every input
+    """
+    seeds = list(seeds)
+    comparisons = [ compare(day, part, scale, seed, variant) for scale in scales for seed in seeds ]
+    if failed := [ c for c in comparisons if c.mismatches() ]:
+        raise EngineMismatch(failed)
+
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Table of the median speedup of every engine per input size, or - for
+    an engine that was not run on inputs of a size."""
+    from statistics import median
+
+    engines = list(dict.fromkeys( name for c in comparisons for name in c.speedups() ))
+    header = ('scale', 'bytes', 'reference', *engines)
+    rows: list[tuple[str, ...]] = [header]
+
+    by_scale: dict[float, list[Comparison]] = {}
+    for comparison in comparisons:
+        by_scale.setdefault(comparison.scale, []).append(comparison)
+
+    for scale, group in by_scale.items():
+        speedups = [ c.speedups() for c in group ]
+        rows.append((
+            f"{scale:g}",
+            str(int(median( c.input_bytes for c in group ))),
+            f"{median( c.timings[c.reference] for c in group ) * 1000:.3f}ms",
+            *(
+                f"{median( s[name] for s in speedups if name in s ):.2f}x"
+                if any( name in s for s in speedups ) else '-'
+                for name in engines
+            )
+        ))
+
+    widths = [ max(len(row[i]) for row in rows) for i in range(len(header)) ]
+    return '\n'.join(
+        '  '.join(cell.rjust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
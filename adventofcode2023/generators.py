@@ -0,0 +1,477 @@
+"""Generators of synthetic puzzle inputs, used to measure how the solvers scale.
+
+Every generator produces a valid input for its day from a seeded random number
+generator and a scale factor. Scale 1 produces an input of roughly the size of
+a real puzzle input, and the size of the input grows linearly with the scale:
+line based days get `scale` times as many lines and grid based days get grids
+with `scale` times as many cells, so scale 100 turns a 100x100 grid into a
+1000x1000 grid.
+"""
+from itertools import product
+from math import sqrt
+from random import Random
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import Callable, Iterator, Optional
+
+Generator = Callable[[Random, float], str]
+
+GENERATORS: dict[int, Generator] = {}
+# generators of inputs with a shape that is hard for some of the solvers of a
+# day, such as inputs that defeat a shortcut, by day and name of the variant
+VARIANTS: dict[tuple[int, str], Generator] = {}
+
+
+def generator(day: int, variant: Optional[str] = None) -> Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        if variant is None:
+            GENERATORS[day] = func
+        else:
+            VARIANTS[(day, variant)] = func
+        return func
+
+    return register
+
+
+def generate(day: int, scale: float = 1, seed: int = 0, variant: Optional[str] = None) -> str:
+    """Generate a puzzle input.
+
+    Args:
+        day (int): day to generate the input for
+        scale (float): size of the input relative to a real puzzle input
+        seed (int): seed of the random number generator
+        variant (Optional[str]): name of a variant of the inputs of the day,
+            see VARIANTS, defaults to inputs shaped like a real puzzle input
+
+    Raises:
+        ValueError: if there is no generator for the day or variant
+
+    Returns:
+        str: the puzzle input
+    """
+    if variant is not None:
+        if (day, variant) not in VARIANTS:
+            raise ValueError(f"No generator for variant {variant} of day {day}.")
+        return VARIANTS[(day, variant)](Random(seed), scale)
+
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}.")
+
+    return GENERATORS[day](Random(seed), scale)
+
+
+def _count(scale: float, base: int) -> int:
+    return max(1, round(base * scale))
+
+
+def _side(scale: float, base: int, minimum: int = 4) -> int:
+    return max(minimum, round(base * sqrt(scale)))
+
+
+def _grid(rng: Random, side: int, chars: str, weights: list[float]) -> str:
+    return '\n'.join(
+        ''.join(rng.choices(chars, weights, k=side))
+        for _ in range(side)
+    )
+
+
+def _names(exclude: set[str]) -> Iterator[str]:
+    """Unique lowercase names: a, b, ..., z, aa, ab, ..."""
+    length = 1
+    while True:
+        for p in product(ascii_lowercase, repeat=length):
+            if (name := ''.join(p)) not in exclude:
+                yield name
+        length += 1
+
+
+@generator(1)
+def _day1(rng: Random, scale: float) -> str:
+    words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    lines: list[str] = []
+    for _ in range(_count(scale, 1000)):
+        tokens = [
+            rng.choice(words) if r < 0.2 else rng.choice(digits[1:]) if r < 0.35 else rng.choice(ascii_lowercase)
+            for r in (rng.random() for _ in range(rng.randint(2, 20)))
+        ]
+        # every line has at least one digit
+        tokens.insert(rng.randint(0, len(tokens)), rng.choice(digits[1:]))
+        lines.append(''.join(tokens))
+
+    return '\n'.join(lines)
+
+
+@generator(2)
+def _day2(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for game_id in range(1, _count(scale, 100) + 1):
+        grabs = [
+            ', '.join(
+                f"{rng.randint(1, 15)} {color}"
+                for color in rng.sample(['red', 'green', 'blue'], rng.randint(1, 3))
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        lines.append(f"Game {game_id}: {'; '.join(grabs)}")
+
+    return '\n'.join(lines)
+
+
+@generator(3)
+def _day3(rng: Random, scale: float) -> str:
+    side = _side(scale, 140)
+    rows: list[str] = []
+    for _ in range(side):
+        row = ''
+        while len(row) < side:
+            r = rng.random()
+            if r < 0.1:
+                row += str(rng.randint(1, 999)) + '.'
+            elif r < 0.15:
+                row += rng.choice('*#+$/@%=&-')
+            else:
+                row += '.'
+        rows.append(row[:side])
+
+    return '\n'.join(rows)
+
+
+@generator(4)
+def _day4(rng: Random, scale: float) -> str:
+    # Most cards do not win, so the amount of copies won in part two stays
+    # bounded instead of growing exponentially with the amount of cards.
+    lines: list[str] = []
+    for number in range(1, _count(scale, 200) + 1):
+        winning = rng.sample(range(1, 100), 10)
+        matches = 0 if rng.random() < 0.85 else rng.randint(1, 4)
+        others = [ n for n in range(1, 100) if n not in winning ]
+        yours = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(yours)
+
+        winning_line = ' '.join(f"{n:2}" for n in winning)
+        yours_line = ' '.join(f"{n:2}" for n in yours)
+        lines.append(f"Card {number:3}: {winning_line} | {yours_line}")
+
+    return '\n'.join(lines)
+
+
+@generator(5)
+def _day5(rng: Random, scale: float) -> str:
+    upper = 2**32
+    # seed ranges shrink fast with the scale, so that the seeds of small
+    # inputs can still be mapped one by one
+    max_length = max(1, round(10**9 * min(scale, 1) ** 4))
+    seeds: list[int] = []
+    for _ in range(_count(scale, 10)):
+        start = rng.randrange(upper)
+        seeds += [start, rng.randint(1, min(upper - start, max_length))]
+
+    parts = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+    for src_name, dst_name in zip(names, names[1:]):
+
+        # split the source space into disjoint ranges, most of which are mapped
+        cuts = sorted(rng.sample(range(1, upper), _count(scale, 30) * 2))
+        lines = [f"{src_name}-to-{dst_name} map:"]
+        for src_start, src_end in zip(cuts[::2], cuts[1::2]):
+            length = src_end - src_start
+            lines.append(f"{rng.randrange(upper - length)} {src_start} {length}")
+
+        parts.append('\n'.join(lines))
+
+    return '\n\n'.join(parts)
+
+
+@generator(5, 'adversarial')
+def _day5_adversarial(rng: Random, scale: float) -> str:
+    # Every layer cuts the numbers into many small blocks and shuffles them,
+    # so composing the layers fragments the map, seed ranges split at every
+    # layer, and with few seeds their lowest location is far from zero.
+    upper = 2**32
+    seeds: list[int] = []
+    for _ in range(_count(scale, 40)):
+        start = rng.randrange(upper - 1000)
+        seeds += [start, rng.randint(1, 1000)]
+
+    parts = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ['seed', 'soil', 'fertilizer', 'water', 'light', 'temperature', 'humidity', 'location']
+    for src_name, dst_name in zip(names, names[1:]):
+        cuts = [0, *sorted(rng.sample(range(1, upper), _count(scale, 100))), upper]
+        blocks = list(zip(cuts, cuts[1:]))
+        destinations = blocks[:]
+        rng.shuffle(destinations)
+
+        # the blocks keep their length, so every number maps to a unique number
+        lines = [f"{src_name}-to-{dst_name} map:"]
+        dst_start = 0
+        for src_start, src_end in destinations:
+            lines.append(f"{dst_start} {src_start} {src_end - src_start}")
+            dst_start += src_end - src_start
+
+        parts.append('\n'.join(lines))
+
+    return '\n\n'.join(parts)
+
+
+@generator(6)
+def _day6(rng: Random, scale: float) -> str:
+    times: list[int] = []
+    distances: list[int] = []
+    for _ in range(_count(scale, 4)):
+        time = rng.randint(7, 100)
+        times.append(time)
+        # the record can always be beaten by holding the button for half the race
+        distances.append(rng.randrange((time // 2) * (time - time // 2)))
+
+    return (
+        "Time:     " + ' '.join(f"{n:4}" for n in times) + "\n" +
+        "Distance: " + ' '.join(f"{n:4}" for n in distances)
+    )
+
+
+@generator(7)
+def _day7(rng: Random, scale: float) -> str:
+    hands = [ ''.join(rng.choices('AKQJT98765432', k=5)) for _ in range(_count(scale, 1000)) ]
+    return '\n'.join(f"{hand} {rng.randint(1, 1000)}" for hand in hands)
+
+
+@generator(8)
+def _day8(rng: Random, scale: float) -> str:
+    # Node i always has one edge to node i + 1 and one edge to either itself
+    # or node i + 1. Since the instructions contain both L and R, every pass
+    # over the instructions moves at least one node closer to ZZZ.
+    names = [ ''.join(p) for p in product(ascii_uppercase, repeat=3) if p not in (tuple('AAA'), tuple('ZZZ')) ]
+    count = min(max(2, _count(scale, 750)), len(names) + 2)
+    nodes = ['AAA'] + rng.sample(names, count - 2) + ['ZZZ']
+
+    lines: list[str] = []
+    for i, node in enumerate(nodes[:-1]):
+        edges = [nodes[i + 1], rng.choice([node, nodes[i + 1]])]
+        rng.shuffle(edges)
+        lines.append(f"{node} = ({edges[0]}, {edges[1]})")
+
+    lines.append("ZZZ = (ZZZ, ZZZ)")
+    rng.shuffle(lines)
+
+    instructions = ['L', 'R'] + rng.choices('LR', k=max(0, _count(scale, 270) - 2))
+    rng.shuffle(instructions)
+    return ''.join(instructions) + '\n\n' + '\n'.join(lines)
+
+
+@generator(9)
+def _day9(rng: Random, scale: float) -> str:
+    lines: list[str] = []
+    for _ in range(_count(scale, 200)):
+        coefficients = [ rng.randint(-9, 9) for _ in range(rng.randint(1, 6)) ]
+        values = [
+            sum(c * x**k for k, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(' '.join(map(str, values)))
+
+    return '\n'.join(lines)
+
+
+@generator(10)
+def _day10(rng: Random, scale: float) -> str:
+    # A loop that snakes through every tile but the border of the grid:
+    # down the first column, right along the last row, and then up and down
+    # through the remaining columns back to the start.
+    side = _side(scale, 140, minimum=5)
+    c0, r0, r1 = 1, 1, side - 2
+    c1 = side - 2 if (side - 3) % 2 == 1 else side - 3
+
+    path = [ (c0, r) for r in range(r0, r1 + 1) ]
+    path += [ (c, r1) for c in range(c0 + 1, c1 + 1) ]
+    path += [ (c1, r) for r in range(r1 - 1, r0 - 1, -1) ]
+    for j, c in enumerate(range(c1 - 1, c0, -1)):
+        rows = range(r0, r1) if j % 2 == 0 else range(r1 - 1, r0 - 1, -1)
+        path += [ (c, r) for r in rows ]
+
+    pipes = {
+        frozenset([(0, -1), (0, 1)]): '|',
+        frozenset([(-1, 0), (1, 0)]): '-',
+        frozenset([(0, -1), (1, 0)]): 'L',
+        frozenset([(0, -1), (-1, 0)]): 'J',
+        frozenset([(-1, 0), (0, 1)]): '7',
+        frozenset([(1, 0), (0, 1)]): 'F',
+    }
+    grid = [ rng.choices('|-LJ7F.', k=side) for _ in range(side) ]
+    for i, (x, y) in enumerate(path):
+        (px, py), (nx, ny) = path[i - 1], path[(i + 1) % len(path)]
+        grid[y][x] = pipes[frozenset([(px - x, py - y), (nx - x, ny - y)])]
+
+    grid[r0][c0] = 'S'
+    # pipes next to the start that are not part of the loop may not connect to it
+    grid[r0][c0 - 1] = grid[r0 - 1][c0] = '.'
+    for x in range(c1 + 1, side):
+        for y in range(r0, r1 + 1):
+            grid[y][x] = '.'
+
+    return '\n'.join(''.join(row) for row in grid)
+
+
+@generator(11)
+def _day11(rng: Random, scale: float) -> str:
+    side = _side(scale, 140)
+    empty_rows = set(rng.sample(range(side), max(1, side // 20)))
+    empty_columns = set(rng.sample(range(side), max(1, side // 20)))
+    return '\n'.join(
+        ''.join(
+            '#' if y not in empty_rows and x not in empty_columns and rng.random() < 0.02 else '.'
+            for x in range(side)
+        )
+        for y in range(side)
+    )
+
+
+@generator(12)
+def _day12(rng: Random, scale: float) -> str:
+    from itertools import groupby
+
+    lines: list[str] = []
+    for _ in range(_count(scale, 1000)):
+        row = ''.join(rng.choices('#.', k=rng.randint(5, 20)))
+        if '#' not in row:
+            row = '#' + row[1:]
+        groups = [ len(list(g)) for c, g in groupby(row) if c == '#' ]
+
+        # hide at most 14 springs, so the amount of arrangements stays enumerable
+        hidden = rng.sample(range(len(row)), min(len(row), rng.randint(1, 14)))
+        springs = ''.join( '?' if i in hidden else c for i, c in enumerate(row) )
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+
+    return '\n'.join(lines)
+
+
+@generator(13)
+def _day13(rng: Random, scale: float) -> str:
+    patterns: list[str] = []
+    for _ in range(_count(scale, 100)):
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = [ rng.choices('#.', k=width) for _ in range(height) ]
+
+        if rng.random() < 0.5:
+            # mirror the columns left of k onto the columns right of it
+            k = rng.randint(1, width - 1)
+            for row in rows:
+                for j in range(min(k, width - k)):
+                    row[k + j] = row[k - 1 - j]
+        else:
+            k = rng.randint(1, height - 1)
+            for j in range(min(k, height - k)):
+                rows[k + j] = list(rows[k - 1 - j])
+
+        patterns.append('\n'.join(''.join(row) for row in rows))
+
+    return '\n\n'.join(patterns)
+
+
+@generator(14)
+def _day14(rng: Random, scale: float) -> str:
+    return _grid(rng, _side(scale, 100), 'O#.', [0.2, 0.1, 0.7])
+
+
+@generator(15)
+def _day15(rng: Random, scale: float) -> str:
+    steps: list[str] = []
+    for _ in range(_count(scale, 4000)):
+        label = ''.join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+
+    return ','.join(steps)
+
+
+@generator(16)
+def _day16(rng: Random, scale: float) -> str:
+    return _grid(rng, _side(scale, 110), '.|-\\/', [0.9, 0.025, 0.025, 0.025, 0.025])
+
+
+@generator(17)
+def _day17(rng: Random, scale: float) -> str:
+    return _grid(rng, _side(scale, 141), '123456789', [1.0] * 9)
+
+
+@generator(18)
+def _day18(rng: Random, scale: float) -> str:
+    # A skyline: a top edge that walks right while stepping up and down,
+    # closed by the right, bottom and left edges. Its edges never cross.
+    heights: list[int] = []
+    widths: list[int] = []
+    for _ in range(_count(scale, 350)):
+        height = rng.randint(2, 50)
+        if heights and heights[-1] == height:
+            widths[-1] += rng.randint(2, 10)
+        else:
+            heights.append(height)
+            widths.append(rng.randint(2, 10))
+
+    operations = [('R', widths[0])]
+    for previous, height, width in zip(heights, heights[1:], widths[1:]):
+        operations.append(('U', height - previous) if height > previous else ('D', previous - height))
+        operations.append(('R', width))
+    operations += [('D', heights[-1]), ('L', sum(widths)), ('U', heights[0])]
+
+    return '\n'.join(
+        f"{direction} {meters} (#{rng.randrange(16**6):06x})"
+        for direction, meters in operations
+    )
+
+
+@generator(19)
+def _day19(rng: Random, scale: float) -> str:
+    # workflows form a tree rooted at `in`, so every part ends up accepted or rejected
+    names = _names(exclude={'in'})
+    budget = _count(scale, 550) - 1
+    queue = ['in']
+    workflows: list[str] = []
+    while queue:
+        name = queue.pop(0)
+        targets: list[str] = []
+        for _ in range(rng.randint(2, 4)):
+            if budget > 0 and rng.random() < 0.7:
+                targets.append(next(names))
+                queue.append(targets[-1])
+                budget -= 1
+            else:
+                targets.append(rng.choice('AR'))
+
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+            for target in targets[:-1]
+        ]
+        workflows.append(f"{name}{{{','.join(rules + targets[-1:])}}}")
+
+    rng.shuffle(workflows)
+    ratings = [
+        "{" + ','.join(f"{c}={rng.randint(1, 4000)}" for c in 'xmas') + "}"
+        for _ in range(_count(scale, 200))
+    ]
+    return '\n'.join(workflows) + '\n\n' + '\n'.join(ratings)
+
+
+@generator(20)
+def _day20(rng: Random, scale: float) -> str:
+    # Like the real inputs: the broadcaster starts chains of 12 flip-flops that
+    # count button presses, a conjunction per chain watches a subset of the bits,
+    # and the inverted outputs of those conjunctions feed the conjunction before rx.
+    names = _names(exclude={'rx'})
+    final = next(names)
+    lines = [f"&{final} -> rx"]
+    starts: list[str] = []
+    for _ in range(_count(scale, 4)):
+        flipflops = [ next(names) for _ in range(12) ]
+        conjunction, inverter = next(names), next(names)
+        starts.append(flipflops[0])
+
+        bits = [True] + [ rng.random() < 0.5 for _ in range(10) ] + [True]
+        for i, flipflop in enumerate(flipflops):
+            destinations = flipflops[i + 1:i + 2] + ([conjunction] if bits[i] else [])
+            lines.append(f"%{flipflop} -> {', '.join(destinations)}")
+
+        feedback = [ f for f, bit in zip(flipflops, bits) if not bit ] + [flipflops[0]]
+        lines.append(f"&{conjunction} -> {', '.join(feedback + [inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(lines)
+    return '\n'.join(lines)
@@ -0,0 +1,147 @@
+from typing import Iterator, Optional
+
+import numpy as np
+from adventofcode2023.puzzle_input import Buffer, PuzzleInput
+
+# Grids are 2D `uint8` arrays of the characters of a puzzle input, indexed
+# as grid[y, x]. Parsing a grid does not copy the input: the rows are a
+# strided view over the buffer of the input, stepping over the newline that
+# ends every row, so a grid costs one byte per cell and nothing to build.
+# The views are read-only, days that mutate a grid copy it first.
+
+NEWLINE = ord('\n')
+_CHUNK = 2**16
+DIGITS = '0123456789'
+
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, 1), (1, -1))
+
+
+def parse(data: Buffer | PuzzleInput | str) -> np.ndarray:
+    """Parse a puzzle input made up of lines of equal length into a grid.
+
+    Args:
+        data (Buffer | PuzzleInput | str): the puzzle input
+
+    Raises:
+        ValueError: if the lines are not of equal length
+
+    Returns:
+        np.ndarray: read-only view of the input of shape (rows, columns)
+    """
+    buffer = _buffer(data)
+    return _view(buffer, np.frombuffer(buffer, dtype=np.uint8), 0, len(buffer))
+
+
+def parse_many(data: Buffer | PuzzleInput | str) -> list[np.ndarray]:
+    """Parse a puzzle input of grids separated by empty lines, see `parse`.
+
+    Args:
+        data (Buffer | PuzzleInput | str): the puzzle input
+
+    Returns:
+        list[np.ndarray]: read-only view of every grid
+    """
+    buffer = _buffer(data)
+    flat = np.frombuffer(buffer, dtype=np.uint8)
+
+    grids: list[np.ndarray] = []
+    start = 0
+    while (end := buffer.find(b'\n\n', start)) != -1:
+        grids.append(_view(buffer, flat, start, end))
+        start = end + 2
+
+    grids.append(_view(buffer, flat, start, len(buffer)))
+    return grids
+
+
+def _buffer(data: Buffer | PuzzleInput | str) -> Buffer:
+    if isinstance(data, PuzzleInput):
+        return data.buffer
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+
+def _view(buffer: Buffer, flat: np.ndarray, start: int, end: int) -> np.ndarray:
+    if end > start and flat[end - 1] == NEWLINE:
+        end -= 1
+    if end == start:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    width = buffer.find(b'\n', start, end)
+    width = (width if width != -1 else end) - start
+    rows, remainder = divmod(end - start + 1, width + 1)
+
+    # every row must end at a newline, and there may be no other newlines.
+    # Counted in chunks so validating does not allocate a mask of the grid.
+    block = flat[start:end]
+    newlines = sum(
+        np.count_nonzero(block[i:i + _CHUNK] == NEWLINE)
+        for i in range(0, len(block), _CHUNK)
+    )
+    if remainder or newlines != rows - 1:
+        raise ValueError("Lines of a grid must be of equal length.")
+
+    return np.lib.stride_tricks.as_strided(block, shape=(rows, width), strides=(width + 1, 1), writeable=False)
+
+
+def from_string(s: str) -> np.ndarray:
+    """Writable grid of a string, meant for tests and examples."""
+    return parse(s).copy()
+
+
+def to_string(grid: np.ndarray) -> str:
+    return '\n'.join( row.tobytes().decode() for row in grid )
+
+
+def in_bounds(grid: np.ndarray, y: int, x: int) -> bool:
+    rows, columns = grid.shape
+    return 0 <= y < rows and 0 <= x < columns
+
+
+def neighbours(grid: np.ndarray, y: int, x: int, diagonal: bool = False) -> Iterator[tuple[int, int]]:
+    """Locations next to a location that lie within the grid.
+
+    Args:
+        grid (np.ndarray): the grid
+        y (int): row of the location
+        x (int): column of the location
+        diagonal (bool): include the diagonal neighbours
+
+    Yields:
+        Iterator[tuple[int, int]]: (y, x) of every neighbour
+    """
+    rows, columns = grid.shape
+    for dy, dx in ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL:
+        if 0 <= y + dy < rows and 0 <= x + dx < columns:
+            yield y + dy, x + dx
+
+
+def char_class(chars: str) -> np.ndarray:
+    """Lookup table of a set of characters, indexing it with a grid gives the
+    mask of the cells holding one of the characters."""
+    table = np.zeros(256, dtype=np.bool_)
+    table[list(chars.encode())] = True
+    return table
+
+
+def mask(grid: np.ndarray, chars: str) -> np.ndarray:
+    """Boolean mask of the cells holding one of the characters."""
+    return char_class(chars)[grid]
+
+
+def find(grid: np.ndarray, char: str) -> Optional[tuple[int, int]]:
+    """(y, x) of the first cell holding a character, row by row."""
+    matches = grid == ord(char)
+    idx = int(np.argmax(matches))
+    if not matches.flat[idx]:
+        return None
+
+    y, x = divmod(idx, grid.shape[1])
+    return y, x
+
+
+def digits(grid: np.ndarray) -> np.ndarray:
+    """Grid of single digits as their values."""
+    return grid - ord('0')
@@ -0,0 +1,108 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+
+# Solvers of parts whose answer can be kept up to date while lines are
+# appended to the puzzle input, see `Day.incremental`. Adding a line costs the
+# same no matter how many lines came before it, up to a logarithmic factor.
+
+
+class IncrementalSolver(ABC):
+    """The answer of a part, updated one appended line of input at a time."""
+
+    @abstractmethod
+    def add_line(self, line: str) -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def result(self) -> int:
+        ...
+
+    def feed(self, lines: Iterable[str]) -> int:
+        """Add appended lines of input, skipping empty lines.
+
+        Args:
+            lines (Iterable[str]): lines appended to the puzzle input
+
+        Returns:
+            int: the answer for the whole input so far
+        """
+        for line in lines:
+            if line:
+                self.add_line(line)
+        return self.result
+
+
+class LineSum(IncrementalSolver):
+    """Answer that is the sum of a value computed from every line on its own."""
+
+    def __init__(self, value: Callable[[str], int]) -> None:
+        self._value = value
+        self._total = 0
+
+    def add_line(self, line: str) -> None:
+        self._total += self._value(line)
+
+    @property
+    def result(self) -> int:
+        return self._total
+
+
+class _FenwickTree:
+    """Prefix sums over int keys in range(size). Only the nodes that were
+    updated are stored, so memory grows with the amount of keys added and not
+    with the size of the key space."""
+
+    __slots__ = ('_size', '_tree')
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._tree: dict[int, int] = {}
+
+    def add(self, key: int, value: int) -> None:
+        i = key + 1
+        tree = self._tree
+        while i <= self._size:
+            tree[i] = tree.get(i, 0) + value
+            i += i & -i
+
+    def prefix_sum(self, key: int) -> int:
+        """Sum of the values of keys below `key`."""
+        i = key
+        total = 0
+        tree = self._tree
+        while i > 0:
+            total += tree.get(i, 0)
+            i -= i & -i
+        return total
+
+
+class RankedSum(IncrementalSolver):
+    """Sum of rank * weight over items ranked by a key, the item with the
+    lowest key having rank 1. A new item moves every item with a higher key
+    one rank up, which adds their weights to the sum, so adding an item takes
+    two prefix sums instead of ranking every item again. Keys are ints in
+    range(size). Items with equal keys are ranked in the order they were
+    added, like a stable sort does."""
+
+    def __init__(self, item: Callable[[str], tuple[int, int]], size: int) -> None:
+        self._item = item
+        self._counts = _FenwickTree(size)
+        self._weights = _FenwickTree(size)
+        self._total_weight = 0
+        self._total = 0
+
+    def add_line(self, line: str) -> None:
+        key, weight = self._item(line)
+        # ranked after every earlier item with an equal key
+        rank = self._counts.prefix_sum(key + 1) + 1
+        higher_weights = self._total_weight - self._weights.prefix_sum(key + 1)
+
+        self._total += rank * weight + higher_weights
+        self._total_weight += weight
+        self._counts.add(key, 1)
+        self._weights.add(key, weight)
+
+    @property
+    def result(self) -> int:
+        return self._total
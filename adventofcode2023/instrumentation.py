@@ -0,0 +1,256 @@
+import json
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from math import inf
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ContextManager, Iterator, Optional, Protocol
+
+Record = dict[str, Any]
+
+
+class Sink(Protocol):
+
+    def emit(self, record: Record) -> None:
+        ...
+
+
+class MemorySink:
+    """Keeps every record in memory, meant for tests."""
+
+    def __init__(self) -> None:
+        self.records: list[Record] = []
+
+    def emit(self, record: Record) -> None:
+        self.records.append(record)
+
+
+class NullSink:
+    """Drops every record, for when only budgets are enforced."""
+
+    def emit(self, record: Record) -> None:
+        pass
+
+
+class JsonLinesSink:
+    """Appends every record as a line of JSON to a file. The file is opened
+    per record so the sink can be shared by worker processes."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def emit(self, record: Record) -> None:
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+
+
+@dataclass
+class Budget:
+    """Wall time and resident memory a part may use before it is cancelled.
+    `None` leaves a resource unlimited."""
+    seconds: Optional[float] = None
+    max_rss: Optional[int] = None
+
+
+class BudgetExceeded(Exception):
+    """Raised at a checkpoint of a solver that ran out of its budget. Carries
+    the counters collected so far by the phases that were running."""
+
+    def __init__(self, message: str, counters: dict[str, int]) -> None:
+        super().__init__(message)
+        self.counters = counters
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes. Falls back to the peak
+    resident set size on systems without `/proc`."""
+    try:
+        with open('/proc/self/statm') as f:
+            import os
+
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+
+        # kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class _Phase:
+    name: str
+    start: float
+    counters: dict[str, int] = field(default_factory=dict)
+    memory_start: int = 0
+    peak_memory: int = 0
+
+
+class Instrumentation:
+    """Times phases of a day (parsing and solving a part), optionally traces
+    their peak memory usage with `tracemalloc`, and collects counters that
+    solvers bump while a phase is running. Every finished phase is emitted as
+    one record to the sink:
+
+        {'day': 16, 'phase': 'part1', 'seconds': 0.12,
+         'peak_memory': 123456, 'counters': {'queue_pushes': 17000}}
+
+    `peak_memory` is None when memory is not traced. Counters are attributed
+    to the innermost running phase.
+
+    Budgets are enforced cooperatively: while a budget set with `limit` is
+    active, every `count` and `checkpoint` made by a solver checks it, and
+    raises `BudgetExceeded` once it is exceeded. The phases that were running
+    still emit their records, with the counters collected up to that point.
+    """
+
+    # reading the resident set size is a system call, so it is read at most
+    # this often while time is compared on every checkpoint
+    RSS_INTERVAL = 0.01
+
+    def __init__(self, sink: Sink, trace_memory: bool = False) -> None:
+        self._sink = sink
+        self._trace_memory = trace_memory
+        self._stack: list[_Phase] = []
+        self._started_tracing = False
+        self._budget: Optional[Budget] = None
+        self._deadline = inf
+        self._next_rss_check = inf
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self._stack:
+            counters = self._stack[-1].counters
+            counters[name] = counters.get(name, 0) + n
+        if self._budget is not None:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Point in a long running loop at which the solver may be cancelled.
+
+        Raises:
+            BudgetExceeded: if the active budget is exceeded
+        """
+        if self._budget is None:
+            return
+
+        now = perf_counter()
+        if now > self._deadline:
+            raise BudgetExceeded(f"exceeded the time budget of {self._budget.seconds}s", self._counters())
+
+        if now > self._next_rss_check:
+            self._next_rss_check = now + self.RSS_INTERVAL
+            assert self._budget.max_rss is not None
+            if (rss := current_rss()) > self._budget.max_rss:
+                raise BudgetExceeded(
+                    f"exceeded the memory budget of {self._budget.max_rss / 2**20:.1f}MiB "
+                    f"with {rss / 2**20:.1f}MiB resident",
+                    self._counters()
+                )
+
+    def _counters(self) -> dict[str, int]:
+        counters: dict[str, int] = {}
+        for phase in self._stack:
+            for name, n in phase.counters.items():
+                counters[name] = counters.get(name, 0) + n
+        return counters
+
+    @contextmanager
+    def limit(self, budget: Budget) -> Iterator[None]:
+        """Enforce a budget on everything run within the context. The wall
+        time is measured from entering the context.
+
+        Args:
+            budget (Budget): budget to enforce
+        """
+        previous = self._budget, self._deadline, self._next_rss_check
+        now = perf_counter()
+        self._budget = budget
+        self._deadline = now + budget.seconds if budget.seconds is not None else inf
+        self._next_rss_check = now if budget.max_rss is not None else inf
+        try:
+            yield
+        finally:
+            self._budget, self._deadline, self._next_rss_check = previous
+
+    def phase(self, day: int, name: str) -> ContextManager[None]:
+        return self._phase(day, name)
+
+    @contextmanager
+    def _phase(self, day: int, name: str) -> Iterator[None]:
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit(day)
+
+    def _enter(self, name: str) -> None:
+        phase = _Phase(name, start=0.0)
+        if self._trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_memory = max(parent.peak_memory, peak - parent.memory_start)
+
+            tracemalloc.reset_peak()
+            phase.memory_start = current
+
+        self._stack.append(phase)
+        phase.start = perf_counter()
+
+    def _exit(self, day: int) -> None:
+        end = perf_counter()
+        phase = self._stack.pop()
+
+        peak_memory = None
+        if self._trace_memory:
+            import tracemalloc
+
+            _, peak = tracemalloc.get_traced_memory()
+            peak_memory = max(phase.peak_memory, peak - phase.memory_start)
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_memory = max(parent.peak_memory, phase.memory_start + peak_memory - parent.memory_start)
+            elif self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        self._sink.emit({
+            'day': day,
+            'phase': phase.name,
+            'seconds': end - phase.start,
+            'peak_memory': peak_memory,
+            'counters': phase.counters,
+        })
+
+
+class NullInstrumentation:
+    """Instrumentation that does nothing, used when instrumentation is disabled."""
+
+    _context = nullcontext()
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def checkpoint(self) -> None:
+        pass
+
+    def phase(self, day: int, name: str) -> ContextManager[None]:
+        return self._context
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+AnyInstrumentation = Instrumentation | NullInstrumentation
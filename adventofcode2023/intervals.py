@@ -0,0 +1,363 @@
+from bisect import bisect_right
+from math import prod
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Optional, Self
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Half-open intervals of ints, [start, end), for days that map or split huge
+# ranges of numbers. Everything works on the bounds of the intervals only, so
+# the cost of an operation depends on the amount of intervals and never on how
+# many numbers they hold.
+
+
+class Interval(NamedTuple):
+    start: int
+    end: int
+
+    @classmethod
+    def from_length(cls, start: int, length: int) -> Self:
+        return cls(start, start + length)
+
+    @property
+    def size(self) -> int:
+        return max(self.end - self.start, 0)
+
+    def __bool__(self) -> bool:
+        return self.end > self.start
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, int) and self.start <= value < self.end
+
+    def intersect(self, other: 'Interval') -> Optional['Interval']:
+        start, end = max(self.start, other.start), min(self.end, other.end)
+        return Interval(start, end) if start < end else None
+
+    def shift(self, offset: int) -> 'Interval':
+        return Interval(self.start + offset, self.end + offset)
+
+    def split(self, at: int) -> tuple[Optional['Interval'], Optional['Interval']]:
+        """Split into the numbers below `at` and the numbers from `at` on,
+        either of which is None when it would be empty."""
+        if at <= self.start:
+            return None, self
+        if at >= self.end:
+            return self, None
+        return Interval(self.start, at), Interval(at, self.end)
+
+
+class IntervalSet:
+    """A set of ints kept as sorted, disjoint intervals. Overlapping and
+    adjacent intervals are merged, so equal sets have equal intervals."""
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for start, end in sorted( i for i in intervals if i[0] < i[1] ):
+            if self._ends and start <= self._ends[-1]:
+                self._ends[-1] = max(self._ends[-1], end)
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    @classmethod
+    def _normalized(cls, starts: list[int], ends: list[int]) -> Self:
+        interval_set = cls.__new__(cls)
+        interval_set._starts = starts
+        interval_set._ends = ends
+        return interval_set
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(Interval, self._starts, self._ends)
+
+    def __len__(self) -> int:
+        """Amount of intervals, see `size` for the amount of numbers."""
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({[ tuple(i) for i in self ]})"
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        idx = bisect_right(self._starts, value) - 1
+        return idx >= 0 and value < self._ends[idx]
+
+    @property
+    def size(self) -> int:
+        return sum( end - start for start, end in zip(self._starts, self._ends) )
+
+    def next(self, value: int) -> Optional[int]:
+        """Lowest number in the set from `value` on, None if there is none."""
+        idx = bisect_right(self._starts, value) - 1
+        if idx >= 0 and value < self._ends[idx]:
+            return value
+        return self._starts[idx + 1] if idx + 1 < len(self._starts) else None
+
+    def min(self) -> int:
+        if not self._starts:
+            raise ValueError('Empty interval set has no minimum.')
+        return self._starts[0]
+
+    def max(self) -> int:
+        if not self._ends:
+            raise ValueError('Empty interval set has no maximum.')
+        return self._ends[-1] - 1
+
+    def shift(self, offset: int) -> Self:
+        return self._normalized(
+            [ start + offset for start in self._starts ],
+            [ end + offset for end in self._ends ]
+        )
+
+    def split(self, at: int) -> tuple[Self, Self]:
+        """Split into the numbers below `at` and the numbers from `at` on."""
+        idx = bisect_right(self._starts, at)
+        below_starts, below_ends = self._starts[:idx], self._ends[:idx]
+        above_starts, above_ends = self._starts[idx:], self._ends[idx:]
+        if below_ends and below_ends[-1] > at:
+            above_starts.insert(0, at)
+            above_ends.insert(0, below_ends[-1])
+            below_ends[-1] = at
+            if below_starts[-1] == at:
+                below_starts.pop()
+                below_ends.pop()
+        return self._normalized(below_starts, below_ends), self._normalized(above_starts, above_ends)
+
+    def union(self, other: Iterable[tuple[int, int]]) -> Self:
+        return type(self)([ *self, *other ])
+
+    def intersection(self, other: 'IntervalSet') -> Self:
+        starts: list[int] = []
+        ends: list[int] = []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            end = min(self._ends[i], other._ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            # move past the interval that ends first
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return self._normalized(starts, ends)
+
+    def difference(self, other: 'IntervalSet') -> Self:
+        if not self._starts:
+            return self
+        # the gaps between the intervals of the other set, bounded by this set
+        bounds = [ self._starts[0], *( b for i in other for b in i ), self._ends[-1] ]
+        gaps = type(self)(zip(bounds[::2], bounds[1::2]))
+        return self.intersection(gaps)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class Box(NamedTuple):
+    """An n-dimensional box, the product of an interval in every dimension."""
+    intervals: tuple[Interval, ...]
+
+    @property
+    def size(self) -> int:
+        return prod( interval.size for interval in self.intervals )
+
+    def __bool__(self) -> bool:
+        return all(self.intervals)
+
+    def __contains__(self, point: object) -> bool:
+        return (
+            isinstance(point, tuple) and len(point) == len(self.intervals) and
+            all( v in interval for v, interval in zip(point, self.intervals) )
+        )
+
+    def intersect(self, other: 'Box') -> Optional['Box']:
+        intervals = []
+        for a, b in zip(self.intervals, other.intervals):
+            if (interval := a.intersect(b)) is None:
+                return None
+            intervals.append(interval)
+        return Box(tuple(intervals))
+
+    def replace(self, dim: int, interval: Interval) -> 'Box':
+        return Box((*self.intervals[:dim], interval, *self.intervals[dim + 1:]))
+
+    def split(self, dim: int, at: int) -> tuple[Optional['Box'], Optional['Box']]:
+        """Split along one dimension into the part below `at` and the part
+        from `at` on, either of which is None when it would be empty."""
+        below, above = self.intervals[dim].split(at)
+        return (
+            self.replace(dim, below) if below is not None else None,
+            self.replace(dim, above) if above is not None else None,
+        )
+
+
+class Piece(NamedTuple):
+    """Numbers of an interval that are shifted by the same offset."""
+    start: int
+    end: int
+    offset: int
+
+
+class PiecewiseShift:
+    """A function on ints that adds an offset depending on the interval a
+    number is in, and leaves numbers outside of every interval as they are.
+    Kept as sorted, disjoint pieces with a non-zero offset, so a lookup is a
+    binary search, and adjacent pieces with the same offset are merged, so
+    equal functions have equal pieces."""
+
+    __slots__ = ('_starts', '_ends', '_offsets')
+
+    def __init__(self, pieces: Iterable[tuple[int, int, int]] = ()) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._offsets: list[int] = []
+        for start, end, offset in sorted( p for p in pieces if p[0] < p[1] ):
+            if self._ends and start < self._ends[-1]:
+                raise ValueError(f"Piece {(start, end)} overlaps {(self._starts[-1], self._ends[-1])}.")
+            self._append(start, end, offset)
+
+    def _append(self, start: int, end: int, offset: int) -> None:
+        if offset == 0 or start >= end:
+            return
+        if self._ends and self._ends[-1] == start and self._offsets[-1] == offset:
+            self._ends[-1] = end
+        else:
+            self._starts.append(start)
+            self._ends.append(end)
+            self._offsets.append(offset)
+
+    def __iter__(self) -> Iterator[Piece]:
+        return map(Piece, self._starts, self._ends, self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PiecewiseShift):
+            return NotImplemented
+        return (self._starts, self._ends, self._offsets) == (other._starts, other._ends, other._offsets)
+
+    def __repr__(self) -> str:
+        return f"PiecewiseShift({[ tuple(p) for p in self ]})"
+
+    def lookup(self, value: int) -> int:
+        idx = bisect_right(self._starts, value) - 1
+        if idx >= 0 and value < self._ends[idx]:
+            return value + self._offsets[idx]
+        return value
+
+    def lookup_many(self, values: 'np.ndarray', chunk_size: int = 2**16) -> 'np.ndarray':
+        """Look up every number of an int64 array at once.
+
+        The numbers between the first and last piece are split into up to
+        2**16 buckets of equal width. A bucket without a bound of a piece in
+        it shifts all of its numbers by the same offset, which is looked up
+        in a table. Only numbers in the other buckets take a binary search
+        over the starts of the pieces. Numbers are looked up in chunks, so
+        memory beyond the input and output arrays is bounded by the chunk
+        size.
+
+        Args:
+            values (np.ndarray): int64 array of numbers to look up
+            chunk_size (int): amount of numbers looked up at a time
+
+        Returns:
+            np.ndarray: int64 array of the looked up numbers
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.int64)
+        if not self._starts:
+            return values.copy()
+
+        starts = np.array(self._starts, dtype=np.int64)
+        # numbers outside of every piece get index -1, the piece shifting by zero
+        ends = np.array([*self._ends, 0], dtype=np.int64)
+        offsets = np.array([*self._offsets, 0], dtype=np.int64)
+
+        def search(numbers: np.ndarray) -> np.ndarray:
+            idx = np.searchsorted(starts, numbers, side='right') - 1
+            idx[numbers >= ends[idx]] = -1
+            return offsets[idx]
+
+        # fewer buckets than numbers, so building the table never dominates
+        low, high = self._starts[0], self._ends[-1]
+        bits = min(16, max(len(values).bit_length() - 4, 0))
+        shift = max((high - low).bit_length() - bits, 0)
+        bucket_starts = low + (np.arange(((high - low - 1) >> shift) + 1, dtype=np.int64) << shift)
+        bounds = np.array(sorted({ *self._starts, *self._ends }), dtype=np.int64)
+        uniform = (
+            np.searchsorted(bounds, bucket_starts, side='right') ==
+            np.searchsorted(bounds, bucket_starts + (1 << shift) - 1, side='right')
+        )
+        table = search(bucket_starts)
+
+        out = np.empty_like(values)
+        for at in range(0, len(values), chunk_size):
+            chunk = values[at:at + chunk_size]
+            inside = (chunk >= low) & (chunk < high)
+            buckets = (chunk - low) >> shift
+            buckets[~inside] = 0
+            chunk_offsets = np.where(inside, table[buckets], 0)
+            mixed = inside & ~uniform[buckets]
+            chunk_offsets[mixed] = search(chunk[mixed])
+            np.add(chunk, chunk_offsets, out=out[at:at + chunk_size])
+        return out
+
+    def _segments(self, start: int, end: int) -> Iterator[Piece]:
+        """Cover [start, end) with pieces, including the numbers between the
+        pieces with an offset of zero."""
+        idx = max(bisect_right(self._starts, start) - 1, 0)
+        at = start
+        while at < end:
+            if idx < len(self._starts) and self._starts[idx] <= at < self._ends[idx]:
+                upto = min(self._ends[idx], end)
+                yield Piece(at, upto, self._offsets[idx])
+                idx += 1
+            else:
+                while idx < len(self._starts) and self._ends[idx] <= at:
+                    idx += 1
+                upto = min(self._starts[idx], end) if idx < len(self._starts) else end
+                yield Piece(at, upto, 0)
+            at = upto
+
+    def lookup_range(self, start: int, end: int) -> IntervalSet:
+        """Every number [start, end) maps to."""
+        return IntervalSet( (p.start + p.offset, p.end + p.offset) for p in self._segments(start, end) )
+
+    def then(self, other: 'PiecewiseShift') -> 'PiecewiseShift':
+        """The function applying this function and then `other`.
+
+        Args:
+            other (PiecewiseShift): function applied to the results of this function
+
+        Returns:
+            PiecewiseShift: the composition of both functions
+        """
+        if not self._starts:
+            return other
+        if not other._starts:
+            return self
+
+        # outside of these bounds both functions leave numbers as they are
+        start = min(self._starts[0], other._starts[0])
+        end = max(self._ends[-1], other._ends[-1])
+        composed = PiecewiseShift()
+        for piece in self._segments(start, end):
+            for mapped in other._segments(piece.start + piece.offset, piece.end + piece.offset):
+                composed._append(mapped.start - piece.offset, mapped.end - piece.offset, piece.offset + mapped.offset)
+        return composed
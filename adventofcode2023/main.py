@@ -1,10 +1,394 @@
-from adventofcode2023.days import Day12
-from adventofcode2023 import Day
+import argparse
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from adventofcode2023 import runner
+from adventofcode2023.profiling import DEFAULT_INTERVAL, PROFILERS
 
-def main() -> None:
-    day12 = Day12()
-    print(day12.solve_part_one())
+if TYPE_CHECKING:
+    from adventofcode2023.cache import ResultCache
+
+
+STDIN = '-'
+
+
+def _day_or_stdin(value: str) -> int | str:
+    return value if value == STDIN else int(value)
+
+
+def _add_job_arguments(parser: argparse.ArgumentParser, stdin: bool = False) -> None:
+    if stdin:
+        parser.add_argument(
+            'days', nargs='*', type=_day_or_stdin,
+            help=f"days to run, defaults to all days, a single day followed by {STDIN} reads its input from stdin"
+        )
+    else:
+        parser.add_argument('days', nargs='*', type=int, help='days to run, defaults to all days')
+    parser.add_argument(
+        '-p', '--parts', nargs='+', type=int, choices=runner.PARTS, default=None,
+        help='parts to run, defaults to both parts, or to the parts that can be solved from a stream when reading stdin'
+    )
+    parser.add_argument(
+        '-j', '--workers', type=int, default=1,
+        help='amount of worker processes, 0 uses one per CPU and 1 runs everything in this process'
+    )
+    parser.add_argument(
+        '--timings', type=Path, default=None,
+        help='JSON report of a previous benchmark, used to start the slowest parts first'
+    )
+    parser.add_argument(
+        '--instrument', type=Path, default=None,
+        help='append a JSON line with the timings and counters of every phase to this file'
+    )
+    parser.add_argument(
+        '--trace-memory', action='store_true',
+        help='include the peak memory usage of every phase when instrumenting'
+    )
+    parser.add_argument(
+        '--time-budget', type=float, default=None, metavar='SECONDS',
+        help='cancel a part that takes longer than this'
+    )
+    parser.add_argument(
+        '--memory-budget', type=int, default=None, metavar='MIB',
+        help='cancel a part once the resident memory of its process exceeds this'
+    )
+
+
+def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='adventofcode2023')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='solve one or more days')
+    _add_job_arguments(run_parser, stdin=True)
+
+    bench_parser = subparsers.add_parser('bench', help='benchmark one or more days')
+    _add_job_arguments(bench_parser)
+    bench_parser.add_argument('-n', '--repeat', type=int, default=5, help='amount of timed runs per part')
+    bench_parser.add_argument('-w', '--warmup', type=int, default=0, help='amount of untimed runs per part')
+    bench_parser.add_argument('--json', type=Path, default=None, help='write the report as JSON to this file')
+
+    startup_parser = subparsers.add_parser('startup', help='benchmark the cold start of solving days')
+    startup_parser.add_argument('days', nargs='+', type=int, help='days to solve')
+    startup_parser.add_argument('-n', '--repeat', type=int, default=10, help='amount of cold starts')
+
+    serve_parser = subparsers.add_parser('serve', help='serve solves from warm worker processes')
+    serve_parser.add_argument('-j', '--workers', type=int, default=0, help='amount of worker processes, 0 uses one per CPU')
+    serve_parser.add_argument(
+        '--timeout', type=float, default=None,
+        help='seconds a request may take unless it sets its own timeout'
+    )
+
+    remote_parser = subparsers.add_parser('remote', help='solve one or more days on a running server')
+    remote_parser.add_argument('days', nargs='*', type=int, help='days to run, defaults to all days')
+    remote_parser.add_argument('-p', '--parts', nargs='+', type=int, choices=runner.PARTS, default=list(runner.PARTS))
+    remote_parser.add_argument('--input', type=Path, default=None, help='puzzle input to use instead of the packaged one')
+    remote_parser.add_argument('--timeout', type=float, default=None, help='seconds every part may take')
+    remote_parser.add_argument('--timings', action='store_true', help='print the timings reported by the server')
+
+    for p in (serve_parser, remote_parser):
+        address = p.add_mutually_exclusive_group()
+        address.add_argument('--socket', type=Path, default=None, help='location of the Unix socket of the server')
+        address.add_argument('--port', type=int, default=None, help='port of the server on localhost')
+
+    batch_parser = subparsers.add_parser('batch', help='solve a day for many puzzle inputs')
+    batch_parser.add_argument('day', type=int, help='day to solve')
+    batch_parser.add_argument('files', nargs='*', type=Path, help='puzzle inputs to solve')
+    batch_parser.add_argument('-p', '--part', type=int, choices=runner.PARTS, default=1)
+    batch_parser.add_argument(
+        '-j', '--workers', type=int, default=0,
+        help='amount of worker processes for parts that are not vectorized, 0 uses one per CPU'
+    )
+    batch_parser.add_argument('--chunk-size', type=int, default=64, help='amount of inputs solved at once')
+    batch_parser.add_argument(
+        '--generate', type=int, default=0, metavar='N',
+        help='solve N generated inputs instead of files, generated with the seeds 0 to N - 1'
+    )
+    batch_parser.add_argument('--scale', type=float, default=1, help='size of the generated inputs')
+
+    baseline_parser = subparsers.add_parser('baseline', help='record the baseline of the bench test suite')
+    baseline_parser.add_argument('--path', type=Path, default=None, help='where to write the baseline')
+    baseline_parser.add_argument('-n', '--repeat', type=int, default=9, help='amount of timed runs per case')
+    baseline_parser.add_argument('-w', '--warmup', type=int, default=2, help='amount of untimed runs per case')
+    baseline_parser.add_argument(
+        '-r', '--rounds', type=int, default=5,
+        help='amount of times every case is measured, taking the median over them'
+    )
+    baseline_parser.add_argument(
+        '--tolerance', type=float, default=1.5,
+        help='factor a median may exceed its baseline by before the suite fails'
+    )
+    baseline_parser.add_argument(
+        '--min-slack', type=float, default=0.002,
+        help='seconds a median may always exceed its baseline by'
+    )
+
+    generate_parser = subparsers.add_parser('generate', help='print a generated puzzle input')
+    generate_parser.add_argument('day', type=int, help='day to generate an input for')
+    generate_parser.add_argument('--scale', type=float, default=1, help='size relative to a real puzzle input')
+    generate_parser.add_argument('--seed', type=int, default=0)
+    generate_parser.add_argument('--variant', default=None, help='variant of the inputs of the day, such as adversarial')
+
+    sweep_parser = subparsers.add_parser('sweep', help='benchmark a day on generated inputs of increasing size')
+    sweep_parser.add_argument('day', type=int, help='day to benchmark')
+    sweep_parser.add_argument('-p', '--parts', nargs='+', type=int, choices=runner.PARTS, default=list(runner.PARTS))
+    sweep_parser.add_argument(
+        '--scales', nargs='+', type=float, default=[0.25, 0.5, 1, 2, 4],
+        help='sizes of the inputs relative to a real puzzle input'
+    )
+    sweep_parser.add_argument('--seed', type=int, default=0)
+    sweep_parser.add_argument('-n', '--repeat', type=int, default=3, help='amount of timed runs per input')
+    sweep_parser.add_argument('--memory', action='store_true', help='also measure the peak memory usage per input')
+    sweep_parser.add_argument('--json', type=Path, default=None, help='write the report as JSON to this file')
+    sweep_parser.add_argument(
+        '--plot', type=Path, default=None,
+        help='plot time and memory against input size to this image, requires matplotlib'
+    )
+
+    diff_parser = subparsers.add_parser('diff', help='check the engines of a day against its reference on generated inputs')
+    diff_parser.add_argument('day', type=int, help='day to check')
+    diff_parser.add_argument('-p', '--parts', nargs='+', type=int, choices=runner.PARTS, default=list(runner.PARTS))
+    diff_parser.add_argument(
+        '--scales', nargs='+', type=float, default=[0.1, 0.5, 1, 2],
+        help='sizes of the inputs relative to a real puzzle input'
+    )
+    diff_parser.add_argument('--seeds', type=int, default=3, help='amount of inputs per size')
+    diff_parser.add_argument('--variant', default=None, help='variant of the generated inputs, such as adversarial')
+    diff_parser.add_argument('--json', type=Path, default=None, help='write the report as JSON to this file')
+
+    cache_parser = subparsers.add_parser('cache', help='manage the cache of solutions')
+    cache_subparsers = cache_parser.add_subparsers(dest='cache_command', required=True)
+    clear_parser = cache_subparsers.add_parser('clear', help='invalidate cached solutions')
+    clear_parser.add_argument('days', nargs='*', type=int, help='days to invalidate, defaults to all days')
+
+    for p in (run_parser, clear_parser):
+        p.add_argument('--cache-dir', type=Path, default=None, help='location of the cache')
+
+    run_parser.add_argument('--cache', action='store_true', help='reuse solutions of unchanged inputs and solvers')
+    run_parser.add_argument('--cache-size', type=int, default=16, help='maximum size of the cache in MiB')
+    run_parser.add_argument(
+        '--profile', choices=PROFILERS, default=None,
+        help='profile parsing and solving every part, in this process and without cache or budgets'
+    )
+    run_parser.add_argument(
+        '--profile-dir', type=Path, default=Path('profiles'),
+        help='where to write the pstats and collapsed stacks of every profiled part'
+    )
+    run_parser.add_argument(
+        '--profile-interval', type=float, default=DEFAULT_INTERVAL, metavar='SECONDS',
+        help='time between samples of the sample profiler'
+    )
+
+    return parser.parse_args(argv)
+
+
+def _bench(
+    args: argparse.Namespace,
+    repeat: int = 1,
+    warmup: int = 0,
+    cache: Optional['ResultCache'] = None
+) -> list[runner.PartReport]:
+    jobs = runner.make_jobs(args.days, args.parts)
+    instrumentation = None
+    if args.instrument is not None:
+        from adventofcode2023.instrumentation import Instrumentation, JsonLinesSink
+
+        instrumentation = Instrumentation(JsonLinesSink(args.instrument), args.trace_memory)
+
+    budget = None
+    if args.time_budget is not None or args.memory_budget is not None:
+        from adventofcode2023.instrumentation import Budget
+
+        budget = Budget(
+            seconds=args.time_budget,
+            max_rss=args.memory_budget * 2**20 if args.memory_budget is not None else None
+        )
+
+    if args.workers == 1:
+        if args.command == 'run':
+            return runner.run_days(jobs, cache, instrumentation, budget)
+        return runner.bench(jobs, repeat, warmup, cache, instrumentation, budget)
+
+    timings = runner.load_timings(args.timings) if args.timings is not None else None
+    return runner.parallel_bench(
+        jobs, repeat, warmup,
+        workers=args.workers or None,
+        timings=timings,
+        cache=cache,
+        instrumentation=instrumentation,
+        budget=budget
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _parse_args(argv)
+
+    match args.command:
+
+        case 'run' if STDIN in args.days:
+            from adventofcode2023.days import get_day
+
+            days = [ day for day in args.days if day != STDIN ]
+            if len(days) != 1 or args.days.count(STDIN) != 1:
+                sys.exit(f"a single day can read its input from stdin, e.g. run 1 {STDIN}")
+
+            day_cls = get_day(days[0])
+            parts = args.parts if args.parts is not None else day_cls.stream_parts()
+            try:
+                results = day_cls.solve_stream(sys.stdin.buffer, parts)
+            except ValueError as e:
+                sys.exit(str(e))
+            for part, result in zip(parts, results):
+                print(f"day {days[0]} part {part}: {result}")
+
+        case 'run' if args.profile is not None:
+            from adventofcode2023.profiling import format_profile, profile_part
+
+            for job in runner.make_jobs(args.days, args.parts):
+                profile = profile_part(job.day, job.part, args.profile, args.profile_dir, interval=args.profile_interval)
+                print(f"day {job.day} part {job.part}: {profile.result}")
+                print(format_profile(profile))
+
+        case 'run':
+            cache = None
+            if args.cache:
+                from adventofcode2023.cache import ResultCache
+
+                cache = ResultCache(args.cache_dir, args.cache_size * 2**20)
+
+            for report in _bench(args, cache=cache):
+                answer = report.result if report.error is None else report.error
+                counters = ''
+                if report.counters:
+                    counters = '  (' + ', '.join(f"{k} {v}" for k, v in report.counters.items()) + ')'
+                print(f"day {report.day} part {report.part}: {answer}{counters}")
+
+        case 'bench':
+            reports = _bench(args, repeat=args.repeat, warmup=args.warmup)
+            print(runner.format_table(reports))
+            if args.json is not None:
+                args.json.write_text(runner.to_json(reports))
+
+        case 'startup':
+            from statistics import median
+
+            for name, timings in runner.time_startup(args.days, args.repeat).items():
+                print(
+                    f"{name:>6}: min {min(timings) * 1000:.1f}ms  "
+                    f"median {median(timings) * 1000:.1f}ms  "
+                    f"p95 {runner.percentile(timings, 95) * 1000:.1f}ms"
+                )
+
+        case 'serve':
+            import asyncio
+
+            from adventofcode2023.server import serve
+
+            asyncio.run(serve(args.socket, args.port, args.workers or None, args.timeout))
+
+        case 'remote':
+            from adventofcode2023.server import solve_remote
+
+            puzzle_input = args.input.read_text() if args.input is not None else None
+            jobs = runner.make_jobs(args.days, args.parts)
+            responses = solve_remote(
+                ( (job.day, job.part, puzzle_input) for job in jobs ),
+                args.socket, args.port, args.timeout
+            )
+            for job, response in zip(jobs, responses):
+                answer = response['result'] if response['error'] is None else response['error']
+                timings = ''
+                if args.timings:
+                    timings = '  ' + ' '.join(f"{k} {v * 1000:.3f}ms" for k, v in response['timing'].items())
+                print(f"day {job.day} part {job.part}: {answer}{timings}")
+
+        case 'batch':
+            from time import perf_counter
+
+            from adventofcode2023.days import get_day
+            from adventofcode2023.puzzle_input import PuzzleInput
+
+            inputs: Iterable[str | PuzzleInput]
+            if args.generate:
+                from adventofcode2023.generators import generate
+
+                inputs = ( generate(args.day, args.scale, seed) for seed in range(args.generate) )
+            else:
+                inputs = ( PuzzleInput.from_file(path) for path in args.files )
+
+            solved = 0
+            start = perf_counter()
+            for result in get_day(args.day).solve_batch(inputs, args.part, args.workers or None, args.chunk_size):
+                print(result)
+                solved += 1
+
+            elapsed = perf_counter() - start
+            print(f"solved {solved} inputs in {elapsed:.3f}s, {solved / elapsed:.1f} inputs/s", file=sys.stderr)
+
+        case 'baseline':
+            from adventofcode2023 import baseline
+
+            recorded = baseline.record(
+                repeat=args.repeat,
+                warmup=args.warmup,
+                tolerance=args.tolerance,
+                min_slack=args.min_slack,
+                rounds=args.rounds
+            )
+            recorded.save(args.path or baseline.DEFAULT_BASELINE)
+            for case, median in recorded.medians.items():
+                print(f"{case.name}: {median * 1000:.3f}ms")
+
+        case 'generate':
+            from adventofcode2023.generators import generate
+
+            print(generate(args.day, args.scale, args.seed, args.variant), end='')
+
+        case 'sweep':
+            import json
+
+            points: list[runner.SweepPoint] = []
+            for part in args.parts:
+                part_points = runner.sweep(args.day, part, args.scales, args.seed, args.repeat, args.memory)
+                print(f"day {args.day} part {part}")
+                print(runner.format_sweep(part_points))
+                points.extend(part_points)
+
+            if args.json is not None:
+                args.json.write_text(json.dumps([ p.summary() for p in points ], indent=2, default=str))
+            if args.plot is not None:
+                runner.plot_sweep(points, args.plot)
+
+        case 'diff':
+            import json
+
+            from adventofcode2023 import differential
+            from adventofcode2023.days import get_day
+
+            comparisons: list[differential.Comparison] = []
+            try:
+                for part in args.parts:
+                    if len(get_day(args.day).engines(part)) < 2:
+                        print(f"day {args.day} part {part} has a single engine, nothing to compare")
+                        continue
+
+                    part_comparisons = differential.differential(
+                        args.day, part, args.scales, range(args.seeds), args.variant
+                    )
+                    print(f"day {args.day} part {part}")
+                    print(differential.format_comparisons(part_comparisons))
+                    comparisons.extend(part_comparisons)
+            except differential.EngineMismatch as e:
+                sys.exit(f"engines disagree:\n{e}")
+            finally:
+                if args.json is not None:
+                    args.json.write_text(json.dumps([ c.summary() for c in comparisons ], indent=2, default=str))
+
+        case 'cache':
+            from adventofcode2023.cache import ResultCache
+
+            removed = ResultCache(args.cache_dir).clear(args.days)
+            print(f"removed {removed} cached solutions")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,339 @@
+import marshal
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from types import CodeType
+from typing import Callable, Iterable, Optional, Protocol, TypeVar
+
+from adventofcode2023.day import Result
+from adventofcode2023.days import get_day
+
+# Profiles of a single part of a day, for when the timings of the runner are
+# not enough to tell where the time goes. Parsing and solving are profiled as
+# separate phases, so their time is never mixed up, and every profile is
+# written twice: as `pstats` for `python -m pstats` or snakeviz, and as
+# collapsed stacks for flamegraph.pl or speedscope, one line per stack:
+#
+#     part1;Day16.solve_part_one (day16.py:99);get_energized_tiles (day16.py:60) 1234
+#
+# where the first frame is the phase and the count is in microseconds.
+#
+# Two profilers are available. `cprofile` hooks every call, which gives exact
+# call counts but slows down code that makes many small calls, and only
+# records caller and callee pairs, so its stacks are an estimate that splits
+# the time of a function over its callers in proportion. `sample` looks at the
+# stack of the profiled thread at a fixed interval from another thread, which
+# barely slows down the profiled code and records whole stacks, but has no
+# call counts and misses time spent between samples.
+
+T = TypeVar('T')
+
+# (file, first line, name) of a function, the key of a function in `pstats`
+Function = tuple[str, int, str]
+CallStats = tuple[int, int, float, float]
+Stats = dict[Function, tuple[int, int, float, float, dict[Function, CallStats]]]
+
+PROFILERS = ('sample', 'cprofile')
+DEFAULT_INTERVAL = 0.001
+
+
+class Profiler(Protocol):
+
+    def __call__(self, fn: Callable[[], T]) -> tuple[T, Stats, Counter[tuple[Function, ...]]]:
+        """Call `fn` and profile it.
+
+        Returns:
+            tuple[T, Stats, Counter[tuple[Function, ...]]]: the result of `fn`,
+                its `pstats` statistics and the microseconds spent per stack
+        """
+        ...
+
+
+@dataclass
+class PhaseProfile:
+    name: str
+    seconds: float
+    stats: Stats
+    # microseconds per stack of functions, outermost function first
+    stacks: Counter[tuple[Function, ...]]
+
+    def top(self, limit: int = 10) -> list[tuple[Function, float]]:
+        """Functions that spent the most time themselves, not in functions
+        they called, with that time in seconds."""
+        own = sorted(( (stats[2], func) for func, stats in self.stats.items() ), reverse=True)
+        return [ (func, seconds) for seconds, func in own[:limit] if seconds > 0 ]
+
+
+@dataclass
+class Profile:
+    day: int
+    part: int
+    profiler: str
+    result: Result
+    phases: list[PhaseProfile] = field(default_factory=list)
+    pstats_path: Optional[Path] = None
+    collapsed_path: Optional[Path] = None
+
+    @property
+    def seconds(self) -> float:
+        return sum( phase.seconds for phase in self.phases )
+
+
+def label(func: Function) -> str:
+    """Name of a function as shown in collapsed stacks."""
+    filename, line, name = func
+    if filename == '~':
+        # built-in functions have no file in `pstats`
+        return name
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def _key(code: CodeType) -> Function:
+    return code.co_filename, code.co_firstlineno, code.co_qualname
+
+
+def profile_cprofile(fn: Callable[[], T]) -> tuple[T, Stats, Counter[tuple[Function, ...]]]:
+    """Profile a call with `cProfile`, see `Profiler`."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(fn)
+    profiler.create_stats()
+    stats: Stats = profiler.stats  # type: ignore[attr-defined]
+    # stopping the profiler is profiled as well
+    stats.pop(('~', 0, "<method 'disable' of '_lsprof.Profiler' objects>"), None)
+    return result, stats, estimate_stacks(stats)
+
+
+def estimate_stacks(stats: Stats, min_seconds: float = 1e-6) -> Counter[tuple[Function, ...]]:
+    """Estimate the time spent per stack from the caller and callee pairs of
+    `pstats` statistics. The time a function spent when called by a caller is
+    split over the stacks of that caller in proportion to their time.
+
+    Args:
+        stats (Stats): statistics of a profile
+        min_seconds (float): stacks that spent less time are left out
+
+    Returns:
+        Counter[tuple[Function, ...]]: microseconds spent per stack
+    """
+    callees: dict[Function, dict[Function, float]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees.setdefault(caller, {})[func] = cumulative
+
+    stacks: Counter[tuple[Function, ...]] = Counter()
+
+    def walk(func: Function, stack: tuple[Function, ...], share: float) -> None:
+        _, _, own, cumulative, _ = stats[func]
+        stack = (*stack, func)
+        if (micros := round(own * share * 1e6)) > 0:
+            stacks[stack] += micros
+        for callee, seconds in callees.get(func, {}).items():
+            callee_share = share * seconds / stats[callee][3] if stats[callee][3] > 0 else 0.0
+            # recursion is folded into the outermost call
+            if callee not in stack and stats[callee][3] * callee_share >= min_seconds:
+                walk(callee, stack, callee_share)
+
+    for func, (_, _, _, cumulative, callers) in stats.items():
+        if not callers and cumulative >= min_seconds:
+            walk(func, (), 1.0)
+
+    return stacks
+
+
+class StackSampler:
+    """Profiles a call by sampling the stack of its thread every `interval`
+    seconds from another thread, see `Profiler`. Every sample counts for the
+    time since the previous sample. The interpreter only switches threads
+    every `sys.getswitchinterval()` seconds, so the switch interval is
+    lowered to the sample interval while sampling."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+
+    def __call__(self, fn: Callable[[], T]) -> tuple[T, Stats, Counter[tuple[Function, ...]]]:
+        import threading
+
+        target = threading.get_ident()
+        root = sys._getframe()
+        stacks: Counter[tuple[Function, ...]] = Counter()
+        samples: Counter[tuple[Function, ...]] = Counter()
+        done = threading.Event()
+
+        def sample() -> None:
+            previous = perf_counter()
+            while not done.wait(self.interval):
+                frame = sys._current_frames().get(target)
+                now = perf_counter()
+                codes: list[CodeType] = []
+                while frame is not None and frame is not root:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                # only stacks below this call belong to the profile
+                if frame is root and codes:
+                    stack = tuple(map(_key, reversed(codes)))
+                    stacks[stack] += round((now - previous) * 1e6)
+                    samples[stack] += 1
+                previous = now
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.interval))
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        try:
+            result = fn()
+        finally:
+            done.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+        return result, sampled_stats(stacks, samples), stacks
+
+
+def sampled_stats(stacks: Counter[tuple[Function, ...]], samples: Counter[tuple[Function, ...]]) -> Stats:
+    """`pstats` statistics of sampled stacks. Call counts are the amount of
+    samples a function was on the stack, as samples do not see calls.
+
+    Args:
+        stacks (Counter[tuple[Function, ...]]): microseconds spent per stack
+        samples (Counter[tuple[Function, ...]]): amount of samples per stack
+
+    Returns:
+        Stats: statistics in the format of `pstats`
+    """
+    counts: Counter[Function] = Counter()
+    own: Counter[Function] = Counter()
+    cumulative: Counter[Function] = Counter()
+    edges: dict[Function, dict[Function, list[float]]] = {}
+
+    for stack, micros in stacks.items():
+        n = samples[stack]
+        own[stack[-1]] += micros
+        # a recursive function counts once per sample
+        for func in set(stack):
+            counts[func] += n
+            cumulative[func] += micros
+        for caller, callee in dict.fromkeys(zip(stack, stack[1:])):
+            edge_stats = edges.setdefault(callee, {}).setdefault(caller, [0, 0, 0])
+            edge_stats[0] += n
+            edge_stats[2] += micros
+        if len(stack) > 1:
+            edges[stack[-1]][stack[-2]][1] += micros
+
+    return {
+        func: (
+            counts[func], counts[func], own[func] / 1e6, cumulative[func] / 1e6,
+            {
+                caller: (int(n), int(n), own_micros / 1e6, micros / 1e6)
+                for caller, (n, own_micros, micros) in edges.get(func, {}).items()
+            }
+        )
+        for func in counts
+    }
+
+
+def get_profiler(name: str, interval: float = DEFAULT_INTERVAL) -> Profiler:
+    """Profiler by its name in PROFILERS.
+
+    Raises:
+        ValueError: if there is no profiler with the name
+    """
+    match name:
+        case 'sample':
+            return StackSampler(interval)
+        case 'cprofile':
+            return profile_cprofile
+    raise ValueError(f"Unknown profiler {name}, expected one of {PROFILERS}.")
+
+
+def profile_part(
+    day: int,
+    part: int,
+    profiler: str = 'sample',
+    out_dir: Optional[Path] = None,
+    puzzle_input: Optional[str] = None,
+    interval: float = DEFAULT_INTERVAL
+) -> Profile:
+    """Profile parsing the input of a day and solving one of its parts, and
+    write the profile to `day<day>-part<part>.pstats` and
+    `day<day>-part<part>.collapsed` in `out_dir`.
+
+    Args:
+        day (int): day to profile
+        part (int): part to profile
+        profiler (str): name of the profiler, one of PROFILERS
+        out_dir (Optional[Path]): directory to write the profile to, nothing
+            is written if None
+        puzzle_input (Optional[str]): input to use, defaults to the packaged input
+        interval (float): seconds between samples of the `sample` profiler
+
+    Raises:
+        ValueError: if the part or profiler does not exist
+
+    Returns:
+        Profile: result and profile of every phase
+    """
+    if part not in (1, 2):
+        raise ValueError(f"Invalid part {part}, expected 1 or 2.")
+    run = get_profiler(profiler, interval)
+    instance = get_day(day)(puzzle_input)
+
+    phases: list[PhaseProfile] = []
+    result: Result = None
+    # days that parse while solving have their parsing profiled as part of solving
+    for name, fn in [('parse', instance.parse), (f'part{part}', lambda: instance.solve(part))]:
+        start = perf_counter()
+        result, stats, stacks = run(fn)
+        phases.append(PhaseProfile(name, perf_counter() - start, stats, stacks))
+
+    profile = Profile(day, part, profiler, result, phases)
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        profile.pstats_path = out_dir / f"day{day}-part{part}.pstats"
+        profile.collapsed_path = out_dir / f"day{day}-part{part}.collapsed"
+        write_pstats(phases, profile.pstats_path)
+        write_collapsed(phases, profile.collapsed_path)
+
+    return profile
+
+
+def write_pstats(phases: Iterable[PhaseProfile], path: Path) -> None:
+    """Write the statistics of every phase as one `pstats` file."""
+    from pstats import add_func_stats  # type: ignore[attr-defined]
+
+    merged: Stats = {}
+    for phase in phases:
+        for func, stats in phase.stats.items():
+            merged[func] = add_func_stats(merged[func], stats) if func in merged else stats
+
+    with open(path, 'wb') as f:
+        marshal.dump(merged, f)
+
+
+def write_collapsed(phases: Iterable[PhaseProfile], path: Path) -> None:
+    """Write the stacks of every phase as collapsed stacks, with the name of
+    the phase as outermost frame."""
+    with open(path, 'w') as f:
+        for phase in phases:
+            for stack, micros in phase.stacks.items():
+                frames = ';'.join( label(func).replace(';', ':') for func in stack )
+                f.write(f"{phase.name};{frames} {micros}\n")
+
+
+def format_profile(profile: Profile, limit: int = 10) -> str:
+    """Time per phase and the functions of every phase that spent the most
+    time themselves."""
+    total = profile.seconds or 1.0
+    lines = [f"profiled with {profile.profiler} in {profile.seconds:.3f}s"]
+    for phase in profile.phases:
+        lines.append(f"  {phase.name:<6} {phase.seconds:9.3f}s {phase.seconds / total:6.1%}")
+        for func, seconds in phase.top(limit):
+            lines.append(f"    {seconds:9.3f}s {seconds / total:6.1%}  {label(func)}")
+
+    for path in (profile.pstats_path, profile.collapsed_path):
+        if path is not None:
+            lines.append(f"wrote {path}")
+    return '\n'.join(lines)
@@ -0,0 +1,114 @@
+import mmap
+import os
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional, Self
+
+Buffer = bytes | bytearray | mmap.mmap
+
+
+class PuzzleInput:
+    """Puzzle input backed by a bytes-like buffer. Inputs read from a file are
+    memory-mapped, so the input is only copied into memory as far as a day
+    actually reads it: iterating over `lines()` decodes one line at a time,
+    and the offsets of the lines are indexed once on first random access.
+
+    Lines follow the semantics of `str.split('\\n')`, so an input ending in a
+    newline has an empty last line.
+    """
+
+    def __init__(self, buffer: Buffer) -> None:
+        self._buffer = buffer
+        self._line_offsets: Optional[array] = None
+        self._text: Optional[str] = None
+
+    @classmethod
+    def from_string(cls, s: str) -> Self:
+        return cls(s.encode())
+
+    @classmethod
+    def from_file(cls, path: Path, use_mmap: bool = True) -> Self:
+        """Load an input file.
+
+        Args:
+            path (Path): location of the file
+            use_mmap (bool): map the file into memory instead of reading it
+
+        Returns:
+            Self: the puzzle input
+        """
+        with open(path, 'rb') as f:
+            # empty files can not be mapped
+            if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return cls(f.read())
+
+    @property
+    def buffer(self) -> Buffer:
+        return self._buffer
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the raw bytes of the input."""
+        return memoryview(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def text(self) -> str:
+        """The whole input as a string. Decoded once, on first use."""
+        if self._text is None:
+            # decodes straight from the buffer, without an intermediate bytes copy
+            self._text = str(self._buffer, 'utf-8')
+        return self._text
+
+    def line_offsets(self) -> array:
+        """Offsets of the start of every line in the buffer, followed by
+        the length of the buffer plus one. Line `i` spans the bytes from
+        `offsets[i]` up to `offsets[i + 1] - 1`.
+
+        Returns:
+            array: offsets of the lines
+        """
+        if self._line_offsets is None:
+            offsets = array('q', [0])
+            pos = self._buffer.find(b'\n')
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = self._buffer.find(b'\n', pos + 1)
+
+            offsets.append(len(self._buffer) + 1)
+            self._line_offsets = offsets
+
+        return self._line_offsets
+
+    def line_count(self) -> int:
+        return len(self.line_offsets()) - 1
+
+    def line_bytes(self, idx: int) -> bytes:
+        offsets = self.line_offsets()
+        if not -self.line_count() <= idx < self.line_count():
+            raise IndexError(f"Line {idx} out of range.")
+
+        idx %= self.line_count()
+        return self._buffer[offsets[idx]:offsets[idx + 1] - 1]
+
+    def line(self, idx: int) -> str:
+        return self.line_bytes(idx).decode()
+
+    def lines(self) -> Iterator[str]:
+        """Lazily iterate over the lines of the input, without building
+        the line index.
+
+        Yields:
+            Iterator[str]: every line, without its newline
+        """
+        start = 0
+        while (end := self._buffer.find(b'\n', start)) != -1:
+            yield self._buffer[start:end].decode()
+            start = end + 1
+
+        yield self._buffer[start:].decode()
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
@@ -0,0 +1,511 @@
+import json
+import sys
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from math import ceil, inf
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from adventofcode2023.day import DEFAULT_ENGINE, Day, Result
+from adventofcode2023.days import DAYS, get_day
+from adventofcode2023.instrumentation import Budget, BudgetExceeded, Instrumentation, NullSink
+
+if TYPE_CHECKING:
+    from adventofcode2023.cache import ResultCache
+
+PARTS = (1, 2)
+
+
+@dataclass
+class Job:
+    day: int
+    part: int
+
+
+@dataclass
+class Run:
+    """Timings of a single run of one part. `load` is the time spent on
+    constructing the day, `parse` the time spent in `Day.parse` and `solve`
+    the time spent in `solve_part_one` or `solve_part_two`. Since the parsed
+    input is shared by both parts of a day, only the first part solved on a
+    day pays for loading and parsing."""
+    load: float
+    parse: float
+    solve: float
+
+    @property
+    def total(self) -> float:
+        return self.load + self.parse + self.solve
+
+
+@dataclass
+class PartReport:
+    day: int
+    part: int
+    result: Optional[Result] = None
+    runs: list[Run] = field(default_factory=list)
+    error: Optional[str] = None
+    # counters collected up to the point a part was cancelled
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def fail(self, e: Exception) -> None:
+        self.error = f"{type(e).__name__}: {e}"
+        if isinstance(e, BudgetExceeded):
+            self.counters = e.counters
+
+    def summary(self) -> dict[str, Any]:
+        from statistics import median
+
+        totals = [ r.total for r in self.runs ]
+        summary: dict[str, Any] = {
+            'day': self.day,
+            'part': self.part,
+            'result': self.result,
+            'runs': len(self.runs),
+            'error': self.error,
+            'counters': self.counters,
+        }
+        if totals:
+            summary.update({
+                'min': min(totals),
+                'median': median(totals),
+                'p95': percentile(totals, 95),
+                'load_median': median(r.load for r in self.runs),
+                'parse_median': median(r.parse for r in self.runs),
+                'solve_median': median(r.solve for r in self.runs),
+            })
+
+        return summary
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values.
+
+    Args:
+        values (list[float]): non-empty list of values
+        pct (float): percentile between 0 and 100
+
+    Returns:
+        float: the value at the given percentile
+    """
+    ordered = sorted(values)
+    rank = max(ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def iter_parts(
+    day_cls: type[Day],
+    parts: Iterable[int],
+    puzzle_input: Optional[str] = None,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None,
+    engine: str = DEFAULT_ENGINE
+) -> Iterator[tuple[Result, Run]]:
+    """Construct the day once and solve the given parts on it, timing the
+    load, parse and solve phases. A part found in the cache is not parsed
+    nor solved. Solutions are yielded as the parts are solved, so the parts
+    solved before a part fails are not lost.
+
+    Args:
+        day_cls (type[Day]): class implementing the day
+        parts (Iterable[int]): parts to solve
+        puzzle_input (Optional[str]): input to use, defaults to the packaged input
+        cache (Optional[ResultCache]): cache to look up and store the solutions in
+        instrumentation (Optional[Instrumentation]): instrumentation of the day
+        budget (Optional[Budget]): budget of parsing and solving every part
+        engine (str): engine to solve the parts with, see `Day.engines`
+
+    Raises:
+        BudgetExceeded: if a part exceeds the budget
+
+    Yields:
+        Iterator[tuple[Result, Run]]: solution and timings of every part
+    """
+    if budget is not None and instrumentation is None:
+        instrumentation = Instrumentation(NullSink())
+
+    start = perf_counter()
+    day = day_cls(puzzle_input)
+    load = perf_counter() - start
+    if instrumentation is not None:
+        day.instrument(instrumentation)
+
+    for part in parts:
+        with instrumentation.limit(budget) if budget is not None else nullcontext():
+            start = perf_counter()
+            result = cache.get(day, part) if cache is not None else None
+            if result is None:
+                day.parse()
+                parsed = perf_counter()
+                result = day.solve(part, engine)
+                if cache is not None:
+                    cache.put(day, part, result)
+            else:
+                parsed = perf_counter()
+            end = perf_counter()
+
+        yield result, Run(load=load, parse=parsed - start, solve=end - parsed)
+        load = 0.0
+
+
+def run_parts(
+    day_cls: type[Day],
+    parts: Iterable[int],
+    puzzle_input: Optional[str] = None,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None,
+    engine: str = DEFAULT_ENGINE
+) -> list[tuple[Result, Run]]:
+    """Solve the given parts on a single instance of the day, see `iter_parts`."""
+    return list(iter_parts(day_cls, parts, puzzle_input, cache, instrumentation, budget, engine))
+
+
+def run_part(
+    day_cls: type[Day],
+    part: int,
+    puzzle_input: Optional[str] = None,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None,
+    engine: str = DEFAULT_ENGINE
+) -> tuple[Result, Run]:
+    """Construct the day and solve one of its parts, see `iter_parts`."""
+    return run_parts(day_cls, [part], puzzle_input, cache, instrumentation, budget, engine)[0]
+
+
+def make_jobs(days: Optional[Iterable[int]] = None, parts: Optional[Iterable[int]] = None) -> list[Job]:
+    days = sorted(DAYS) if not days else list(days)
+    parts = PARTS if parts is None else parts
+    return [ Job(day, part) for day in days for part in parts ]
+
+
+def bench_job(
+    job: Job,
+    repeat: int = 1,
+    warmup: int = 0,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None
+) -> PartReport:
+    """Run a job `warmup + repeat` times and record the timings of the last `repeat`
+    runs. An exception raised by the day, or a part running out of its budget, is
+    recorded on the report instead of propagated, so one broken day does not end
+    a benchmark of all days.
+
+    Args:
+        job (Job): day and part to run
+        repeat (int): amount of timed runs
+        warmup (int): amount of untimed runs before the timed runs
+        cache (Optional[ResultCache]): cache of solutions
+        instrumentation (Optional[Instrumentation]): instrumentation of the day
+        budget (Optional[Budget]): budget of every run
+
+    Returns:
+        PartReport: result and timings of the job
+    """
+    report = PartReport(job.day, job.part)
+    try:
+        day_cls = get_day(job.day)
+        for i in range(warmup + repeat):
+            report.result, run = run_part(day_cls, job.part, cache=cache, instrumentation=instrumentation, budget=budget)
+            if i >= warmup:
+                report.runs.append(run)
+    except Exception as e:
+        report.fail(e)
+
+    return report
+
+
+def run_days(
+    jobs: Iterable[Job],
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None
+) -> list[PartReport]:
+    """Solve the jobs once, solving consecutive jobs of the same day on a single
+    instance of the day so its input is loaded and parsed only once. The parts
+    following a part that fails or exceeds its budget are solved on a new
+    instance.
+
+    Args:
+        jobs (Iterable[Job]): days and parts to solve
+        cache (Optional[ResultCache]): cache of solutions
+        instrumentation (Optional[Instrumentation]): instrumentation of the days
+        budget (Optional[Budget]): budget of every part
+
+    Returns:
+        list[PartReport]: result and timings of every job
+    """
+    from itertools import groupby
+
+    reports: list[PartReport] = []
+    for day, day_jobs in groupby(jobs, key=lambda job: job.day):
+        day_reports = [ PartReport(job.day, job.part) for job in day_jobs ]
+        reports.extend(day_reports)
+        while day_reports:
+            solved = 0
+            try:
+                results = iter_parts(
+                    get_day(day), [ r.part for r in day_reports ],
+                    cache=cache, instrumentation=instrumentation, budget=budget
+                )
+                for report, (result, run) in zip(day_reports, results):
+                    report.result = result
+                    report.runs.append(run)
+                    solved += 1
+                day_reports = []
+            except Exception as e:
+                day_reports[solved].fail(e)
+                day_reports = day_reports[solved + 1:]
+
+
+    return reports
+
+
+def bench(
+    jobs: Iterable[Job],
+    repeat: int = 1,
+    warmup: int = 0,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None
+) -> list[PartReport]:
+    return [ bench_job(job, repeat, warmup, cache, instrumentation, budget) for job in jobs ]
+
+
+Timings = dict[tuple[int, int], float]
+
+
+def load_timings(path: Path) -> Timings:
+    """Load the median wall time of every part from a JSON report written
+    by a previous benchmark.
+
+    Args:
+        path (Path): location of the JSON report
+
+    Returns:
+        Timings: median wall time keyed on (day, part)
+    """
+    return {
+        (summary['day'], summary['part']): summary['median']
+        for summary in json.loads(path.read_text())
+        if 'median' in summary
+    }
+
+
+def parallel_bench(
+    jobs: Iterable[Job],
+    repeat: int = 1,
+    warmup: int = 0,
+    workers: Optional[int] = None,
+    timings: Optional[Timings] = None,
+    cache: Optional['ResultCache'] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    budget: Optional[Budget] = None
+) -> list[PartReport]:
+    """Fan the jobs out over a pool of processes. Jobs are submitted longest
+    expected job first, using the timings of a previous run, so the slowest
+    parts start right away and the short ones fill up the gaps. Jobs without a
+    previous timing are expected to be slow. Reports are returned in the order
+    of `jobs`.
+
+    Args:
+        jobs (Iterable[Job]): days and parts to run
+        repeat (int): amount of timed runs per job
+        warmup (int): amount of untimed runs per job
+        workers (Optional[int]): amount of processes, defaults to the amount of CPUs
+        timings (Optional[Timings]): previous timings used for scheduling
+        cache (Optional[ResultCache]): cache of solutions
+        instrumentation (Optional[Instrumentation]): instrumentation of the days, its
+            sink must be usable from other processes such as a `JsonLinesSink`
+        budget (Optional[Budget]): budget of every run
+
+    Returns:
+        list[PartReport]: result and timings of every job
+    """
+    jobs = list(jobs)
+    timings = timings or {}
+    schedule = sorted(
+        range(len(jobs)),
+        key=lambda i: timings.get((jobs[i].day, jobs[i].part), inf),
+        reverse=True
+    )
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = { i: executor.submit(bench_job, jobs[i], repeat, warmup, cache, instrumentation, budget) for i in schedule }
+        return [ futures[i].result() for i in range(len(jobs)) ]
+
+
+def format_table(reports: list[PartReport]) -> str:
+    header = ('day', 'part', 'runs', 'min', 'median', 'p95', 'load', 'parse', 'solve', 'result')
+    rows: list[tuple[str, ...]] = [header]
+    for report in reports:
+        s = report.summary()
+        if not report.runs:
+            rows.append((str(s['day']), str(s['part']), '0', *('-',) * 6, str(s['error'])))
+            continue
+
+        rows.append((
+            str(s['day']),
+            str(s['part']),
+            str(s['runs']),
+            *(f"{s[k] * 1000:.3f}ms" for k in ('min', 'median', 'p95', 'load_median', 'parse_median', 'solve_median')),
+            str(s['result']) if report.error is None else str(report.error)
+        ))
+
+    widths = [ max(len(row[i]) for row in rows) for i in range(len(header)) ]
+    return '\n'.join(
+        '  '.join(cell.rjust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def to_json(reports: list[PartReport]) -> str:
+    return json.dumps([ report.summary() for report in reports ], indent=2, default=str)
+
+
+def time_startup(days: Iterable[int], repeat: int = 10) -> dict[str, list[float]]:
+    """Measure the cold start wall time of `python -m adventofcode2023 run` for
+    the given days, next to the wall time of starting a bare interpreter.
+
+    Args:
+        days (Iterable[int]): days to solve
+        repeat (int): amount of times each command is started
+
+    Returns:
+        dict[str, list[float]]: wall times keyed on the command
+    """
+    import subprocess
+
+    commands = {
+        'python': [sys.executable, '-c', 'pass'],
+        'run': [sys.executable, '-m', __package__, 'run', *map(str, days)],
+    }
+    timings: dict[str, list[float]] = { name: [] for name in commands }
+    for _ in range(repeat):
+        for name, command in commands.items():
+            start = perf_counter()
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            timings[name].append(perf_counter() - start)
+
+    return timings
+
+
+@dataclass
+class SweepPoint:
+    scale: float
+    input_bytes: int
+    report: PartReport
+    peak_memory: Optional[int] = None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'scale': self.scale,
+            'input_bytes': self.input_bytes,
+            'peak_memory': self.peak_memory,
+            **self.report.summary()
+        }
+
+
+def sweep(
+    day: int,
+    part: int,
+    scales: Iterable[float],
+    seed: int = 0,
+    repeat: int = 1,
+    trace_memory: bool = False
+) -> list[SweepPoint]:
+    """Solve a part on generated inputs of increasing size. Every input is
+    solved `repeat` times for timing, and once more with `tracemalloc` for its
+    peak memory usage if `trace_memory` is set, since tracing slows down the
+    solver too much to time it at the same time.
+
+    Args:
+        day (int): day to run
+        part (int): part to run
+        scales (Iterable[float]): scales of the generated inputs
+        seed (int): seed of the generated inputs
+        repeat (int): amount of timed runs per input
+        trace_memory (bool): measure the peak memory usage per input
+
+    Returns:
+        list[SweepPoint]: size, timings and memory usage per input
+    """
+    from adventofcode2023.generators import generate
+    from adventofcode2023.instrumentation import MemorySink
+
+    day_cls = get_day(day)
+    points: list[SweepPoint] = []
+    for scale in scales:
+        puzzle_input = generate(day, scale, seed)
+        point = SweepPoint(scale, len(puzzle_input.encode()), PartReport(day, part))
+        try:
+            for _ in range(repeat):
+                point.report.result, run = run_part(day_cls, part, puzzle_input)
+                point.report.runs.append(run)
+
+            if trace_memory:
+                sink = MemorySink()
+                run_part(day_cls, part, puzzle_input, instrumentation=Instrumentation(sink, trace_memory=True))
+                point.peak_memory = max(r['peak_memory'] for r in sink.records)
+        except Exception as e:
+            point.report.fail(e)
+
+        points.append(point)
+
+    return points
+
+
+def format_sweep(points: list[SweepPoint]) -> str:
+    header = ('scale', 'bytes', 'median', 'parse', 'solve', 'memory', 'result')
+    rows: list[tuple[str, ...]] = [header]
+    for point in points:
+        s = point.summary()
+        if not point.report.runs:
+            rows.append((str(s['scale']), str(s['input_bytes']), *('-',) * 4, str(s['error'])))
+            continue
+
+        rows.append((
+            str(s['scale']),
+            str(s['input_bytes']),
+            *(f"{s[k] * 1000:.3f}ms" for k in ('median', 'parse_median', 'solve_median')),
+            f"{s['peak_memory'] / 2**20:.2f}MiB" if s['peak_memory'] is not None else '-',
+            str(s['result']) if point.report.error is None else str(point.report.error)
+        ))
+
+    widths = [ max(len(row[i]) for row in rows) for i in range(len(header)) ]
+    return '\n'.join(
+        '  '.join(cell.rjust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def plot_sweep(points: list[SweepPoint], path: Path) -> None:
+    """Plot time and memory against input size, requires matplotlib."""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError("Plotting a sweep requires matplotlib, install it with `pip install matplotlib`.") from e
+
+    points = [ p for p in points if p.report.runs ]
+    sizes = [ p.input_bytes for p in points ]
+    fig, (ax_time, ax_memory) = plt.subplots(1, 2, figsize=(10, 4))
+
+    ax_time.loglog(sizes, [ p.summary()['median'] for p in points ], marker='o')
+    ax_time.set(xlabel='input size (bytes)', ylabel='median wall time (s)')
+
+    memory = [ (p.input_bytes, p.peak_memory) for p in points if p.peak_memory is not None ]
+    if memory:
+        ax_memory.loglog(*zip(*memory), marker='o')
+    ax_memory.set(xlabel='input size (bytes)', ylabel='peak memory (bytes)')
+
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
@@ -0,0 +1,245 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+from adventofcode2023.instrumentation import NULL_INSTRUMENTATION, AnyInstrumentation
+
+# Graph searches over states packed into ints in range(n_states), such as
+# ((y * width) + x) * 4 + direction for a walker on a grid. Distances are kept
+# in flat arrays of int64 indexed by state and returned as NumPy arrays without
+# a copy, with UNREACHED for states that were not reached. Queues are plain
+# `deque`s and heaps of ints, where a heap entry packs the priority and the
+# state as priority * n_states + state, so pushing and popping never builds
+# a tuple.
+#
+# Every search counts the states it expands as 'states_expanded' on the
+# instrumentation, in batches, which also makes the searches cancellable by
+# a budget.
+
+UNREACHED = -1
+
+Neighbours = Callable[[int], Iterable[int]]
+WeightedNeighbours = Callable[[int], Iterable[tuple[int, int]]]
+
+_BATCH = 1024
+
+
+def pack(shape: tuple[int, ...], *coords: int) -> int:
+    """Pack coordinates into a state, in row-major order like `np.ravel_multi_index`."""
+    state = 0
+    for size, coord in zip(shape, coords):
+        state = state * size + coord
+    return state
+
+
+def unpack(shape: tuple[int, ...], state: int) -> tuple[int, ...]:
+    coords: list[int] = []
+    for size in reversed(shape):
+        state, coord = divmod(state, size)
+        coords.append(coord)
+    return tuple(reversed(coords))
+
+
+def _distances(n_states: int) -> array:
+    return array('q', [UNREACHED]) * n_states
+
+
+def bfs(
+    starts: Iterable[int],
+    n_states: int,
+    neighbours: Neighbours,
+    instrumentation: AnyInstrumentation = NULL_INSTRUMENTATION
+) -> np.ndarray:
+    """Breadth-first search from one or more states.
+
+    Args:
+        starts (Iterable[int]): states at distance zero
+        n_states (int): amount of states
+        neighbours (Neighbours): states reachable in one step from a state
+        instrumentation (AnyInstrumentation): instrumentation to count expanded states on
+
+    Returns:
+        np.ndarray: amount of steps to every state
+    """
+    dist = _distances(n_states)
+    queue: deque[int] = deque()
+    for state in starts:
+        if dist[state] == UNREACHED:
+            dist[state] = 0
+            queue.append(state)
+
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        expanded += 1
+        if expanded % _BATCH == 0:
+            instrumentation.count('states_expanded', _BATCH)
+
+        d = dist[state] + 1
+        for next_state in neighbours(state):
+            if dist[next_state] == UNREACHED:
+                dist[next_state] = d
+                queue.append(next_state)
+
+    instrumentation.count('states_expanded', expanded % _BATCH)
+    return np.frombuffer(dist, dtype=np.int64)
+
+
+def zero_one_bfs(
+    starts: Iterable[int],
+    n_states: int,
+    neighbours: WeightedNeighbours,
+    instrumentation: AnyInstrumentation = NULL_INSTRUMENTATION
+) -> np.ndarray:
+    """Shortest paths over edges costing either 0 or 1. Edges costing 0 are put
+    at the front of the queue, so the queue stays ordered by distance without
+    a heap.
+
+    Args:
+        starts (Iterable[int]): states at distance zero
+        n_states (int): amount of states
+        neighbours (WeightedNeighbours): (state, cost) of every edge leaving a state
+        instrumentation (AnyInstrumentation): instrumentation to count expanded states on
+
+    Returns:
+        np.ndarray: cost of the cheapest path to every state
+    """
+    dist = _distances(n_states)
+    expanded_states = bytearray(n_states)
+    queue: deque[int] = deque()
+    for state in starts:
+        dist[state] = 0
+        queue.append(state)
+
+    expanded = 0
+    while queue:
+        state = queue.popleft()
+        if expanded_states[state]:
+            continue
+
+        expanded_states[state] = 1
+        expanded += 1
+        if expanded % _BATCH == 0:
+            instrumentation.count('states_expanded', _BATCH)
+
+        d = dist[state]
+        for next_state, cost in neighbours(state):
+            next_d = d + cost
+            if dist[next_state] == UNREACHED or next_d < dist[next_state]:
+                dist[next_state] = next_d
+                if cost == 0:
+                    queue.appendleft(next_state)
+                else:
+                    queue.append(next_state)
+
+    instrumentation.count('states_expanded', expanded % _BATCH)
+    return np.frombuffer(dist, dtype=np.int64)
+
+
+def dijkstra(
+    starts: Iterable[int],
+    n_states: int,
+    neighbours: WeightedNeighbours,
+    is_goal: Optional[Callable[[int], bool]] = None,
+    instrumentation: AnyInstrumentation = NULL_INSTRUMENTATION
+) -> np.ndarray:
+    """Shortest paths over edges with a non-negative cost. With a goal the
+    search stops once the first goal state is expanded; the distances of the
+    states that were not expanded yet are then upper bounds.
+
+    Args:
+        starts (Iterable[int]): states at distance zero
+        n_states (int): amount of states
+        neighbours (WeightedNeighbours): (state, cost) of every edge leaving a state
+        is_goal (Optional[Callable[[int], bool]]): whether a state ends the search
+        instrumentation (AnyInstrumentation): instrumentation to count expanded states on
+
+    Returns:
+        np.ndarray: cost of the cheapest path to every state
+    """
+    dist = _distances(n_states)
+    heap: list[int] = []
+    for state in starts:
+        dist[state] = 0
+        heap.append(state)
+
+    expanded = 0
+    while heap:
+        d, state = divmod(heappop(heap), n_states)
+        # an entry left behind by a cheaper path found later
+        if d > dist[state]:
+            continue
+
+        expanded += 1
+        if expanded % _BATCH == 0:
+            instrumentation.count('states_expanded', _BATCH)
+        if is_goal is not None and is_goal(state):
+            break
+
+        for next_state, cost in neighbours(state):
+            next_d = d + cost
+            if dist[next_state] == UNREACHED or next_d < dist[next_state]:
+                dist[next_state] = next_d
+                heappush(heap, next_d * n_states + next_state)
+
+    instrumentation.count('states_expanded', expanded % _BATCH)
+    return np.frombuffer(dist, dtype=np.int64)
+
+
+def astar(
+    starts: Iterable[int],
+    n_states: int,
+    neighbours: WeightedNeighbours,
+    heuristic: Callable[[int], int],
+    is_goal: Callable[[int], bool],
+    instrumentation: AnyInstrumentation = NULL_INSTRUMENTATION
+) -> Optional[int]:
+    """Cost of the cheapest path to a goal state. The heuristic must be
+    consistent, never overestimating the cost of an edge plus the heuristic
+    of the state it leads to, so every state is expanded at most once.
+
+    Args:
+        starts (Iterable[int]): states at cost zero
+        n_states (int): amount of states
+        neighbours (WeightedNeighbours): (state, cost) of every edge leaving a state
+        heuristic (Callable[[int], int]): lower bound of the cost from a state to a goal
+        is_goal (Callable[[int], bool]): whether a state is a goal
+        instrumentation (AnyInstrumentation): instrumentation to count expanded states on
+
+    Returns:
+        Optional[int]: cost of the cheapest path, None if no goal is reachable
+    """
+    cost_to = _distances(n_states)
+    expanded_states = bytearray(n_states)
+    heap: list[int] = []
+    for state in starts:
+        cost_to[state] = 0
+        heappush(heap, heuristic(state) * n_states + state)
+
+    expanded = 0
+    result = None
+    while heap:
+        state = heappop(heap) % n_states
+        if expanded_states[state]:
+            continue
+
+        expanded_states[state] = 1
+        expanded += 1
+        if expanded % _BATCH == 0:
+            instrumentation.count('states_expanded', _BATCH)
+
+        g = cost_to[state]
+        if is_goal(state):
+            result = g
+            break
+
+        for next_state, cost in neighbours(state):
+            next_g = g + cost
+            if cost_to[next_state] == UNREACHED or next_g < cost_to[next_state]:
+                cost_to[next_state] = next_g
+                heappush(heap, (next_g + heuristic(next_state)) * n_states + next_state)
+
+    instrumentation.count('states_expanded', expanded % _BATCH)
+    return result
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Optional
+
+# Requests and responses are single lines of JSON. A request names the day and
+# part to solve, and optionally the puzzle input and a timeout in seconds:
+#
+#   {"id": 1, "day": 9, "part": 1, "input": "0 3 6 9 12 15", "timeout": 5}
+#
+# Without an input the packaged puzzle input of the day is solved. Responses
+# carry the id of their request and arrive in the order they are solved:
+#
+#   {"id": 1, "result": 18, "error": null, "worker": 1234,
+#    "timing": {"queue": 0.0, "load": 0.0, "parse": 0.0, "solve": 0.0, "total": 0.0}}
+
+# inputs are sent inline, so lines can be a lot longer than asyncio allows by default
+_LINE_LIMIT = 2**26
+
+
+def default_socket_path() -> Path:
+    base = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return Path(base).joinpath(f"adventofcode2023-{os.getuid()}.sock")
+
+
+def _worker_main(conn: Connection) -> None:
+    from numbers import Integral
+
+    from adventofcode2023 import runner
+    from adventofcode2023.days import DAYS, get_day
+
+    # importing every day up front is what makes the worker warm
+    day_classes = { day: get_day(day) for day in DAYS }
+    conn.send(os.getpid())
+
+    while True:
+        try:
+            day, part, puzzle_input = conn.recv()
+        except EOFError:
+            return
+
+        try:
+            result, run = runner.run_part(day_classes[day], part, puzzle_input)
+            # numpy scalars are not JSON serializable
+            if isinstance(result, Integral):
+                result = int(result)
+            conn.send({
+                'result': result,
+                'error': None,
+                'timing': { 'load': run.load, 'parse': run.parse, 'solve': run.solve },
+            })
+        except Exception as e:
+            conn.send({ 'result': None, 'error': f"{type(e).__name__}: {e}", 'timing': {} })
+
+
+class _Worker:
+    """A warm worker process solving one request at a time over a pipe."""
+
+    def __init__(self) -> None:
+        import multiprocessing
+
+        # the server runs threads, which do not mix with forking
+        ctx = multiprocessing.get_context('spawn')
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+        self.pid: int = self._conn.recv()
+
+    def call(self, day: int, part: int, puzzle_input: Optional[str]) -> dict[str, Any]:
+        self._conn.send((day, part, puzzle_input))
+        return self._conn.recv()
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.join()
+        self._conn.close()
+
+
+class WorkerPool:
+    """Pool of warm worker processes. A worker whose request times out is
+    killed, since a running solver can not be interrupted otherwise, and
+    replaced by a new worker in the background."""
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self._size = workers or os.cpu_count() or 1
+        # every worker is driven by a thread blocking on its pipe
+        self._threads = ThreadPoolExecutor(self._size)
+        self._idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        self._workers: set[_Worker] = set()
+        self._spawning: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        await asyncio.gather(*(self._spawn() for _ in range(self._size)))
+
+    async def _spawn(self) -> None:
+        worker = await asyncio.get_running_loop().run_in_executor(None, _Worker)
+        self._workers.add(worker)
+        self._idle.put_nowait(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        self._workers.discard(worker)
+        task = asyncio.create_task(self._spawn())
+        self._spawning.add(task)
+        task.add_done_callback(self._spawning.discard)
+
+    async def solve(self, day: int, part: int, puzzle_input: Optional[str], timeout: Optional[float]) -> dict[str, Any]:
+        """Solve a part on the first idle worker.
+
+        Args:
+            day (int): day to solve
+            part (int): part to solve
+            puzzle_input (Optional[str]): input to use, defaults to the packaged input
+            timeout (Optional[float]): seconds the worker may take to solve the part
+
+        Returns:
+            dict[str, Any]: result, error and timings of the request
+        """
+        start = perf_counter()
+        worker = await self._idle.get()
+        queue = perf_counter() - start
+
+        loop = asyncio.get_running_loop()
+        answered = False
+        try:
+            response = await asyncio.wait_for(
+                loop.run_in_executor(self._threads, worker.call, day, part, puzzle_input),
+                timeout
+            )
+            answered = True
+        except TimeoutError:
+            response = { 'result': None, 'error': f"TimeoutError: not solved within {timeout}s", 'timing': {} }
+        except (EOFError, OSError) as e:
+            # the worker died, for example because it ran out of memory
+            response = { 'result': None, 'error': f"{type(e).__name__}: worker died", 'timing': {} }
+        finally:
+            # a worker that did not answer may still be solving, so it is only
+            # trusted with a next request once it answered
+            if answered:
+                self._idle.put_nowait(worker)
+            else:
+                self._replace(worker)
+
+        response['worker'] = worker.pid
+        response['timing'] = { 'queue': queue, **response['timing'], 'total': perf_counter() - start }
+        return response
+
+    async def close(self) -> None:
+        for task in self._spawning:
+            task.cancel()
+        for worker in self._workers:
+            worker.kill()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+
+def _is_int(value: Any) -> bool:
+    # JSON booleans are ints in Python
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class SolverServer:
+
+    def __init__(self, pool: WorkerPool, timeout: Optional[float] = None) -> None:
+        self._pool = pool
+        self._timeout = timeout
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Solve every request sent over a connection concurrently, writing
+        the responses back as they finish."""
+        lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, lock: asyncio.Lock) -> None:
+        from adventofcode2023.days import DAYS
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            day, part = request['day'], request['part']
+            puzzle_input = request.get('input')
+            timeout = request.get('timeout', self._timeout)
+            if not _is_int(day) or not _is_int(part):
+                raise TypeError(f"Day {day!r} and part {part!r} should be integers.")
+            if day not in DAYS or part not in (1, 2):
+                raise ValueError(f"Unknown day {day} or part {part}.")
+            if puzzle_input is not None and not isinstance(puzzle_input, str):
+                raise TypeError(f"Input should be a string, not {type(puzzle_input).__name__}.")
+            if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool)):
+                raise TypeError(f"Timeout {timeout!r} should be a number of seconds.")
+
+            response = await self._pool.solve(day, part, puzzle_input, timeout)
+        except Exception as e:
+            # any failure is answered, a dropped connection would lose every
+            # other request sent over it
+            response = { 'result': None, 'error': f"{type(e).__name__}: {e}", 'timing': {} }
+
+        async with lock:
+            writer.write((json.dumps({ 'id': request_id, **response }) + '\n').encode())
+            await writer.drain()
+
+
+async def serve(
+    socket_path: Optional[Path] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None
+) -> None:
+    """Serve requests on a Unix socket, or on localhost when a port is given,
+    until interrupted.
+
+    Args:
+        socket_path (Optional[Path]): location of the socket, see `default_socket_path`
+        port (Optional[int]): port to listen on localhost instead of a socket
+        workers (Optional[int]): amount of worker processes, defaults to one per CPU
+        timeout (Optional[float]): seconds a request may take unless it sets its own timeout
+    """
+    pool = WorkerPool(workers)
+    await pool.start()
+    server = SolverServer(pool, timeout)
+
+    if port is not None:
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', port, limit=_LINE_LIMIT)
+    else:
+        socket_path = socket_path or default_socket_path()
+        socket_path.unlink(missing_ok=True)
+        listener = await asyncio.start_unix_server(server.handle, socket_path, limit=_LINE_LIMIT)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        async with listener:
+            await stop.wait()
+    finally:
+        await pool.close()
+        if port is None and socket_path is not None:
+            socket_path.unlink(missing_ok=True)
+
+
+def solve_remote(
+    requests: Iterable[tuple[int, int, Optional[str]]],
+    socket_path: Optional[Path] = None,
+    port: Optional[int] = None,
+    timeout: Optional[float] = None
+) -> list[dict[str, Any]]:
+    """Send requests to a running server over a single connection, see `serve`.
+
+    Args:
+        requests (Iterable[tuple[int, int, Optional[str]]]): day, part and input of every request
+        socket_path (Optional[Path]): location of the socket of the server
+        port (Optional[int]): port of the server on localhost instead of a socket
+        timeout (Optional[float]): seconds every request may take
+
+    Returns:
+        list[dict[str, Any]]: response to every request, in the order of the requests
+    """
+    if port is not None:
+        conn = socket.create_connection(('127.0.0.1', port))
+    else:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.connect(str(socket_path or default_socket_path()))
+
+    with conn, conn.makefile('rwb') as f:
+        count = 0
+        for count, (day, part, puzzle_input) in enumerate(requests, start=1):
+            request: dict[str, Any] = { 'id': count - 1, 'day': day, 'part': part, 'input': puzzle_input }
+            if timeout is not None:
+                request['timeout'] = timeout
+            f.write((json.dumps(request) + '\n').encode())
+        f.flush()
+
+        responses: list[dict[str, Any]] = [{}] * count
+        for _ in range(count):
+            response = json.loads(f.readline())
+            responses[response['id']] = response
+
+    return responses
@@ -0,0 +1,43 @@
+from io import TextIOBase
+from typing import BinaryIO, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 2**16
+
+
+def records(
+    source: BinaryIO | Iterable[str],
+    separator: bytes = b'\n',
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Split a puzzle input into records, such as lines, without reading it
+    into memory as a whole. A binary file object is read `chunk_size` bytes
+    at a time, so memory is bounded by the chunk size and the longest record.
+    An iterable of lines, such as a text file, is split further when the
+    separator is not a newline. Newlines are never part of a record.
+
+    Args:
+        source (BinaryIO | Iterable[str]): binary file object or lines of the input
+        separator (bytes): bytes separating the records
+        chunk_size (int): amount of bytes read from a file object at a time
+
+    Yields:
+        Iterator[str]: every record, possibly empty
+    """
+    newline = separator == b'\n'
+    if not hasattr(source, 'read') or isinstance(source, TextIOBase):
+        for line in source:
+            line = line.rstrip('\r\n')
+            if newline:
+                yield line
+            else:
+                yield from line.split(separator.decode())
+        return
+
+    read = source.read  # type: ignore[union-attr]
+    pending = b''
+    while chunk := read(chunk_size):
+        *complete, pending = (pending + chunk).split(separator)
+        for record in complete:
+            yield (record.rstrip(b'\r') if newline else record.replace(b'\n', b'')).decode()
+
+    yield (pending.rstrip(b'\r\n') if newline else pending.replace(b'\n', b'')).decode()
@@ -0,0 +1,73 @@
+from pathlib import Path
+import pytest
+
+from adventofcode2023.baseline import DEFAULT_BASELINE, Baseline, BenchCase, measure, record, settings_from_env
+from adventofcode2023.generators import generate
+
+
+@pytest.mark.unit
+def test_bench_case_name():
+    assert BenchCase(9, 2).name == 'day9-part2-real'
+    assert BenchCase(9, 2, scale=0.5).name == 'day9-part2-x0.5'
+    assert BenchCase(9, 2).puzzle_input() is None
+    assert BenchCase(9, 2, scale=0.05).puzzle_input()
+
+    case = BenchCase(5, 2, scale=0.5, variant='adversarial', engine='reverse')
+    assert case.name == 'day5-part2-x0.5-adversarial-reverse'
+    assert case.puzzle_input() == generate(5, 0.5, variant='adversarial')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='median,expected_limit',
+    argvalues=[
+        (0.0005, 0.0025),
+        (0.1, 0.15),
+    ]
+)
+def test_baseline_limit(median: float, expected_limit: float):
+    case = BenchCase(1, 1)
+    assert Baseline({ case: median }, tolerance=1.5, min_slack=0.002).limit(case) == pytest.approx(expected_limit)
+
+
+@pytest.mark.unit
+def test_baseline_round_trip(tmp_path: Path):
+    baseline = Baseline(
+        { BenchCase(1, 1): 0.1, BenchCase(9, 2, scale=2): 0.2, BenchCase(5, 2, 1, 'adversarial', 'reverse'): 0.3 },
+        tolerance=2,
+        min_slack=0.01
+    )
+    baseline.save(tmp_path.joinpath('baseline.json'))
+    assert Baseline.load(tmp_path.joinpath('baseline.json')) == baseline
+
+
+@pytest.mark.unit
+def test_measure():
+    assert measure(BenchCase(9, 1, scale=0.05), repeat=3, warmup=1) > 0
+    assert measure(BenchCase(5, 2, scale=0.05, variant='adversarial', engine='reverse'), repeat=1, warmup=0) > 0
+
+
+@pytest.mark.unit
+def test_record():
+    cases = [BenchCase(9, 1, scale=0.05), BenchCase(9, 2, scale=0.05)]
+    baseline = record(cases, repeat=1, warmup=0, tolerance=2, rounds=3)
+    assert list(baseline.medians) == cases
+    assert all( median > 0 for median in baseline.medians.values() )
+    assert baseline.tolerance == 2
+
+
+_BASELINE = Baseline.load(DEFAULT_BASELINE)
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize(argnames='case', argvalues=list(_BASELINE.medians), ids=lambda case: case.name)
+def test_bench(case: BenchCase):
+    repeat, warmup, tolerance = settings_from_env()
+    baseline = _BASELINE if tolerance is None else Baseline(_BASELINE.medians, tolerance, _BASELINE.min_slack)
+
+    median = measure(case, repeat, warmup)
+    assert median <= baseline.limit(case), (
+        f"{case.name} took {median * 1000:.3f}ms, "
+        f"baseline {baseline.medians[case] * 1000:.3f}ms, "
+        f"limit {baseline.limit(case) * 1000:.3f}ms"
+    )
@@ -0,0 +1,91 @@
+import os
+import pytest
+
+from adventofcode2023 import runner
+from adventofcode2023 import cache as cache_module
+from adventofcode2023.cache import ResultCache, dependencies
+from adventofcode2023.days import Day1, Day9, Day19
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path)
+
+
+@pytest.mark.unit
+def test_get_put(cache: ResultCache):
+    day = Day9('0 3 6 9 12 15')
+    assert cache.get(day, 1) is None
+
+    cache.put(day, 1, 18)
+    assert cache.get(day, 1) == 18
+    assert cache.get(day, 2) is None
+    assert cache.get(Day9('1 3 6 10 15 21'), 1) is None
+
+
+@pytest.mark.unit
+def test_none_is_not_cached(cache: ResultCache):
+    day = Day9('0 3 6 9 12 15')
+    cache.put(day, 2, None)
+    assert list(cache.directory.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_code_version_differs_per_day():
+    assert ResultCache.code_version(Day1) != ResultCache.code_version(Day9)
+
+
+@pytest.mark.unit
+def test_dependencies():
+    modules = dependencies('adventofcode2023.days.day19')
+    assert {'adventofcode2023.days.day19', 'adventofcode2023.day', 'adventofcode2023.intervals'} <= set(modules)
+    assert 'adventofcode2023.search' not in modules
+
+
+@pytest.mark.unit
+def test_changing_a_shared_module_invalidates(cache: ResultCache, monkeypatch: pytest.MonkeyPatch):
+    day = Day19('in{x<2:A,R}\n\n{x=1,m=2,a=3,s=4}')
+    cache.put(day, 1, 10)
+    assert cache.get(day, 1) == 10
+
+    read_source = cache_module._read_source
+    monkeypatch.setattr(
+        cache_module, '_read_source',
+        lambda path: read_source(path) + (b'# fixed' if path.name == 'intervals.py' else b'')
+    )
+    monkeypatch.setattr(ResultCache, '_code_versions', {})
+    assert cache.get(day, 1) is None
+
+
+@pytest.mark.unit
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=100)
+    days = [ Day9(f'{n} {n}') for n in range(3) ]
+    cache.put(days[0], 1, 1)
+    cache.put(days[1], 1, 2)
+
+    # every entry takes up ~36 bytes, so the third entry evicts the least recently used one
+    path = cache._path(cache.key(days[1], 1))
+    os.utime(path, (0, 0))
+    cache.put(days[2], 1, 3)
+
+    assert cache.get(days[0], 1) == 1
+    assert cache.get(days[1], 1) is None
+    assert cache.get(days[2], 1) == 3
+
+
+@pytest.mark.unit
+def test_clear(cache: ResultCache):
+    cache.put(Day9('0 3 6 9 12 15'), 1, 18)
+    cache.put(Day1('1abc2'), 1, 12)
+
+    assert cache.clear([1]) == 1
+    assert cache.get(Day1('1abc2'), 1) is None
+    assert cache.clear() == 1
+
+
+@pytest.mark.unit
+def test_run_part_uses_cache(cache: ResultCache):
+    cache.put(Day9('0 3 6 9 12 15'), 1, -1)
+    result, _ = runner.run_part(Day9, 1, '0 3 6 9 12 15', cache)
+    assert result == -1
@@ -0,0 +1,59 @@
+import pytest
+
+from adventofcode2023 import cycles
+from adventofcode2023.cycles import Cycle
+
+
+# 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 2 -> ...
+def step(state: int) -> int:
+    return 2 if state == 5 else state + 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='find', argvalues=[cycles.detect_cycle, cycles.brent])
+def test_find_cycle(find):
+    assert find(0, step) == Cycle(2, 4)
+    assert find(0, step, max_steps=3) is None
+    assert find(2, step) == Cycle(0, 4)
+
+
+@pytest.mark.unit
+def test_key():
+    # states only differ in a counter that is not part of the snapshot
+    cycle = cycles.detect_cycle((0, 0), lambda s: (step(s[0]), s[1] + 1), key=lambda s: s[0])
+    assert cycle == Cycle(2, 4)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='n,expected', argvalues=[(0, 0), (1, 1), (5, 5), (6, 2), (9, 5), (10**12, 2 + (10**12 - 2) % 4)])
+def test_reduce_and_state_after(n: int, expected: int):
+    assert Cycle(2, 4).reduce(n) == expected
+    assert cycles.state_after(0, step, n) == expected
+
+
+@pytest.mark.unit
+def test_state_after_in_place():
+    # a list updated in place, compared on a snapshot of its contents
+    def step_in_place(state: list[int]) -> list[int]:
+        state[0] = step(state[0])
+        return state
+
+    assert cycles.state_after([0], step_in_place, 10**9 + 1, key=tuple) == [Cycle(2, 4).reduce(10**9 + 1)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='n', argvalues=[0, 3, 6, 7, 1000])
+def test_total(n: int):
+    values = [ 10 * state + 1 for state in range(6) ]
+    state, expected = 0, 0
+    for _ in range(n):
+        expected += values[state]
+        state = step(state)
+    assert Cycle(2, 4).total(values, n) == expected
+
+
+@pytest.mark.unit
+def test_first_step():
+    assert cycles.first_step(0, step, lambda s: s == 4) == 4
+    assert cycles.first_step(0, step, lambda s: s == 7) is None
+    assert cycles.first_step(0, step, lambda s: s == 4, max_steps=3) is None
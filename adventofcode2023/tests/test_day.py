@@ -0,0 +1,113 @@
+import pytest
+
+from adventofcode2023.days import Day2, Day9
+
+
+@pytest.mark.unit
+def test_parse_is_cached():
+    day = Day9('0 3 6 9 12 15\n1 3 6 10 15 21')
+    parsed = day.parse()
+    assert parsed == [[0, 3, 6, 9, 12, 15], [1, 3, 6, 10, 15, 21]]
+    assert day.parse() is parsed
+
+
+@pytest.mark.unit
+def test_parse_is_shared_by_both_parts(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+    day = Day9('10 13 16 21 30 45')
+    parse = day._parse
+    monkeypatch.setattr(day, '_parse', lambda: calls.append(1) or parse())
+
+    assert day.solve_part_one() == 68
+    assert day.solve_part_two() == 5
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_parse_is_shared_by_day19_parts(monkeypatch: pytest.MonkeyPatch):
+    from adventofcode2023.days import Day19
+    from adventofcode2023.generators import generate
+
+    puzzle_input = generate(19, 0.1, 0)
+    calls = []
+    day = Day19(puzzle_input)
+    parse = day._parse
+    monkeypatch.setattr(day, '_parse', lambda: calls.append(1) or parse())
+
+    assert day.solve_part_one() == Day19(puzzle_input).solve_part_one()
+    assert day.solve_part_two() == Day19(puzzle_input).solve_part_two()
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_day20_modules_are_not_shared():
+    from adventofcode2023.days import Day20
+
+    day = Day20('broadcaster -> a\n%a -> inv, con\n&inv -> b\n%b -> con\n&con -> output')
+    # every solve presses the button on modules in their initial state
+    assert day.solve(1) == day.solve(1) == day.solve(1, 'reference') == 11687500
+
+
+@pytest.mark.unit
+def test_default_parse_is_the_puzzle_input():
+    assert Day2('')._puzzle_input == ''
+    from adventofcode2023.days import Day15
+    assert Day15('rn=1').parse() == 'rn=1'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='day,part',
+    argvalues=[
+        (6, 1), (6, 2), (9, 1), (9, 2), (15, 1),
+    ]
+)
+def test_solve_batch_vectorized(day: int, part: int):
+    from adventofcode2023.days import get_day
+    from adventofcode2023.generators import generate
+
+    day_cls = get_day(day)
+    assert part in day_cls._vectorized_parts
+    inputs = [ generate(day, 0.05, seed) for seed in range(10) ]
+    assert list(day_cls.solve_batch(inputs, part, chunk_size=3)) == [ day_cls(i).solve(part) for i in inputs ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='workers', argvalues=[1, 2])
+def test_solve_batch_falls_back_to_solving_one_by_one(workers: int):
+    from adventofcode2023.days import Day1
+    from adventofcode2023.puzzle_input import PuzzleInput
+
+    inputs = [ '1abc2\npqr3stu8vwx', PuzzleInput.from_string('a1b2c3d4e5f'), 'treb7uchet' ] * 3
+    assert list(Day1.solve_batch(iter(inputs), 1, workers=workers, chunk_size=2)) == [50, 15, 77] * 3
+
+
+@pytest.mark.unit
+def test_solve_batch_invalid_part():
+    with pytest.raises(ValueError):
+        list(Day9.solve_batch(['0 3 6'], 3))
+
+
+@pytest.mark.unit
+def test_engines():
+    assert Day9.engines(1) == ['default', 'matrix']
+    assert Day2.engines(1) == ['default']
+
+    day = Day9('10 13 16 21 30 45')
+    assert day.solve(1, 'matrix') == day.solve(1) == 68
+    with pytest.raises(ValueError):
+        day.solve(1, 'unknown')
+
+
+@pytest.mark.unit
+def test_engines_are_inherited():
+    from adventofcode2023.day import engine
+
+    class Day9Variant(Day9):
+        @engine(2, 'constant')
+        def _solve_constant(self):
+            return 5
+
+    assert Day9Variant.engines(2) == ['default', 'matrix', 'constant']
+    assert Day9.engines(2) == ['default', 'matrix']
+    assert Day9Variant('10 13 16 21 30 45').solve(2, 'constant') == 5
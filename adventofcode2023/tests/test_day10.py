@@ -1,5 +1,6 @@
 import pytest
 
+from adventofcode2023 import grids
 from adventofcode2023.days import Day10
 from textwrap import dedent
 
@@ -31,4 +32,4 @@ from textwrap import dedent
     ]
 )
 def test_find_start_coordinates(input: str, expected_output: tuple[int, int]):
-    assert Day10.find_start_coordinates(dedent(input).strip()) == expected_output
+    assert Day10.find_start_coordinates(grids.parse(dedent(input).strip())) == expected_output
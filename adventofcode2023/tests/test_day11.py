@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from adventofcode2023 import grids
 from adventofcode2023.days import Day11
 
 @pytest.fixture
@@ -10,17 +11,17 @@ def day() -> Day11:
     argnames='input,expected_output',
     argvalues=[
         (
-            np.array((
-                ('.', '#', '.', '.'),
-                ('.', '.', '#', '.'),
-                ('.', '.', '.', '.')
-            ), dtype=np.dtype('U1')),
-            np.array((
-                ('.', '.', '#', '.', '.', '.'),
-                ('.', '.', '.', '#', '.', '.'),
-                ('.', '.', '.', '.', '.', '.'),
-                ('.', '.', '.', '.', '.', '.')
-            ), dtype=np.dtype('U1'))
+            grids.from_string(
+                '.#..\n'
+                '..#.\n'
+                '....'
+            ),
+            grids.from_string(
+                '..#...\n'
+                '...#..\n'
+                '......\n'
+                '......'
+            )
         )
     ]
 )
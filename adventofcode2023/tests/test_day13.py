@@ -1,6 +1,7 @@
 from textwrap import dedent
 import numpy as np
 import pytest
+from adventofcode2023 import grids
 from adventofcode2023.days import Day13
 
 @pytest.fixture
@@ -125,6 +126,6 @@ def input_(request: pytest.FixtureRequest) -> str:
 )
 def test_get_reflection_point(day: Day13, input_: str, expected_output: tuple[int, int]):
     vert, hori = expected_output
-    p = np.array(object=[ list(s) for s in input_.split('\n') ], dtype=np.dtype('U1'))
+    p = grids.parse(input_)
     assert day.get_reflection_point_hori(p) == hori
     assert day.get_reflection_point_vert(p) == vert
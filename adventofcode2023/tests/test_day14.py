@@ -1,5 +1,53 @@
 import pytest
+from textwrap import dedent
+
+from adventofcode2023.days import Day14
+from adventofcode2023.days.day14 import Direction
 
 # test example input
+EXAMPLE_INPUT = dedent("""
+O....#....
+O.OO#....#
+.....##...
+OO.#O....O
+.O.....O#.
+O.#..O.#.#
+..O..#O..O
+.......O..
+#....###..
+#OO..#....""").strip()
+
+
+@pytest.mark.parametrize(
+    argnames='direction,expected_output',
+    argvalues=[
+        (Direction.UP, ('O#O', '..O', '...')),
+        (Direction.DOWN, ('.#.', '..O', 'O.O')),
+        (Direction.LEFT, ('.#O', 'OO.', '...')),
+        (Direction.RIGHT, ('.#O', '.OO', '...')),
+    ]
+)
+def test_tilt(direction: Direction, expected_output: tuple[str, ...]):
+    assert Day14('').tilt(('.#O', 'O.O', '...'), direction) == expected_output
+
+
+def test_spin_cycle():
+    day = Day14(EXAMPLE_INPUT)
+    platform = day.spin_cycle(tuple(EXAMPLE_INPUT.splitlines()))
+    assert platform == tuple(dedent("""
+    .....#....
+    ....#...O#
+    ...OO##...
+    .OO#......
+    .....OOO#.
+    .O#...O#.#
+    ....O#....
+    ......OOOO
+    #...O###..
+    #..OO#....""").strip().splitlines())
 
 
+@pytest.mark.example
+@pytest.mark.parametrize(argnames='ending', argvalues=['', '\n'])
+def test_part_two_example(ending: str):
+    assert Day14(EXAMPLE_INPUT + ending).solve(2) == 64
@@ -1,5 +1,5 @@
 import pytest
-from adventofcode2023.days.day15 import hash_
+from adventofcode2023.days.day15 import hash_, hash_many
 
 @pytest.mark.parametrize(
     argnames='input,expected_output',
@@ -10,3 +10,8 @@ from adventofcode2023.days.day15 import hash_
 )
 def test_hash_(input: str, expected_output: int):
     assert hash_(input) == expected_output
+
+
+def test_hash_many():
+    steps = 'rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7,'.split(',')
+    assert hash_many(steps).tolist() == [ hash_(step) for step in steps ]
@@ -0,0 +1,36 @@
+from textwrap import dedent
+
+import numpy as np
+import pytest
+from adventofcode2023.days import Day17
+from adventofcode2023.days.day17 import Point, heuristic
+
+
+@pytest.mark.unit
+def test_heuristic():
+    grid = np.array([
+        [1, 2, 5, 8, 3],
+        [4, 2, 9, 1, 5],
+        [3, 2, 6, 7, 4]
+    ], dtype=np.int8)
+    assert heuristic(grid, Point(2, 1)) == 26
+
+
+@pytest.mark.example
+def test_part_one_example():
+    example_input = dedent("""
+    2413432311323
+    3215453535623
+    3255245654254
+    3446585845452
+    4546657867536
+    1438598798454
+    4457876987766
+    3637877979653
+    4654967986887
+    4564679986453
+    1224686865563
+    2546548887735
+    4322674655533
+    """).strip()
+    assert Day17(example_input).solve(1) == 102
@@ -1,8 +1,13 @@
 import pytest
 import numpy as np
+from adventofcode2023 import grids
 from adventofcode2023.days import Day18
 from adventofcode2023.days.day18 import Direction, Point, DigOperation
 
+def as_grid(rows: list[list[str]]) -> np.ndarray:
+    return grids.from_string('\n'.join( ''.join(row) for row in rows ))
+
+
 @pytest.fixture
 def day() -> Day18:
     return Day18('')
@@ -55,7 +60,7 @@ def test_get_grid_points(day: Day18, input_: list[DigOperation], expected_output
                 ]
             ),
             # min_x = -4, min_y = -3, max_x = 0, max_y = 5
-            np.array([
+            as_grid([
                 ['.', '.', '#', '.', '.'],
                 ['.', '.', '#', '.', '.'],
                 ['.', '.', '#', '.', '.'],
@@ -78,7 +83,7 @@ def test_get_grid(day: Day18, input_: tuple[list[DigOperation], tuple[int, int],
 
 @pytest.fixture
 def grid() -> np.ndarray:
-    return np.array([
+    return as_grid([
         ['#', '#', '#', '#', '#', '#', '#'],
         ['#', '.', '.', '.', '.', '.', '#'],
         ['#', '#', '#', '.', '.', '.', '#'],
@@ -89,7 +94,7 @@ def grid() -> np.ndarray:
         ['#', '#', '.', '.', '#', '#', '#'],
         ['.', '#', '.', '.', '.', '.', '#'],
         ['.', '#', '#', '#', '#', '#', '#']
-    ], dtype=np.dtype('U1'))
+    ])
 
 @pytest.mark.parametrize(
     argnames='input_,expected_output',
@@ -126,7 +131,7 @@ def test_inside_trench(day: Day18, grid: np.ndarray, input_: Point, expected_out
     argvalues=[
         (
             (
-                np.array([
+                as_grid([
                     ['#', '#', '#', '#', '#', '#', '#'],
                     ['#', '.', '.', '.', '.', '.', '#'],
                     ['#', '#', '#', '.', '.', '.', '#'],
@@ -137,10 +142,10 @@ def test_inside_trench(day: Day18, grid: np.ndarray, input_: Point, expected_out
                     ['#', '#', '.', '.', '#', '#', '#'],
                     ['.', '#', '.', '.', '.', '.', '#'],
                     ['.', '#', '#', '#', '#', '#', '#']
-                ], dtype=np.dtype('U1')),
+                ]),
                 Point(1, 1)
             ),
-            np.array([
+            as_grid([
                 ['#', '#', '#', '#', '#', '#', '#'],
                 ['#', '#', '#', '#', '#', '#', '#'],
                 ['#', '#', '#', '#', '#', '#', '#'],
@@ -151,7 +156,7 @@ def test_inside_trench(day: Day18, grid: np.ndarray, input_: Point, expected_out
                 ['#', '#', '#', '#', '#', '#', '#'],
                 ['.', '#', '#', '#', '#', '#', '#'],
                 ['.', '#', '#', '#', '#', '#', '#']
-            ], dtype=np.dtype('U1')),
+            ]),
         )
     ]
 )
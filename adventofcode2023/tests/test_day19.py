@@ -0,0 +1,45 @@
+import pytest
+from textwrap import dedent
+
+from adventofcode2023.days import Day19
+from adventofcode2023.intervals import Box, Interval
+
+EXAMPLE_INPUT = dedent("""
+px{a<2006:qkq,m>2090:A,rfg}
+pv{a>1716:R,A}
+lnx{m>1548:A,A}
+rfg{s<537:gd,x>2440:R,A}
+qs{s>3448:A,lnx}
+qkq{x<1416:A,crn}
+crn{x>2662:A,R}
+in{s<1351:px,qqz}
+qqz{s>2770:qs,m<1801:hdj,R}
+gd{a>3333:R,R}
+hdj{m>838:A,pv}
+
+{x=787,m=2655,a=1222,s=2876}
+{x=1679,m=44,a=2067,s=496}
+{x=2036,m=264,a=79,s=2244}
+{x=2461,m=1339,a=466,s=291}
+{x=2127,m=1623,a=2188,s=1013}""").strip()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='workflows,expected_output',
+    argvalues=[
+        ('in{A}', 10**4),
+        ('in{x<4:A,R}', 3 * 10**3),
+        ('in{x>4:R,m<3:A,R}', 4 * 2 * 10**2),
+        ('in{x<5:a,R}\na{x>2:A,R}', 2 * 10**3),
+    ]
+)
+def test_count_accepted(workflows: str, expected_output: int):
+    box = Box((Interval(1, 11),) * 4)
+    assert Day19.count_accepted(Day19.parse_workflows(workflows), box) == expected_output
+
+
+@pytest.mark.example
+@pytest.mark.parametrize(argnames='part,expected_output', argvalues=[(1, 19114), (2, 167409079868000)])
+def test_example(part: int, expected_output: int):
+    assert Day19(EXAMPLE_INPUT).solve(part) == expected_output
@@ -1,8 +1,8 @@
 import pytest
 
+from adventofcode2023 import grids
 from adventofcode2023.days import Day3
 from typing import Iterable
-from copy import deepcopy
 
 @pytest.fixture(scope='function')
 def day3() -> Day3:
@@ -13,17 +13,18 @@ def day3() -> Day3:
     argvalues=[
         (
             range(3),
-            ['4', '6', '7', '.', '.', '1', '1', '4', '.', '.'],
+            '467..114..',
             467
         ),
         (
             range(5, 10),
-            ['4', '6', '7', '.', '.', '1', '1', '4', '5', '6'],
+            '467..11456',
             11456
         )
     ]
 )
-def test_parse_number_from_grid(day3: Day3, range_: Iterable[int], chars: list[str], output: int):
+def test_parse_number_from_grid(day3: Day3, range_: Iterable[int], chars: str, output: int):
     for i in range_:
-        copy = deepcopy(chars)
-        assert day3._parse_number_from_grid(copy, i) == output
+        row = grids.from_string(chars)[0]
+        assert day3._parse_number_from_grid(row, i) == output
+        assert all( c == ord('.') for c in row[range_.start:range_.stop] )
@@ -0,0 +1,121 @@
+import random
+import tracemalloc
+from textwrap import dedent
+
+import pytest
+from adventofcode2023.days.day5 import LAYERS, BonusSeedMapper, Day5, Mapping, Range, SeedMapper
+from adventofcode2023.intervals import IntervalSet
+
+EXAMPLE = dedent("""\
+    seeds: 79 14 55 13
+
+    seed-to-soil map:
+    50 98 2
+    52 50 48
+
+    soil-to-fertilizer map:
+    0 15 37
+    37 52 2
+    39 0 15
+
+    fertilizer-to-water map:
+    49 53 8
+    0 11 42
+    42 0 7
+    57 7 4
+
+    water-to-light map:
+    88 18 7
+    18 25 70
+
+    light-to-temperature map:
+    45 77 23
+    81 45 19
+    68 64 13
+
+    temperature-to-humidity map:
+    0 69 1
+    1 0 69
+
+    humidity-to-location map:
+    60 56 37
+    56 93 4""")
+
+
+def small_almanac(rng: random.Random) -> str:
+    """Almanac with few enough seeds to map every seed on its own."""
+    seeds = ' '.join( f"{rng.randrange(200)} {rng.randint(1, 20)}" for _ in range(4) )
+    parts = [f"seeds: {seeds}"]
+    for layer in range(7):
+        cuts = sorted(rng.sample(range(1, 250), 8))
+        lines = [f"layer-{layer} map:"]
+        for start, end in zip(cuts[::2], cuts[1::2]):
+            lines.append(f"{rng.randrange(250)} {start} {end - start}")
+        parts.append('\n'.join(lines))
+    return '\n\n'.join(parts)
+
+
+@pytest.mark.unit
+def test_mapping_from_line():
+    assert Mapping.from_line("50 98 2") == Mapping(Range(50, 51), Range(98, 99))
+
+
+@pytest.mark.unit
+def test_map_ranges():
+    mappings = [Mapping.from_line("50 98 2"), Mapping.from_line("52 50 48")]
+    ranges = IntervalSet([(40, 60), (97, 101)])
+    # 40-49 and 100 are not mapped, 50-59 map to 52-61, 97 to 99 and 98-99 to 50-51
+    assert SeedMapper.map_ranges(ranges, mappings) == IntervalSet([(40, 62), (99, 101)])
+
+
+@pytest.mark.example
+@pytest.mark.parametrize(argnames='engine', argvalues=Day5.engines(2))
+def test_example_part_two(engine: str):
+    assert Day5(EXAMPLE).solve(2, engine) == 46
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='seed', argvalues=range(10))
+def test_lowest_location_matches_every_seed(seed: int):
+    almanac = small_almanac(random.Random(seed))
+    expected = BonusSeedMapper.from_string(almanac).get_lowest_location()
+    assert Day5(almanac).solve_part_two() == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='seed', argvalues=range(5))
+def test_location_map_matches_layers(seed: int):
+    seed_mapper = SeedMapper.from_string(small_almanac(random.Random(seed)))
+    for result in seed_mapper.get_seed_mappings():
+        layers = list(seed_mapper.map_seed(result.number))
+        assert [ name for name, _ in layers ] == list(LAYERS)
+        assert seed_mapper.location_map.lookup(result.number) == result.location == layers[-1][1]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='part,engine', argvalues=[
+    (1, 'layered'), (1, 'vectorized'), (1, 'reference'), (2, 'layered'), (2, 'reverse'), (2, 'reference')
+])
+@pytest.mark.parametrize(argnames='seed', argvalues=range(5))
+def test_engines_agree(part: int, engine: str, seed: int):
+    almanac = small_almanac(random.Random(seed))
+    assert Day5(almanac).solve(part) == Day5(almanac).solve(part, engine)
+
+
+@pytest.mark.unit
+def test_memory_per_seed():
+    seed_mapper = SeedMapper.from_string(small_almanac(random.Random(0)))
+    rng = random.Random(0)
+    seed_mapper.seeds = [ rng.randrange(2**32) for _ in range(10_000) ]
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        results = seed_mapper.get_seed_mappings()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # a slotted object with two ints, a location and a list entry
+    assert len(results) == 10_000
+    assert (after - before) / len(results) < 128
@@ -0,0 +1,25 @@
+import pytest
+from adventofcode2023.days.day6 import count_ways
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='times,distances,expected_output',
+    argvalues=[
+        ([7, 15, 30], [9, 40, 200], [4, 8, 9]),
+        ([71530], [940200], [71503]),
+        ([5, 4, 0], [6, 4, 0], [0, 0, 0]),
+        ([2**40], [0], [2**40 - 1]),
+        ([], [], []),
+    ]
+)
+def test_count_ways(times: list[int], distances: list[int], expected_output: list[int]):
+    assert count_ways(times, distances) == expected_output
+
+
+@pytest.mark.unit
+def test_count_ways_matches_brute_force():
+    times = list(range(60))
+    distances = [ max((t * t) // 4 - (t % 7), 0) for t in times ]
+    expected_output = [ sum(h * (t - h) > d for h in range(1, t + 1)) for t, d in zip(times, distances) ]
+    assert count_ways(times, distances) == expected_output
@@ -0,0 +1,31 @@
+import pytest
+from adventofcode2023.days.day7 import HandOfCards, HandType
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='input_,expected_output',
+    argvalues=[
+        (HandType.FIVE_OF_A_KIND, 7),
+        (HandType.HIGH_CARD, 1),
+    ]
+)
+def test_hand_type_strength(input_: HandType, expected_output: int):
+    assert input_.strength() == expected_output
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='input_,expected_output',
+    argvalues=[
+        ('AAAAA', HandType.FIVE_OF_A_KIND),
+        ('AA8AA', HandType.FOUR_OF_A_KIND),
+        ('23332', HandType.FULL_HOUSE),
+        ('TTT98', HandType.THREE_OF_A_KIND),
+        ('23432', HandType.TWO_PAIR),
+        ('A23A4', HandType.ONE_PAIR),
+        ('23456', HandType.HIGH_CARD),
+    ]
+)
+def test_hand_of_cards_type(input_: str, expected_output: HandType):
+    assert HandOfCards(input_).type_ == expected_output
@@ -67,3 +67,13 @@ ZZZ = (ZZZ, ZZZ)""",
 )
 def test_get_steps_to_end(day: Day8, expected_output: int):
     assert day.get_steps_to_end(*day.parse_input()) == expected_output
+
+
+def test_unreachable_end():
+    day = Day8("""L
+
+AAA = (BBB, BBB)
+BBB = (AAA, ZZZ)
+ZZZ = (ZZZ, ZZZ)""")
+    with pytest.raises(ValueError):
+        day.solve(1)
@@ -2,6 +2,7 @@ from typing import Generator
 import pytest
 
 from adventofcode2023.days import Day9
+from adventofcode2023.days.day9 import extrapolation_coefficients
 from adventofcode2023.tests.utils import get_example_inputs
 
 
@@ -28,3 +29,19 @@ def test_get_extrapolated_value(input: list[int], expected_output: int):
 def test_example_input(example: tuple[str, str]):
     puzzle_input, expected_output = example
     assert str(Day9(puzzle_input).solve_part_one()) == expected_output
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='input',
+    argvalues=[
+        [0, 3, 6, 9, 12, 15],
+        [1, 3, 6, 10, 15, 21],
+        [10, 13, 16, 21, 30, 45],
+        [5],
+        [3, -1, 7, 2],
+    ]
+)
+def test_extrapolation_coefficients(input: list[int]):
+    coefficients = extrapolation_coefficients(len(input))
+    assert sum(c * v for c, v in zip(coefficients, input)) == Day9.get_last_value(input)
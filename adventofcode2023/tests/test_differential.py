@@ -0,0 +1,74 @@
+import pytest
+
+from adventofcode2023 import differential
+from adventofcode2023.day import engine
+from adventofcode2023.days import DAYS, Day9, get_day
+
+ENGINE_PARTS = [
+    (day, part) for day in DAYS for part in (1, 2)
+    if len(get_day(day).engines(part)) > 1
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day,part', argvalues=ENGINE_PARTS)
+def test_engines_agree(day: int, part: int):
+    comparisons = differential.differential(day, part, scales=(0.05, 0.2), seeds=range(2))
+    assert len(comparisons) == 4
+    for comparison in comparisons:
+        assert set(comparison.results) == set(get_day(day).engines(part, comparison.scale))
+        assert comparison.speedups().keys() == set(comparison.results) - {comparison.reference}
+
+
+@pytest.mark.unit
+def test_engines_agree_on_variant():
+    comparisons = differential.differential(5, 2, scales=(0.1, 0.5), seeds=range(2), variant='adversarial')
+    assert { c.variant for c in comparisons } == {'adversarial'}
+    assert all( 'reverse' in c.results for c in comparisons )
+
+
+class BrokenDay9(Day9):
+
+    @engine(1, 'off-by-one')
+    def _solve_off_by_one(self):
+        return self.solve_part_one() + 1
+
+
+@pytest.mark.unit
+def test_mismatch(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(differential, 'get_day', lambda day: BrokenDay9)
+    with pytest.raises(differential.EngineMismatch) as e:
+        differential.differential(9, 1, scales=(0.05,), seeds=range(2))
+
+    assert len(e.value.comparisons) == 2
+    assert list(e.value.comparisons[0].mismatches()) == ['off-by-one']
+    assert 'off-by-one=' in str(e.value)
+
+
+@pytest.mark.unit
+def test_reference_engine():
+    assert differential.reference_engine(get_day(20), 1) == 'reference'
+    assert differential.reference_engine(get_day(9), 1) == 'default'
+    assert differential.reference_engine(get_day(5), 1, scale=2) == 'reference'
+    # the brute force reference of day 5 part two only runs on small inputs
+    assert differential.reference_engine(get_day(5), 2, scale=0.05) == 'reference'
+    assert differential.reference_engine(get_day(5), 2, scale=0.2) == 'default'
+
+
+@pytest.mark.unit
+def test_engine_max_scale():
+    comparisons = differential.differential(5, 2, scales=(0.05, 0.2), seeds=range(1))
+    assert [ c.reference for c in comparisons ] == ['reference', 'default']
+    assert 'reference' not in comparisons[1].results
+
+    header, small, large = differential.format_comparisons(comparisons).splitlines()
+    assert small.split()[header.split().index('default')].endswith('x')
+    assert large.split()[header.split().index('default')] == '-'
+
+
+@pytest.mark.unit
+def test_format_comparisons():
+    table = differential.format_comparisons(differential.differential(9, 1, scales=(0.05, 0.1), seeds=range(1)))
+    header, *rows = table.splitlines()
+    assert header.split() == ['scale', 'bytes', 'reference', 'matrix']
+    assert len(rows) == 2 and rows[0].split()[-1].endswith('x')
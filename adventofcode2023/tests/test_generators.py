@@ -0,0 +1,75 @@
+import pytest
+
+from adventofcode2023 import runner
+from adventofcode2023.days import DAYS, get_day
+from adventofcode2023.generators import GENERATORS, VARIANTS, generate
+from adventofcode2023.main import main
+
+
+@pytest.mark.unit
+def test_every_day_has_a_generator():
+    assert sorted(GENERATORS) == list(DAYS)
+
+
+@pytest.mark.unit
+def test_generate_unknown_day():
+    with pytest.raises(ValueError):
+        generate(25)
+    with pytest.raises(ValueError):
+        generate(1, variant='adversarial')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day,variant', argvalues=list(VARIANTS))
+def test_variants(day: int, variant: str):
+    assert generate(day, 0.05, 1, variant) == generate(day, 0.05, 1, variant)
+    assert generate(day, 0.05, 1, variant) != generate(day, 0.05, 1)
+    assert get_day(day)(generate(day, 0.05, 1, variant)).solve(1) is not None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day', argvalues=DAYS)
+def test_generate_is_deterministic(day: int):
+    assert generate(day, 0.05, seed=1) == generate(day, 0.05, seed=1)
+    assert generate(day, 0.05, seed=1) != generate(day, 0.05, seed=2)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day', argvalues=[1, 7, 9, 15, 19])
+def test_generate_scales_linearly(day: int):
+    small, large = len(generate(day, 0.1)), len(generate(day, 0.4))
+    assert 3 < large / small < 5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day', argvalues=DAYS)
+def test_generated_input_parses(day: int):
+    get_day(day)(generate(day, 0.05)).parse()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='day,part',
+    argvalues=[
+        (1, 1), (1, 2), (2, 1), (2, 2), (3, 1), (4, 1), (4, 2), (5, 1), (5, 2), (7, 1), (7, 2), (8, 1), (8, 2),
+        (9, 1), (9, 2), (10, 1), (11, 1), (11, 2), (15, 1), (16, 1), (17, 1), (18, 1), (19, 1), (19, 2), (20, 1)
+    ]
+)
+def test_generated_input_solves(day: int, part: int):
+    assert get_day(day)(generate(day, 0.05)).solve(part) is not None
+
+
+@pytest.mark.unit
+def test_sweep():
+    points = runner.sweep(9, 1, [0.05, 0.1], repeat=2, trace_memory=True)
+    assert [ p.scale for p in points ] == [0.05, 0.1]
+    assert points[0].input_bytes < points[1].input_bytes
+    assert all( len(p.report.runs) == 2 and p.report.error is None for p in points )
+    assert all( p.peak_memory is not None and p.peak_memory > 0 for p in points )
+    assert 'memory' in runner.format_sweep(points)
+
+
+@pytest.mark.unit
+def test_main_generate(capsys: pytest.CaptureFixture[str]):
+    main(['generate', '9', '--scale', '0.05', '--seed', '3'])
+    assert capsys.readouterr().out == generate(9, 0.05, 3)
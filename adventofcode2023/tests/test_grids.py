@@ -0,0 +1,84 @@
+from pathlib import Path
+import numpy as np
+import pytest
+
+from adventofcode2023 import grids
+from adventofcode2023.puzzle_input import PuzzleInput
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='input', argvalues=['#..\n.#.\n..S', '#..\n.#.\n..S\n'])
+def test_parse(input: str):
+    grid = grids.parse(input)
+    assert grid.dtype == np.uint8
+    assert grid.shape == (3, 3)
+    assert grids.to_string(grid) == '#..\n.#.\n..S'
+    assert not grid.flags.writeable
+
+
+@pytest.mark.unit
+def test_parse_is_a_view_of_the_input(tmp_path: Path):
+    path = tmp_path.joinpath('grid.txt')
+    path.write_bytes(b'ab\ncd\nef\n')
+    puzzle_input = PuzzleInput.from_file(path)
+
+    grid = grids.parse(puzzle_input)
+    assert np.shares_memory(grid, np.frombuffer(puzzle_input.buffer, dtype=np.uint8))
+    assert grid.strides == (3, 1)
+    assert grids.to_string(grid.T) == 'ace\nbdf'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='input', argvalues=['ab\nc', 'ab\nc\nde', 'a\nbc'])
+def test_parse_ragged(input: str):
+    with pytest.raises(ValueError):
+        grids.parse(input)
+
+
+@pytest.mark.unit
+def test_parse_many():
+    first, second = grids.parse_many('#.\n.#\n\n...\n###\n...\n')
+    assert grids.to_string(first) == '#.\n.#'
+    assert grids.to_string(second) == '...\n###\n...'
+    assert grids.parse('').shape == (0, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='location,diagonal,expected_output',
+    argvalues=[
+        ((0, 0), False, [(0, 1), (1, 0)]),
+        ((1, 1), False, [(0, 1), (1, 2), (2, 1), (1, 0)]),
+        ((0, 2), True, [(1, 2), (0, 1), (1, 1)]),
+    ]
+)
+def test_neighbours(location: tuple[int, int], diagonal: bool, expected_output: list[tuple[int, int]]):
+    grid = grids.parse('...\n...\n...')
+    assert list(grids.neighbours(grid, *location, diagonal=diagonal)) == expected_output
+    assert grids.in_bounds(grid, *location)
+    assert not grids.in_bounds(grid, 3, 0)
+
+
+@pytest.mark.unit
+def test_mask_find_and_digits():
+    grid = grids.parse('12.\n.S9')
+    assert grids.mask(grid, grids.DIGITS).tolist() == [[True, True, False], [False, False, True]]
+    assert grids.find(grid, 'S') == (1, 1)
+    assert grids.find(grid, '#') is None
+    assert grids.digits(grid)[0, :2].tolist() == [1, 2]
+
+
+@pytest.mark.bench
+def test_parse_large_grid_does_not_copy():
+    import tracemalloc
+
+    puzzle_input = PuzzleInput.from_string('\n'.join( '.#|-' * 500 for _ in range(2000) ))
+    tracemalloc.start()
+    try:
+        grid = grids.parse(puzzle_input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert grid.shape == (2000, 2000)
+    assert peak < 2**20
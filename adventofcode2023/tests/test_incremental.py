@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from adventofcode2023.days import Day4, Day5, get_day
+from adventofcode2023.generators import generate
+from adventofcode2023.incremental import LineSum, RankedSum
+
+INCREMENTAL_PARTS = [(1, 1), (1, 2), (2, 1), (2, 2), (4, 1), (7, 1), (7, 2), (9, 1), (9, 2)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day,part', argvalues=INCREMENTAL_PARTS)
+@pytest.mark.parametrize(argnames='seed', argvalues=range(2))
+def test_matches_full_solve(day: int, part: int, seed: int):
+    lines = generate(day, 0.2, seed).splitlines()
+    day_cls = get_day(day)
+
+    # start from the first few lines and append the rest in chunks
+    solver = day_cls('\n'.join(lines[:3])).incremental(part)
+    rng = random.Random(seed)
+    fed = 3
+    while fed < len(lines):
+        chunk = rng.randint(1, 10)
+        result = solver.feed(lines[fed:fed + chunk])
+        fed += chunk
+        assert result == day_cls('\n'.join(lines[:fed])).solve(part)
+
+
+@pytest.mark.unit
+def test_line_sum():
+    solver = LineSum(len)
+    assert solver.result == 0
+    assert solver.feed(['ab', '', 'cde']) == 5
+    assert solver.feed([]) == 5
+
+
+@pytest.mark.unit
+def test_ranked_sum():
+    weights = { 5: 10, 1: 100, 9: 1, 3: 1000 }
+    solver = RankedSum(lambda line: (int(line), weights[int(line)]), size=10)
+
+    added: list[int] = []
+    for key in weights:
+        solver.add_line(str(key))
+        added.append(key)
+        assert solver.result == sum( rank * weights[k] for rank, k in enumerate(sorted(added), start=1) )
+
+
+@pytest.mark.unit
+def test_ranked_sum_equal_keys():
+    solver = RankedSum(lambda line: (int(line[0]), int(line[1:])), size=10)
+    # the equal keys 5 rank in the order they were added: 3 * 10 + 4 * 20
+    assert solver.feed(['510', '11', '520', '22']) == 1 + 2 * 2 + 3 * 10 + 4 * 20
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='part', argvalues=[1, 2])
+def test_matches_full_solve_with_equal_hands(part: int):
+    from adventofcode2023.days import Day7
+
+    lines = ['32T3K 765', 'T55J5 684', 'KK677 28', '32T3K 7', 'KTJJT 220', 'T55J5 3', 'QQQJA 483', 'KK677 50']
+    solver = Day7(lines[0]).incremental(part)
+    for fed in range(2, len(lines) + 1):
+        assert solver.feed(lines[fed - 1:fed]) == Day7('\n'.join(lines[:fed])).solve(part)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day,part', argvalues=[(Day4, 2), (Day5, 1)])
+def test_not_incremental(day, part: int):
+    with pytest.raises(ValueError):
+        day('').incremental(part)
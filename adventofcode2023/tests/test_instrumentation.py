@@ -0,0 +1,95 @@
+import json
+import pytest
+
+from adventofcode2023 import runner
+from adventofcode2023.days import Day9, Day12, Day16
+from adventofcode2023.instrumentation import (
+    NULL_INSTRUMENTATION, Budget, BudgetExceeded, Instrumentation, JsonLinesSink, MemorySink, NullSink
+)
+
+
+@pytest.fixture
+def sink() -> MemorySink:
+    return MemorySink()
+
+
+@pytest.mark.unit
+def test_phases_are_recorded(sink: MemorySink):
+    day = Day9('0 3 6 9 12 15')
+    day.instrument(Instrumentation(sink))
+    day.parse()
+    assert day.solve(1) == 18
+    assert day.solve(2) == -3
+
+    assert [ (r['day'], r['phase']) for r in sink.records ] == [ (9, 'parse'), (9, 'part1'), (9, 'part2') ]
+    assert all( r['seconds'] >= 0 and r['peak_memory'] is None for r in sink.records )
+
+
+@pytest.mark.unit
+def test_counters_and_memory(sink: MemorySink):
+    day = Day16('.\\.\n...')
+    day.instrument(Instrumentation(sink, trace_memory=True))
+    assert day.solve(1) == 3
+
+    # parse runs nested inside part one, counters go to the innermost phase
+    parse, part1 = sink.records
+    assert parse['phase'] == 'parse' and parse['counters'] == {}
+    assert part1['phase'] == 'part1' and part1['counters'] == {'states_expanded': 3}
+    assert part1['peak_memory'] >= parse['peak_memory'] > 0
+
+
+@pytest.mark.unit
+def test_null_instrumentation():
+    NULL_INSTRUMENTATION.count('anything')
+    with NULL_INSTRUMENTATION.phase(1, 'part1'):
+        pass
+    assert Day9('1 1').solve(1) == 1
+
+
+@pytest.mark.unit
+def test_invalid_part():
+    with pytest.raises(ValueError):
+        Day9('1 1').solve(3)
+
+
+@pytest.mark.unit
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / 'phases.jsonl'
+    runner.run_parts(Day9, [1, 2], '0 3 6 9 12 15', instrumentation=Instrumentation(JsonLinesSink(path)))
+    records = [ json.loads(line) for line in path.read_text().splitlines() ]
+    assert [ r['phase'] for r in records ] == ['parse', 'part1', 'part2']
+
+
+@pytest.mark.unit
+def test_time_budget(sink: MemorySink):
+    day = Day12('??????????????????????????? 1,1,1')
+    instrumentation = Instrumentation(sink)
+    day.instrument(instrumentation)
+    with pytest.raises(BudgetExceeded) as e:
+        with instrumentation.limit(Budget(seconds=0.05)):
+            day.solve(1)
+
+    # the cancelled phase is still recorded, with its partial counters
+    assert e.value.counters['candidate_rows'] > 0
+    part1, = sink.records
+    assert part1['counters'] == e.value.counters
+
+
+@pytest.mark.unit
+def test_memory_budget():
+    instrumentation = Instrumentation(NullSink())
+    with pytest.raises(BudgetExceeded, match='memory budget'):
+        with instrumentation.limit(Budget(max_rss=2**20)):
+            instrumentation.checkpoint()
+
+
+@pytest.mark.unit
+def test_budget_is_only_active_within_limit():
+    instrumentation = Instrumentation(NullSink())
+    with instrumentation.limit(Budget(seconds=60, max_rss=2**50)):
+        instrumentation.checkpoint()
+    with instrumentation.limit(Budget(seconds=0)):
+        pass
+
+    instrumentation.checkpoint()
+    NULL_INSTRUMENTATION.checkpoint()
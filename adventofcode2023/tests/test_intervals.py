@@ -0,0 +1,130 @@
+import random
+
+import pytest
+
+from adventofcode2023.intervals import Box, Interval, IntervalSet, Piece, PiecewiseShift
+
+WIDE = 10**12
+
+
+def numbers(interval_set: IntervalSet) -> set[int]:
+    return { n for start, end in interval_set for n in range(start, end) }
+
+
+@pytest.mark.unit
+def test_interval():
+    interval = Interval.from_length(5, 3)
+    assert interval == Interval(5, 8) and interval.size == 3
+    assert 7 in interval and 8 not in interval
+    assert interval.intersect(Interval(7, 20)) == Interval(7, 8)
+    assert interval.intersect(Interval(8, 20)) is None
+    assert interval.shift(-5) == Interval(0, 3)
+    assert interval.split(6) == (Interval(5, 6), Interval(6, 8))
+    assert interval.split(5) == (None, interval)
+    assert interval.split(8) == (interval, None)
+
+
+@pytest.mark.unit
+def test_interval_set_is_normalized():
+    interval_set = IntervalSet([(10, 12), (0, 3), (2, 5), (5, 6), (8, 8)])
+    assert list(interval_set) == [Interval(0, 6), Interval(10, 12)]
+    assert interval_set == IntervalSet([(10, 12), (0, 6)])
+    assert len(interval_set) == 2 and interval_set.size == 8
+    assert interval_set.min() == 0 and interval_set.max() == 11
+    assert [ n in interval_set for n in (-1, 0, 5, 6, 9, 10, 11, 12) ] == [False, True, True, False, False, True, True, False]
+    assert not IntervalSet() and IntervalSet([(3, 3)]) == IntervalSet()
+
+
+A = IntervalSet([(0, 5), (8, 12), (20, 30)])
+B = IntervalSet([(3, 9), (11, 21), (25, 26), (40, 41)])
+
+
+@pytest.mark.unit
+def test_set_operations():
+    assert numbers(A | B) == numbers(A) | numbers(B)
+    assert numbers(A & B) == numbers(A) & numbers(B)
+    assert numbers(A - B) == numbers(A) - numbers(B)
+    assert numbers(B - A) == numbers(B) - numbers(A)
+    assert A - IntervalSet() == A and IntervalSet() - A == IntervalSet()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='at', argvalues=[-1, 0, 3, 5, 6, 8, 11, 12, 29, 30, 31])
+def test_split(at: int):
+    below, above = A.split(at)
+    assert numbers(below) == { n for n in numbers(A) if n < at }
+    assert numbers(above) == { n for n in numbers(A) if n >= at }
+    assert below | above == A
+
+
+@pytest.mark.unit
+def test_shift():
+    assert A.shift(-8) == IntervalSet([(-8, -3), (0, 4), (12, 22)])
+
+
+@pytest.mark.unit
+def test_wide_intervals():
+    wide = IntervalSet( (i * WIDE, i * WIDE + WIDE // 2) for i in range(1, 100) )
+    assert wide.size == 99 * WIDE // 2
+    assert (wide - wide.shift(WIDE // 4)).size == 99 * WIDE // 4
+    assert wide.split(50 * WIDE + 1)[1].min() == 50 * WIDE + 1
+
+
+@pytest.mark.unit
+def test_box():
+    box = Box((Interval(0, 10), Interval(0, 4)))
+    assert box.size == 40 and (9, 3) in box and (10, 3) not in box
+    assert box.split(0, 6) == (Box((Interval(0, 6), Interval(0, 4))), Box((Interval(6, 10), Interval(0, 4))))
+    assert box.split(1, 0) == (None, box)
+    assert box.intersect(Box((Interval(5, 20), Interval(3, 9)))) == Box((Interval(5, 10), Interval(3, 4)))
+    assert box.intersect(Box((Interval(10, 20), Interval(0, 4)))) is None
+
+
+def random_shift(rng: random.Random) -> PiecewiseShift:
+    cuts = sorted(rng.sample(range(100), 6))
+    return PiecewiseShift(
+        (start, end, rng.randint(-20, 20)) for start, end in zip(cuts[::2], cuts[1::2])
+    )
+
+
+@pytest.mark.unit
+def test_piecewise_shift():
+    shift = PiecewiseShift([(10, 20, 5), (0, 5, -1), (5, 10, -1), (30, 40, 0)])
+    assert list(shift) == [Piece(0, 10, -1), Piece(10, 20, 5)]
+    assert [ shift.lookup(n) for n in (-1, 0, 9, 10, 19, 20, 35) ] == [-1, -1, 8, 15, 24, 20, 35]
+    assert shift.lookup_range(8, 22) == IntervalSet([(7, 9), (15, 25), (20, 22)])
+
+    with pytest.raises(ValueError):
+        PiecewiseShift([(0, 10, 1), (5, 15, 2)])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='seed', argvalues=range(20))
+def test_piecewise_shift_then(seed: int):
+    rng = random.Random(seed)
+    first, second = random_shift(rng), random_shift(rng)
+    composed = first.then(second)
+    assert all( composed.lookup(n) == second.lookup(first.lookup(n)) for n in range(-50, 150) )
+    assert composed == PiecewiseShift(composed)
+    assert numbers(composed.lookup_range(20, 80)) == { composed.lookup(n) for n in range(20, 80) }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='amount', argvalues=[0, 1, 50, 5000])
+@pytest.mark.parametrize(argnames='seed', argvalues=range(5))
+def test_piecewise_shift_lookup_many(amount: int, seed: int):
+    import numpy as np
+
+    rng = random.Random(seed)
+    shift = random_shift(rng).then(random_shift(rng))
+    values = np.array([ rng.randrange(-20, 120) for _ in range(amount) ], dtype=np.int64)
+    expected = [ shift.lookup(int(v)) for v in values ]
+    assert shift.lookup_many(values, chunk_size=7).tolist() == expected
+    assert PiecewiseShift().lookup_many(values).tolist() == values.tolist()
+
+
+@pytest.mark.unit
+def test_interval_set_next():
+    interval_set = IntervalSet([(0, 3), (10, 12)])
+    assert [ interval_set.next(n) for n in (-5, 0, 2, 3, 11, 12) ] == [0, 0, 2, 10, 11, None]
+    assert IntervalSet().next(0) is None
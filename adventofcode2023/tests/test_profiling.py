@@ -0,0 +1,72 @@
+import pstats
+from collections import Counter
+
+import pytest
+
+from adventofcode2023.days import get_day
+from adventofcode2023.generators import generate
+from adventofcode2023.profiling import (
+    PROFILERS, estimate_stacks, format_profile, profile_part, sampled_stats
+)
+
+F = ('f.py', 1, 'f')
+G = ('g.py', 1, 'g')
+H = ('h.py', 1, 'h')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='profiler', argvalues=PROFILERS)
+def test_profile_part(profiler: str, tmp_path):
+    puzzle_input = generate(7, 1, 0)
+    profile = profile_part(7, 1, profiler, tmp_path, puzzle_input, interval=0.0001)
+
+    assert profile.result == get_day(7)(puzzle_input).solve(1)
+    assert [ phase.name for phase in profile.phases ] == ['parse', 'part1']
+    assert profile.pstats_path == tmp_path / 'day7-part1.pstats'
+    assert profile.collapsed_path == tmp_path / 'day7-part1.collapsed'
+
+    stats = pstats.Stats(str(profile.pstats_path))
+    assert any( name.endswith('solve_part_one') for _, _, name in stats.stats )  # type: ignore[attr-defined]
+
+    for line in profile.collapsed_path.read_text().splitlines():
+        stack, micros = line.rsplit(' ', 1)
+        assert stack.split(';')[0] in ('parse', 'part1')
+        assert int(micros) > 0
+
+    assert 'part1' in format_profile(profile)
+
+
+@pytest.mark.unit
+def test_unknown_profiler():
+    with pytest.raises(ValueError):
+        profile_part(7, 1, 'perf')
+
+
+@pytest.mark.unit
+def test_sampled_stats():
+    stacks = Counter({ (F, G): 300, (F, G, H): 200, (F,): 100, (F, G, F): 50 })
+    samples = Counter({ (F, G): 3, (F, G, H): 2, (F,): 1, (F, G, F): 1 })
+    stats = sampled_stats(stacks, samples)
+
+    # calls, calls, own seconds, cumulative seconds, callers
+    assert stats[F][:4] == (7, 7, 150e-6, 650e-6)
+    assert stats[G][:4] == (6, 6, 300e-6, 550e-6)
+    assert stats[H][:4] == (2, 2, 200e-6, 200e-6)
+    assert stats[G][4] == { F: (6, 6, 300e-6, 550e-6) }
+    assert stats[F][4] == { G: (1, 1, 50e-6, 50e-6) }
+
+
+@pytest.mark.unit
+def test_estimate_stacks():
+    # f calls g and h, g calls h; h spends 3 seconds under f and 1 under g
+    stats = {
+        F: (1, 1, 1.0, 7.0, {}),
+        G: (1, 1, 2.0, 3.0, { F: (1, 1, 2.0, 3.0) }),
+        H: (2, 2, 4.0, 4.0, { F: (1, 1, 3.0, 3.0), G: (1, 1, 1.0, 1.0) }),
+    }
+    assert estimate_stacks(stats) == {
+        (F,): 1_000_000,
+        (F, G): 2_000_000,
+        (F, G, H): 1_000_000,
+        (F, H): 3_000_000,
+    }
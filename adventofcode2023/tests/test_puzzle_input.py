@@ -0,0 +1,50 @@
+import pytest
+
+from adventofcode2023.days import Day9
+from adventofcode2023.puzzle_input import PuzzleInput
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_bytes(b'0 3 6 9 12 15\n1 3 6 10 15 21\n10 13 16 21 30 45')
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='input_',
+    argvalues=['', 'a', 'a\nbc', 'a\n\nbc\n', '\n']
+)
+def test_lines_match_split(input_: str):
+    puzzle_input = PuzzleInput.from_string(input_)
+    expected_output = input_.split('\n')
+
+    assert list(puzzle_input.lines()) == expected_output
+    assert puzzle_input.line_count() == len(expected_output)
+    assert [ puzzle_input.line(i) for i in range(puzzle_input.line_count()) ] == expected_output
+    assert puzzle_input.line(-1) == expected_output[-1]
+    assert puzzle_input.text() == input_
+
+
+@pytest.mark.unit
+def test_line_out_of_range():
+    with pytest.raises(IndexError):
+        PuzzleInput.from_string('a\nb').line(2)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='use_mmap', argvalues=[True, False])
+def test_from_file(input_file, use_mmap: bool):
+    puzzle_input = PuzzleInput.from_file(input_file, use_mmap)
+    assert bytes(puzzle_input.view()) == input_file.read_bytes()
+    assert puzzle_input.line(1) == '1 3 6 10 15 21'
+    assert Day9(puzzle_input).solve_part_one() == 114
+    puzzle_input.close()
+
+
+@pytest.mark.unit
+def test_from_empty_file(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    assert list(PuzzleInput.from_file(path).lines()) == ['']
@@ -0,0 +1,113 @@
+import json
+import pytest
+
+from adventofcode2023 import runner
+from adventofcode2023.days import DAYS, Day9, get_day
+
+
+@pytest.mark.unit
+def test_registry_contains_every_day():
+    assert sorted(DAYS) == list(range(1, 21))
+    assert all( get_day(day)('').day == day for day in DAYS )
+
+
+@pytest.mark.unit
+def test_get_day_unknown():
+    with pytest.raises(ValueError):
+        get_day(25)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='values,pct,expected_output',
+    argvalues=[
+        ([1.0], 95, 1.0),
+        ([3.0, 1.0, 2.0], 50, 2.0),
+        ([float(n) for n in range(1, 101)], 95, 95.0),
+    ]
+)
+def test_percentile(values: list[float], pct: float, expected_output: float):
+    assert runner.percentile(values, pct) == expected_output
+
+
+@pytest.mark.unit
+def test_make_jobs():
+    assert runner.make_jobs([9, 1], [2]) == [runner.Job(9, 2), runner.Job(1, 2)]
+    assert len(runner.make_jobs()) == len(DAYS) * 2
+
+
+@pytest.mark.unit
+def test_run_part():
+    result, run = runner.run_part(Day9, 1, '0 3 6 9 12 15')
+    assert result == 18
+    assert run.parse >= 0 and run.solve >= 0
+
+
+@pytest.mark.unit
+def test_bench_records_errors():
+    report = runner.bench_job(runner.Job(25, 1))
+    assert report.error is not None
+    assert report.runs == []
+    assert json.loads(runner.to_json([report]))[0]['error'] == report.error
+
+
+@pytest.mark.unit
+def test_load_timings(tmp_path):
+    reports = [
+        runner.PartReport(1, 1, 5, [runner.Run(0.0, 0.1, 0.2)]),
+        runner.PartReport(1, 2, error='ValueError: broken'),
+    ]
+    path = tmp_path / 'bench.json'
+    path.write_text(runner.to_json(reports))
+    assert runner.load_timings(path) == {(1, 1): pytest.approx(0.3)}
+
+
+@pytest.mark.unit
+def test_parallel_bench_keeps_job_order():
+    jobs = [ runner.Job(9, 1), runner.Job(1, 1), runner.Job(9, 2) ]
+    reports = runner.parallel_bench(jobs, workers=2, timings={(1, 1): 1.0})
+    assert [ (r.day, r.part) for r in reports ] == [ (j.day, j.part) for j in jobs ]
+    assert [ r.result for r in reports ] == [ r.result for r in runner.bench(jobs) ]
+
+
+@pytest.mark.unit
+def test_run_imports_only_the_selected_day():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from adventofcode2023.main import main\n"
+        "main(['run', '1', '--parts', '1'])\n"
+        "assert 'numpy' not in sys.modules\n"
+        "assert [ m for m in sys.modules if m.startswith('adventofcode2023.days.') ] == ['adventofcode2023.days.day1']\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
+
+
+@pytest.mark.unit
+def test_run_days_loads_once_per_day():
+    reports = runner.run_days([ runner.Job(9, 1), runner.Job(9, 2) ])
+    assert [ r.result for r in reports ] == [ r.result for r in runner.bench(runner.make_jobs([9])) ]
+    first, second = ( r.runs[0] for r in reports )
+    assert first.load > 0 and second.load == 0
+
+
+@pytest.mark.unit
+def test_run_days_with_budget():
+    # part two of day 20 does not finish on the real input
+    part1, part2, day9 = runner.run_days(
+        [runner.Job(20, 2), runner.Job(20, 1), runner.Job(9, 1)],
+        budget=runner.Budget(seconds=1.5)
+    )
+    assert part1.error is not None and part1.error.startswith('BudgetExceeded')
+    assert part1.counters['button_presses'] > 0
+    assert part2.result == 839775244 and part2.error is None
+    assert day9.result == 2008960228
+
+
+@pytest.mark.unit
+def test_bench_job_with_budget():
+    report = runner.bench_job(runner.Job(20, 2), repeat=2, budget=runner.Budget(seconds=0.2))
+    assert report.error is not None and report.error.startswith('BudgetExceeded')
+    assert report.summary()['counters'] == report.counters != {}
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from adventofcode2023 import search
+from adventofcode2023.instrumentation import Budget, BudgetExceeded, Instrumentation, MemorySink
+
+# a path 0 - 1 - 2 - 3 with a shortcut 0 - 3 costing 5, and an unconnected state 4
+EDGES = {
+    0: [(1, 1), (3, 5)],
+    1: [(0, 1), (2, 1)],
+    2: [(1, 1), (3, 1)],
+    3: [(2, 1), (0, 5)],
+    4: [],
+}
+
+
+def line(n: int):
+    return lambda state: [ s for s in (state - 1, state + 1) if 0 <= s < n ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    argnames='shape,coords,state',
+    argvalues=[
+        ((5,), (3,), 3),
+        ((3, 4), (2, 1), 9),
+        ((3, 4, 4, 4), (1, 2, 3, 1), 109),
+    ]
+)
+def test_pack_unpack(shape: tuple[int, ...], coords: tuple[int, ...], state: int):
+    assert search.pack(shape, *coords) == state == np.ravel_multi_index(coords, shape)
+    assert search.unpack(shape, state) == coords
+
+
+@pytest.mark.unit
+def test_bfs():
+    dist = search.bfs([2], 5, lambda state: [ s for s, _ in EDGES[state] ])
+    assert dist.dtype == np.int64
+    assert dist.tolist() == [2, 1, 0, 1, search.UNREACHED]
+
+
+@pytest.mark.unit
+def test_bfs_from_multiple_states():
+    assert search.bfs([0, 6], 7, line(7)).tolist() == [0, 1, 2, 3, 2, 1, 0]
+
+
+@pytest.mark.unit
+def test_zero_one_bfs():
+    # moving right is free, moving left costs one
+    neighbours = lambda state: [ (s, int(s < state)) for s in line(5)(state) ]
+    assert search.zero_one_bfs([2], 5, neighbours).tolist() == [2, 1, 0, 0, 0]
+
+
+@pytest.mark.unit
+def test_dijkstra():
+    dist = search.dijkstra([0], 5, EDGES.__getitem__)
+    assert dist.tolist() == [0, 1, 2, 3, search.UNREACHED]
+
+
+@pytest.mark.unit
+def test_dijkstra_stops_at_goal():
+    neighbours = lambda state: [ (s, 1) for s in line(100)(state) ]
+    dist = search.dijkstra([0], 100, neighbours, lambda state: state == 3)
+    assert dist[3] == 3
+    assert dist[50] == search.UNREACHED
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='goal,expected', argvalues=[(3, 3), (2, 2), (4, None)])
+def test_astar(goal: int, expected: int | None):
+    assert search.astar([0], 5, EDGES.__getitem__, lambda s: 0, lambda s: s == goal) == expected
+
+
+@pytest.mark.unit
+def test_counts_expanded_states():
+    sink = MemorySink()
+    instrumentation = Instrumentation(sink)
+    with instrumentation.phase(0, 'search'):
+        search.bfs([0], 3000, line(3000), instrumentation)
+    assert sink.records[0]['counters'] == {'states_expanded': 3000}
+
+
+@pytest.mark.unit
+def test_budget_cancels_search():
+    instrumentation = Instrumentation(MemorySink())
+    with pytest.raises(BudgetExceeded):
+        with instrumentation.limit(Budget(seconds=0)):
+            search.bfs([0], 10_000, line(10_000), instrumentation)
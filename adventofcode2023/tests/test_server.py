@@ -0,0 +1,97 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Generator
+import pytest
+
+from adventofcode2023.server import WorkerPool, solve_remote
+
+
+@pytest.fixture(scope='module')
+def socket_path(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    path = tmp_path_factory.mktemp('server').joinpath('aoc.sock')
+    server = subprocess.Popen([sys.executable, '-m', 'adventofcode2023', 'serve', '--socket', str(path), '-j', '1'])
+    try:
+        deadline = time.monotonic() + 30
+        while not path.exists():
+            assert server.poll() is None and time.monotonic() < deadline, 'server did not start'
+            time.sleep(0.05)
+
+        yield path
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    assert not path.exists()
+
+
+@pytest.mark.unit
+def test_solve_remote(socket_path: Path):
+    responses = solve_remote([(9, 1, '0 3 6 9 12 15'), (9, 2, '10 13 16 21 30 45'), (1, 1, None)], socket_path)
+    assert [ r['result'] for r in responses ] == [18, 5, 54601]
+    assert all( r['error'] is None for r in responses )
+    assert set(responses[0]['timing']) == {'queue', 'load', 'parse', 'solve', 'total'}
+
+
+@pytest.mark.unit
+def test_solve_remote_errors(socket_path: Path):
+    unknown_day, broken_input = solve_remote([(25, 1, ''), (9, 1, 'not a sequence')], socket_path)
+    assert unknown_day['error'].startswith('ValueError')
+    assert broken_input['error'].startswith('ValueError')
+
+
+@pytest.mark.unit
+def test_solve_remote_timeout(socket_path: Path):
+    # part two of day 20 does not finish on the real input
+    timed_out, = solve_remote([(20, 2, None)], socket_path, timeout=0.5)
+    assert timed_out['error'].startswith('TimeoutError')
+
+    # the killed worker is replaced
+    solved, = solve_remote([(9, 1, '0 3 6 9 12 15')], socket_path)
+    assert solved['result'] == 18
+    assert solved['worker'] != timed_out['worker']
+
+
+@pytest.mark.unit
+def test_invalid_requests(socket_path: Path):
+    import json
+    import socket
+
+    requests = [
+        { 'id': 0, 'day': 9, 'part': 1, 'input': '0 3 6 9 12 15', 'timeout': '5' },
+        { 'id': 1, 'day': '9', 'part': 1 },
+        { 'id': 2, 'day': 9, 'part': True },
+        { 'id': 3, 'day': 9, 'part': 1, 'input': [0, 3, 6] },
+        [9, 1],
+    ]
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        with conn.makefile('rwb') as f:
+            for request in requests:
+                f.write((json.dumps(request) + '\n').encode())
+            f.flush()
+            responses = [ json.loads(f.readline()) for _ in requests ]
+
+    assert all( r['error'].startswith(('TypeError', 'AttributeError')) for r in responses )
+
+    # the only worker is still there to solve the next request
+    solved, = solve_remote([(9, 1, '0 3 6 9 12 15')], socket_path, timeout=5)
+    assert solved['result'] == 18
+
+
+@pytest.mark.unit
+def test_pool_keeps_workers_on_errors():
+    import asyncio
+
+    async def solve() -> dict:
+        pool = WorkerPool(1)
+        await pool.start()
+        try:
+            with pytest.raises(TypeError):
+                await pool.solve(9, 1, '0 3 6 9 12 15', '5')  # type: ignore[arg-type]
+            return await asyncio.wait_for(pool.solve(9, 1, '0 3 6 9 12 15', None), 10)
+        finally:
+            await asyncio.wait_for(pool.close(), 10)
+
+    assert asyncio.run(solve())['result'] == 18
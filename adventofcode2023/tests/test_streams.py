@@ -0,0 +1,91 @@
+import io
+
+import pytest
+
+from adventofcode2023.days import Day4, Day15, get_day
+from adventofcode2023.generators import generate
+from adventofcode2023.main import main
+from adventofcode2023.streams import records
+
+STREAM_PARTS = [
+    (1, 1), (1, 2), (2, 1), (2, 2), (4, 1), (6, 1), (6, 2), (7, 1), (7, 2), (9, 1), (9, 2), (15, 1)
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='chunk_size', argvalues=[1, 2, 3, 64])
+def test_records_from_file(chunk_size: int):
+    source = io.BytesIO(b'ab\r\ncd\n\nefg')
+    assert list(records(source, chunk_size=chunk_size)) == ['ab', 'cd', '', 'efg']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='chunk_size', argvalues=[1, 4, 64])
+def test_records_with_separator(chunk_size: int):
+    source = io.BytesIO(b'rn=1,c\nm-,qp=3\n')
+    assert list(records(source, b',', chunk_size)) == ['rn=1', 'cm-', 'qp=3']
+    assert list(records(['rn=1,cm-', 'qp=3\n'], b',')) == ['rn=1', 'cm-', 'qp=3']
+
+
+@pytest.mark.unit
+def test_records_from_lines():
+    assert list(records(io.StringIO('ab\ncd\r\n'))) == ['ab', 'cd']
+    assert list(records(io.BytesIO(b''))) == ['']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day,part', argvalues=STREAM_PARTS)
+@pytest.mark.parametrize(argnames='seed', argvalues=range(2))
+def test_matches_full_solve(day: int, part: int, seed: int):
+    puzzle_input = generate(day, 0.2, seed)
+    day_cls = get_day(day)
+
+    # a tiny chunk size splits records across chunks
+    [result] = day_cls.solve_stream(io.BytesIO(puzzle_input.encode()), [part], chunk_size=7)
+    assert result == day_cls(puzzle_input).solve(part)
+    [result] = day_cls.solve_stream(io.StringIO(puzzle_input), [part])
+    assert result == day_cls(puzzle_input).solve(part)
+
+
+@pytest.mark.unit
+def test_solves_parts_in_one_pass():
+    puzzle_input = generate(1, 0.2, 0)
+    source = io.BytesIO(puzzle_input.encode())
+    assert get_day(1).solve_stream(source) == [ get_day(1)(puzzle_input).solve(part) for part in (1, 2) ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day_cls,part', argvalues=[(Day4, 2), (Day15, 2), (Day4, 3)])
+def test_unsupported_part(day_cls, part: int):
+    with pytest.raises(ValueError):
+        day_cls.solve_stream(io.BytesIO(b''), [part])
+
+
+@pytest.mark.unit
+def test_run_from_stdin(monkeypatch, capsys):
+    puzzle_input = generate(9, 0.2, 0)
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(puzzle_input.encode())))
+
+    main(['run', '9', '-', '-p', '1'])
+    assert capsys.readouterr().out == f"day 9 part 1: {get_day(9)(puzzle_input).solve(1)}\n"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(argnames='day', argvalues=sorted({ day for day, _ in STREAM_PARTS }))
+def test_run_from_stdin_default_parts(day: int, monkeypatch, capsys):
+    puzzle_input = generate(day, 0.2, 0)
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(puzzle_input.encode())))
+
+    main(['run', str(day), '-'])
+    expected = [ part for d, part in STREAM_PARTS if d == day ]
+    assert get_day(day).stream_parts() == expected
+    assert capsys.readouterr().out == ''.join(
+        f"day {day} part {part}: {get_day(day)(puzzle_input).solve(part)}\n" for part in expected
+    )
+
+
+@pytest.mark.unit
+def test_run_from_stdin_unsupported_part(monkeypatch):
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(b'')))
+    with pytest.raises(SystemExit, match='Part 2 of day 4'):
+        main(['run', '4', '-', '-p', '2'])